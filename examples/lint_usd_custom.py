@@ -5,24 +5,122 @@ This script shows how to use the USD Linter module to validate USD files
 for common issues and enforce studio-specific conventions.
 """
 
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from vfxvox_pipeline_utils.usd.linter import USDLinter
-from vfxvox_pipeline_utils.usd.reporters import render_console, render_json
+from typing import Any, Dict, List, Optional, Tuple
+from vfxvox_pipeline_utils.usd.linter import USDLinter, iter_usd_files
 from vfxvox_pipeline_utils.core.config import Config
+import argparse
+import json
+import os
 import sys
+import traceback
+
+
+# Paths are resolved against this directory rather than the working
+# directory, so the examples run from anywhere without os.chdir
+EXAMPLES_DIR = Path(__file__).resolve().parent
+PROJECT_DIR = EXAMPLES_DIR / "vfx_project"
+
+# Below this many files, spawning worker processes costs more than it saves
+PARALLEL_MIN_FILES = 8
+
+# Upper bound on files sent to a worker per task; batching amortizes the
+# per-task pickling and dispatch cost
+LINT_CHUNK_SIZE = 32
+
+
+@lru_cache(maxsize=None)
+def _get_linter(config_key: Optional[str] = None) -> USDLinter:
+    """Build (once) the linter for a canonical configuration key.
+    
+    Args:
+        config_key: Configuration serialized with sorted keys, or None for
+            the default configuration
+        
+    Returns:
+        Shared USDLinter instance
+    """
+    if config_key is None:
+        return USDLinter()
+    return USDLinter(config=Config.from_dict(json.loads(config_key)))
+
+
+def get_linter(config_dict: Optional[Dict[str, Any]] = None) -> USDLinter:
+    """Return a shared linter for the given configuration.
+    
+    Linters cache their rules, including compiled custom rule patterns, so
+    sharing one per configuration avoids rebuilding them for every file.
+    In worker processes the cache gives each process its own linter.
+    
+    Args:
+        config_dict: Optional configuration dictionary
+        
+    Returns:
+        Shared USDLinter instance
+    """
+    if config_dict is None:
+        return _get_linter()
+    return _get_linter(json.dumps(config_dict, sort_keys=True))
+
+
+def _lint_one(usd_file: Path) -> Tuple[Path, Optional[dict], Optional[str]]:
+    """Lint a single USD file, reusing one linter per process.
+    
+    Args:
+        usd_file: Path to the USD file
+        
+    Returns:
+        Tuple of (path, result dictionary, error message). The result is
+        returned as a plain dictionary so it can cross process boundaries.
+    """
+    try:
+        return usd_file, get_linter().validate(usd_file).to_dict(), None
+    except Exception as e:
+        return usd_file, None, str(e)
+
+
+def _lint_chunk(usd_files: List[Path]) -> List[Tuple[Path, Optional[dict], Optional[str]]]:
+    """Lint a batch of USD files in one worker task.
+    
+    Args:
+        usd_files: Paths to the USD files
+        
+    Returns:
+        List of (path, result dictionary, error message) tuples
+    """
+    return [_lint_one(usd_file) for usd_file in usd_files]
+
+
+def _resolve_concurrency(concurrency: str) -> int:
+    """Convert a --concurrency value into a worker count.
+    
+    Args:
+        concurrency: 'auto' or a positive integer string
+        
+    Returns:
+        Number of worker processes to use
+    """
+    if concurrency == "auto":
+        return os.cpu_count() or 1
+    return max(1, int(concurrency))
 
 
 def basic_usd_linting():
     """Example 1: Basic USD linting with built-in rules."""
+    from vfxvox_pipeline_utils.usd.reporters import render_console
+    
     print("=" * 60)
     print("Example 1: Basic USD Linting")
     print("=" * 60 + "\n")
     
     # Create linter
-    linter = USDLinter()
+    linter = get_linter()
     
     # Lint a USD file
-    usd_file = "vfx_project/assets/characters/hero/model/hero.usd"
+    usd_file = str(PROJECT_DIR / "assets/characters/hero/model/hero.usd")
     
     print(f"Linting USD file: {usd_file}\n")
     
@@ -46,6 +144,8 @@ def basic_usd_linting():
 
 def lint_with_custom_rules():
     """Example 2: Linting with custom rules from configuration."""
+    from vfxvox_pipeline_utils.usd.reporters import render_console
+    
     print("\n" + "=" * 60)
     print("Example 2: Custom Rules Configuration")
     print("=" * 60 + "\n")
@@ -79,12 +179,12 @@ custom_rules:
 """
     
     # Save custom rules
-    rules_file = Path("custom_usd_rules.yaml")
+    rules_file = EXAMPLES_DIR / "custom_usd_rules.yaml"
     rules_file.write_text(custom_rules_yaml)
     print(f"Created custom rules file: {rules_file}\n")
     
-    # Create config with custom rules
-    config = Config.from_dict({
+    # Create linter with custom rules config
+    linter = get_linter({
         "usd": {
             "custom_rules_path": str(rules_file),
             "check_references": True,
@@ -94,10 +194,7 @@ custom_rules:
         }
     })
     
-    # Create linter with config
-    linter = USDLinter(config=config)
-    
-    usd_file = "vfx_project/assets/characters/hero/model/hero.usd"
+    usd_file = str(PROJECT_DIR / "assets/characters/hero/model/hero.usd")
     
     print(f"Linting with custom rules: {usd_file}\n")
     
@@ -114,8 +211,8 @@ def inspect_usd_issues():
     print("Example 3: Programmatic Issue Inspection")
     print("=" * 60 + "\n")
     
-    linter = USDLinter()
-    usd_file = "vfx_project/assets/characters/hero/model/hero.usd"
+    linter = get_linter()
+    usd_file = str(PROJECT_DIR / "assets/characters/hero/model/hero.usd")
     
     try:
         result = linter.validate(Path(usd_file))
@@ -123,27 +220,27 @@ def inspect_usd_issues():
         print(f"USD File: {usd_file}")
         print(f"Total issues: {len(result.issues)}\n")
         
-        # Group issues by severity
-        errors = [i for i in result.issues if i.severity == "error"]
-        warnings = [i for i in result.issues if i.severity == "warning"]
-        info = [i for i in result.issues if i.severity == "info"]
-        
-        print(f"Errors: {len(errors)}")
-        print(f"Warnings: {len(warnings)}")
-        print(f"Info: {len(info)}\n")
-        
-        # Group issues by type
-        from collections import defaultdict
-        issues_by_type = defaultdict(list)
+        # Count issues by severity and by type in one pass; only the errors
+        # themselves are kept, since just their details are printed
+        severity_counts = Counter()
+        issues_by_type = Counter()
+        errors = []
         
         for issue in result.issues:
-            # Extract issue type from message or details
+            severity_counts[issue.severity] += 1
+            if issue.severity == "error":
+                errors.append(issue)
+            # Extract issue type from details
             issue_type = issue.details.get("rule", "unknown") if issue.details else "unknown"
-            issues_by_type[issue_type].append(issue)
+            issues_by_type[issue_type] += 1
+        
+        print(f"Errors: {severity_counts['error']}")
+        print(f"Warnings: {severity_counts['warning']}")
+        print(f"Info: {severity_counts['info']}\n")
         
         print("Issues by type:")
-        for issue_type, issues in sorted(issues_by_type.items()):
-            print(f"  {issue_type}: {len(issues)}")
+        for issue_type, count in sorted(issues_by_type.items()):
+            print(f"  {issue_type}: {count}")
         
         # Show critical errors
         if errors:
@@ -157,20 +254,50 @@ def inspect_usd_issues():
         print(f"❌ Error: {e}")
 
 
-def batch_lint_assets():
-    """Example 4: Batch linting multiple USD files."""
+def _collect_lint_outcomes(outcomes, results: list) -> None:
+    """Print per-file lint summaries and collect them into results.
+    
+    Args:
+        outcomes: Iterable of (path, result dictionary, error message) tuples
+        results: List to append (path, result dictionary or None) tuples to
+    """
+    for usd_file, result, error in outcomes:
+        print(f"Linting: {usd_file.relative_to(EXAMPLES_DIR)}")
+        print("-" * 60)
+        
+        if error is not None:
+            print(f"❌ Error: {error}\n")
+            results.append((usd_file, None))
+            continue
+        
+        results.append((usd_file, result))
+        
+        # Quick summary
+        summary = result["summary"]
+        status = "✅" if result["passed"] else "❌"
+        print(f"{status} Issues: {summary['total_issues']} "
+              f"(E:{summary['errors']}, W:{summary['warnings']})\n")
+
+
+def batch_lint_assets(concurrency: str = "auto"):
+    """Example 4: Batch linting multiple USD files.
+    
+    Files are linted in parallel worker processes when there are enough of
+    them to pay for the process start-up cost.
+    
+    Args:
+        concurrency: Number of worker processes, or 'auto' for one per CPU
+    """
     print("\n" + "=" * 60)
     print("Example 4: Batch Linting")
     print("=" * 60 + "\n")
     
     # Find all USD files in assets directory
-    assets_dir = Path("vfx_project/assets")
+    assets_dir = PROJECT_DIR / "assets"
     usd_files = []
     
     if assets_dir.exists():
-        usd_files = list(assets_dir.rglob("*.usd"))
-        usd_files.extend(assets_dir.rglob("*.usda"))
-        usd_files.extend(assets_dir.rglob("*.usdc"))
+        usd_files = list(iter_usd_files(assets_dir, (".usd", ".usda", ".usdc")))
     
     if not usd_files:
         print("No USD files found in assets directory")
@@ -178,25 +305,23 @@ def batch_lint_assets():
     
     print(f"Found {len(usd_files)} USD files\n")
     
-    linter = USDLinter()
+    workers = min(_resolve_concurrency(concurrency), len(usd_files))
     results = []
     
-    for usd_file in usd_files:
-        print(f"Linting: {usd_file.relative_to(Path.cwd())}")
-        print("-" * 60)
-        
-        try:
-            result = linter.validate(usd_file)
-            results.append((usd_file, result))
-            
-            # Quick summary
-            status = "✅" if result.passed else "❌"
-            print(f"{status} Issues: {len(result.issues)} "
-                  f"(E:{result.error_count()}, W:{result.warning_count()})\n")
-            
-        except Exception as e:
-            print(f"❌ Error: {e}\n")
-            results.append((usd_file, None))
+    if workers <= 1 or len(usd_files) < PARALLEL_MIN_FILES:
+        outcomes = map(_lint_one, usd_files)
+        _collect_lint_outcomes(outcomes, results)
+    else:
+        print(f"Linting with {workers} worker processes\n")
+        # Keep chunks small enough that every worker gets some
+        chunk_size = max(1, min(LINT_CHUNK_SIZE, -(-len(usd_files) // workers)))
+        chunks = [
+            usd_files[i:i + chunk_size]
+            for i in range(0, len(usd_files), chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_outcomes in executor.map(_lint_chunk, chunks):
+                _collect_lint_outcomes(chunk_outcomes, results)
     
     # Overall summary
     print("=" * 60)
@@ -204,13 +329,13 @@ def batch_lint_assets():
     print("=" * 60)
     
     total_files = len(results)
-    passed = sum(1 for _, r in results if r and r.passed)
-    failed = sum(1 for _, r in results if r and not r.passed)
+    passed = sum(1 for _, r in results if r and r["passed"])
+    failed = sum(1 for _, r in results if r and not r["passed"])
     errors = sum(1 for _, r in results if r is None)
     
-    total_issues = sum(len(r.issues) for _, r in results if r)
-    total_errors = sum(r.error_count() for _, r in results if r)
-    total_warnings = sum(r.warning_count() for _, r in results if r)
+    total_issues = sum(r["summary"]["total_issues"] for _, r in results if r)
+    total_errors = sum(r["summary"]["errors"] for _, r in results if r)
+    total_warnings = sum(r["summary"]["warnings"] for _, r in results if r)
     
     print(f"\nFiles processed: {total_files}")
     print(f"Passed: {passed}")
@@ -221,6 +346,11 @@ def batch_lint_assets():
     print(f"  Warnings: {total_warnings}")
 
 
+def _is_performance_rule(rule_name: str) -> bool:
+    """Select performance rules for USDLinter.validate(rule_filter=...)."""
+    return "performance" in rule_name.lower()
+
+
 def performance_analysis():
     """Example 5: USD performance analysis."""
     print("\n" + "=" * 60)
@@ -228,7 +358,7 @@ def performance_analysis():
     print("=" * 60 + "\n")
     
     # Create config focused on performance checks
-    config = Config.from_dict({
+    linter = get_linter({
         "usd": {
             "check_performance": True,
             "max_layer_depth": 5,  # Stricter limit
@@ -236,20 +366,14 @@ def performance_analysis():
             "check_schemas": False
         }
     })
-    
-    linter = USDLinter(config=config)
-    usd_file = "vfx_project/assets/characters/hero/model/hero.usd"
+    usd_file = str(PROJECT_DIR / "assets/characters/hero/model/hero.usd")
     
     print(f"Analyzing performance: {usd_file}\n")
     
     try:
-        result = linter.validate(Path(usd_file))
-        
-        # Filter performance-related issues
-        perf_issues = [
-            i for i in result.issues 
-            if i.details and "performance" in i.details.get("rule", "").lower()
-        ]
+        # Only run performance rules, so no other issues are built
+        result = linter.validate(Path(usd_file), rule_filter=_is_performance_rule)
+        perf_issues = result.issues
         
         if perf_issues:
             print(f"Found {len(perf_issues)} performance issues:\n")
@@ -275,31 +399,38 @@ def export_lint_reports():
     print("Example 6: Exporting Reports")
     print("=" * 60 + "\n")
     
-    linter = USDLinter()
-    usd_file = "vfx_project/assets/characters/hero/model/hero.usd"
+    linter = get_linter()
+    usd_file = str(PROJECT_DIR / "assets/characters/hero/model/hero.usd")
     
     try:
         result = linter.validate(Path(usd_file))
         
-        # Export to JSON
-        json_report = render_json(result)
-        json_file = Path("usd_lint_report.json")
-        json_file.write_text(json_report)
-        print(f"📄 JSON report saved to: {json_file}")
+        from vfxvox_pipeline_utils.usd.reporters import (
+            render_json, render_yaml, render_markdown
+        )
+        
+        # Convert the result once and share it between the JSON and YAML renderers
+        data = result.to_dict()
+        reports = [
+            ("JSON", lambda f: render_json(result, data, f), EXAMPLES_DIR / "usd_lint_report.json"),
+            ("YAML", lambda f: render_yaml(result, data, f), EXAMPLES_DIR / "usd_lint_report.yaml"),
+            ("Markdown", lambda f: render_markdown(result, f), EXAMPLES_DIR / "usd_lint_report.md"),
+        ]
         
-        # Export to YAML
-        from vfxvox_pipeline_utils.usd.reporters import render_yaml
-        yaml_report = render_yaml(result)
-        yaml_file = Path("usd_lint_report.yaml")
-        yaml_file.write_text(yaml_report)
-        print(f"📄 YAML report saved to: {yaml_file}")
+        def export(render, path: Path) -> None:
+            # Stream straight into the file rather than building the report string
+            with path.open("w", encoding="utf-8") as f:
+                render(f)
         
-        # Export to Markdown
-        from vfxvox_pipeline_utils.usd.reporters import render_markdown
-        md_report = render_markdown(result)
-        md_file = Path("usd_lint_report.md")
-        md_file.write_text(md_report)
-        print(f"📄 Markdown report saved to: {md_file}")
+        # The reports are independent, so render and write them concurrently
+        with ThreadPoolExecutor(max_workers=len(reports)) as executor:
+            futures = [
+                executor.submit(export, render, path)
+                for _, render, path in reports
+            ]
+            for (label, _, path), future in zip(reports, futures):
+                future.result()
+                print(f"📄 {label} report saved to: {path}")
         
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -307,10 +438,13 @@ def export_lint_reports():
 
 def main():
     """Run all examples."""
-    # Change to examples directory
-    examples_dir = Path(__file__).parent
-    import os
-    os.chdir(examples_dir)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--concurrency",
+        default="auto",
+        help="Worker processes for batch linting: 'auto' (one per CPU) or a number"
+    )
+    args = parser.parse_args()
     
     print("USD Linting Examples")
     print("=" * 60)
@@ -322,13 +456,12 @@ def main():
         basic_usd_linting()
         lint_with_custom_rules()
         inspect_usd_issues()
-        batch_lint_assets()
+        batch_lint_assets(args.concurrency)
         performance_analysis()
         export_lint_reports()
         
     except Exception as e:
         print(f"\n❌ Error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
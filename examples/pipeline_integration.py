@@ -5,21 +5,101 @@ This script shows how to integrate VFXVox Pipeline Utils into production
 pipelines for automated validation and quality control.
 """
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set, Tuple
 from vfxvox_pipeline_utils.shotlint.validator import ShotLintValidator
 from vfxvox_pipeline_utils.sequences.validator import SequenceValidator
-from vfxvox_pipeline_utils.usd.linter import USDLinter
+from vfxvox_pipeline_utils.usd.linter import USDLinter, USD_EXTENSIONS, iter_usd_files
 from vfxvox_pipeline_utils.core.config import Config
 from vfxvox_pipeline_utils.core.logging import setup_logging, get_logger
 import json
+import os
+import re
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
-# Setup logging for pipeline
-setup_logging(level="INFO")
 logger = get_logger(__name__)
 
+# Trailing 4-digit frame number in a file stem, e.g. "shot_010_comp.1001"
+_FRAME_RE = re.compile(r'\.\d{4}$')
+
+
+def _dumps(data: Any) -> str:
+    """Serialize to compact JSON, using orjson when it is installed.
+    
+    Args:
+        data: JSON-serializable object
+        
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data)
+
+
+# Paths are resolved against this directory rather than the working
+# directory, so the examples run from anywhere without os.chdir
+EXAMPLES_DIR = Path(__file__).resolve().parent
+PROJECT_DIR = EXAMPLES_DIR / "vfx_project"
+
+
+@lru_cache(maxsize=32)
+def _load_rules(rules_path_str: str, mtime: float) -> List[Dict[str, Any]]:
+    """Parse a ShotLint rules file once per (path, mtime).
+    
+    The mtime is part of the cache key so editing the rules file
+    invalidates the cached copy.
+    
+    Args:
+        rules_path_str: Path to YAML rules file
+        mtime: Modification time of the rules file
+        
+    Returns:
+        List of rule dictionaries
+    """
+    return ShotLintValidator().load_rules(Path(rules_path_str))
+
+
+def load_rules_cached(rules_path: Path) -> List[Dict[str, Any]]:
+    """Load ShotLint rules, reusing the parsed result when unchanged.
+    
+    Args:
+        rules_path: Path to YAML rules file
+        
+    Returns:
+        List of rule dictionaries
+    """
+    rules_path = Path(rules_path)
+    return _load_rules(str(rules_path), rules_path.stat().st_mtime)
+
+
+def _summarize(item_results: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], bool]:
+    """Summarize the per-item results of a check.
+    
+    An item that could not be validated at all counts as failed.
+    
+    Args:
+        item_results: One result dictionary per validated item
+        
+    Returns:
+        Tuple of (check summary, whether every item passed)
+    """
+    passed = sum(1 for r in item_results if r.get("passed", False))
+    summary = {
+        "total": len(item_results),
+        "passed": passed,
+        "details": item_results
+    }
+    return summary, passed == len(item_results)
+
 
 class PipelineValidator:
     """Integrated validator for VFX pipeline quality control."""
@@ -35,12 +115,19 @@ class PipelineValidator:
         self.sequence_validator = SequenceValidator(self.config)
         self.usd_linter = USDLinter(self.config)
         
-    def validate_shot_delivery(self, shot_dir: Path, rules_path: Path) -> Dict[str, Any]:
+    def validate_shot_delivery(
+        self,
+        shot_dir: Path,
+        rules_path: Path,
+        fail_fast: bool = False
+    ) -> Dict[str, Any]:
         """Validate a complete shot delivery.
         
         Args:
             shot_dir: Path to shot directory
             rules_path: Path to validation rules
+            fail_fast: Stop after the first check that fails, skipping the
+                remaining (more expensive) checks
             
         Returns:
             Dictionary with validation results
@@ -53,81 +140,121 @@ class PipelineValidator:
             "checks": {}
         }
         
-        # 1. Validate directory structure
+        # Cheapest first, so fail_fast skips the expensive checks
+        checks = (
+            ("structure", lambda: self._check_structure(shot_dir, rules_path)),
+            ("sequences", lambda: self._check_sequences(shot_dir)),
+            ("usd", lambda: self._check_usd(shot_dir)),
+        )
+        for name, run_check in checks:
+            if fail_fast and not results["passed"]:
+                break
+            summary, passed = run_check()
+            if summary is not None:
+                results["checks"][name] = summary
+            if not passed:
+                results["passed"] = False
+        
+        logger.info(f"Shot validation complete: {'PASSED' if results['passed'] else 'FAILED'}")
+        return results
+    
+    def _check_structure(
+        self,
+        shot_dir: Path,
+        rules_path: Path
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Validate the directory structure of a shot.
+        
+        Args:
+            shot_dir: Path to shot directory
+            rules_path: Path to validation rules
+            
+        Returns:
+            Tuple of (check summary, whether the check passed)
+        """
         logger.info("Checking directory structure...")
         try:
-            structure_result = self.shotlint_validator.validate(shot_dir, rules_path)
-            results["checks"]["structure"] = {
-                "passed": structure_result.passed,
-                "errors": structure_result.error_count(),
-                "warnings": structure_result.warning_count()
-            }
-            if not structure_result.passed:
-                results["passed"] = False
+            rules = load_rules_cached(rules_path)
+            structure_result = self.shotlint_validator.validate_parsed(
+                shot_dir, rules, rules_source=str(rules_path)
+            )
         except Exception as e:
             logger.error(f"Structure validation failed: {e}")
-            results["checks"]["structure"] = {"passed": False, "error": str(e)}
-            results["passed"] = False
+            return {"passed": False, "error": str(e)}, False
         
-        # 2. Validate comp sequences
+        counts = structure_result.count_by_severity()
+        return {
+            "passed": structure_result.passed,
+            "errors": counts["error"],
+            "warnings": counts["warning"]
+        }, structure_result.passed
+    
+    def _check_sequences(self, shot_dir: Path) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Validate the comp sequences of a shot.
+        
+        Args:
+            shot_dir: Path to shot directory
+            
+        Returns:
+            Tuple of (check summary or None if there are no sequences,
+            whether every sequence passed)
+        """
         logger.info("Checking comp sequences...")
         comp_sequences = list(shot_dir.rglob("comp/v*/shot_*_comp.*.exr"))
-        if comp_sequences:
-            seq_results = []
-            for seq_file in comp_sequences:
-                # Extract pattern from first file
-                pattern = self._extract_sequence_pattern(seq_file)
-                try:
-                    seq_result = self.sequence_validator.validate(pattern)
-                    seq_results.append({
-                        "pattern": pattern,
-                        "passed": seq_result.passed,
-                        "errors": seq_result.error_count()
-                    })
-                    if not seq_result.passed:
-                        results["passed"] = False
-                except Exception as e:
-                    logger.error(f"Sequence validation failed for {pattern}: {e}")
-                    seq_results.append({"pattern": pattern, "passed": False, "error": str(e)})
-                    results["passed"] = False
-            
-            results["checks"]["sequences"] = {
-                "total": len(seq_results),
-                "passed": sum(1 for r in seq_results if r.get("passed", False)),
-                "details": seq_results
-            }
+        if not comp_sequences:
+            return None, True
         
-        # 3. Validate USD assets
-        logger.info("Checking USD assets...")
-        usd_files = list(shot_dir.rglob("*.usd*"))
-        if usd_files:
-            usd_results = []
-            for usd_file in usd_files:
-                try:
-                    usd_result = self.usd_linter.validate(usd_file)
-                    usd_results.append({
-                        "file": str(usd_file.relative_to(shot_dir)),
-                        "passed": usd_result.passed,
-                        "errors": usd_result.error_count()
-                    })
-                    if not usd_result.passed:
-                        results["passed"] = False
-                except Exception as e:
-                    logger.error(f"USD linting failed for {usd_file}: {e}")
-                    usd_results.append({
-                        "file": str(usd_file.relative_to(shot_dir)),
-                        "passed": False,
-                        "error": str(e)
-                    })
+        # Every frame maps to its sequence's pattern; validate each
+        # sequence once rather than once per frame
+        patterns = sorted({self._extract_sequence_pattern(p) for p in comp_sequences})
+        seq_results = []
+        for pattern in patterns:
+            try:
+                seq_result = self.sequence_validator.validate(pattern)
+                seq_results.append({
+                    "pattern": pattern,
+                    "passed": seq_result.passed,
+                    "errors": seq_result.error_count()
+                })
+            except Exception as e:
+                logger.error(f"Sequence validation failed for {pattern}: {e}")
+                seq_results.append({"pattern": pattern, "passed": False, "error": str(e)})
+        
+        return _summarize(seq_results)
+    
+    def _check_usd(self, shot_dir: Path) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Lint the USD assets of a shot.
+        
+        Args:
+            shot_dir: Path to shot directory
             
-            results["checks"]["usd"] = {
-                "total": len(usd_results),
-                "passed": sum(1 for r in usd_results if r.get("passed", False)),
-                "details": usd_results
-            }
+        Returns:
+            Tuple of (check summary or None if there are no USD files,
+            whether every file passed)
+        """
+        logger.info("Checking USD assets...")
+        usd_files = list(iter_usd_files(shot_dir))
+        if not usd_files:
+            return None, True
         
-        logger.info(f"Shot validation complete: {'PASSED' if results['passed'] else 'FAILED'}")
-        return results
+        usd_results = []
+        for usd_file in usd_files:
+            try:
+                usd_result = self.usd_linter.validate(usd_file)
+                usd_results.append({
+                    "file": str(usd_file.relative_to(shot_dir)),
+                    "passed": usd_result.passed,
+                    "errors": usd_result.error_count()
+                })
+            except Exception as e:
+                logger.error(f"USD linting failed for {usd_file}: {e}")
+                usd_results.append({
+                    "file": str(usd_file.relative_to(shot_dir)),
+                    "passed": False,
+                    "error": str(e)
+                })
+        
+        return _summarize(usd_results)
     
     def _extract_sequence_pattern(self, file_path: Path) -> str:
         """Extract sequence pattern from a file path.
@@ -139,10 +266,8 @@ class PipelineValidator:
             Sequence pattern string
         """
         # Simple pattern extraction - replace frame number with %04d
-        name = file_path.stem
-        # Find frame number (assumes 4-digit padding)
-        import re
-        pattern = re.sub(r'\.\d{4}$', '.%04d', name)
+        # (assumes 4-digit padding)
+        pattern = _FRAME_RE.sub('.%04d', file_path.stem)
         return str(file_path.parent / f"{pattern}{file_path.suffix}")
 
 
@@ -162,9 +287,10 @@ def pre_render_validation(shot_dir: Path) -> bool:
     logger.info("=" * 60)
     
     validator = PipelineValidator()
-    rules_path = Path("vfx_project/shotlint_rules.yaml")
+    rules_path = PROJECT_DIR / "shotlint_rules.yaml"
     
-    results = validator.validate_shot_delivery(shot_dir, rules_path)
+    # Any failure blocks the render, so there is no point running later checks
+    results = validator.validate_shot_delivery(shot_dir, rules_path, fail_fast=True)
     
     # Print summary
     print("\nValidation Summary:")
@@ -210,10 +336,14 @@ def post_render_validation(sequence_pattern: str) -> bool:
         print("\nValidation Results:")
         print("-" * 60)
         print(f"Pattern: {sequence_pattern}")
-        print(f"Frames: {result.metadata.get('frame_count', 0)}")
-        print(f"Range: {result.metadata.get('frame_range', 'N/A')}")
-        print(f"Errors: {result.error_count()}")
-        print(f"Warnings: {result.warning_count()}")
+        print(f"Frames: {result.frame_count}")
+        if result.frame_range:
+            print(f"Range: {result.frame_range[0]}-{result.frame_range[1]}")
+        else:
+            print("Range: N/A")
+        counts = result.count_by_severity()
+        print(f"Errors: {counts['error']}")
+        print(f"Warnings: {counts['warning']}")
         print(f"Status: {'✅ PASSED' if result.passed else '❌ FAILED'}")
         
         if not result.passed:
@@ -231,6 +361,32 @@ def post_render_validation(sequence_pattern: str) -> bool:
         return False
 
 
+def _list_asset_root(asset_dir: Path) -> Tuple[Set[str], List[str], List[Path]]:
+    """List the top level of an asset directory in a single pass.
+    
+    One listing answers the required folder check and seeds the USD
+    file walk.
+    
+    Args:
+        asset_dir: Path to asset directory
+        
+    Returns:
+        Tuple of (entry names, subdirectory paths, USD files at the root)
+    """
+    entry_names = set()
+    subdirs = []
+    usd_files = []
+    usd_suffixes = tuple(USD_EXTENSIONS)
+    with os.scandir(asset_dir) as entries:
+        for entry in entries:
+            entry_names.add(entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.lower().endswith(usd_suffixes):
+                usd_files.append(Path(entry.path))
+    return entry_names, subdirs, usd_files
+
+
 def asset_publish_validation(asset_dir: Path) -> bool:
     """Asset publish validation hook.
     
@@ -246,9 +402,11 @@ def asset_publish_validation(asset_dir: Path) -> bool:
     logger.info("ASSET PUBLISH VALIDATION")
     logger.info("=" * 60)
     
+    entry_names, subdirs, usd_files = _list_asset_root(asset_dir)
+    
     # Check directory structure
     required_folders = ["model", "texture", "rig"]
-    missing_folders = [f for f in required_folders if not (asset_dir / f).exists()]
+    missing_folders = [f for f in required_folders if f not in entry_names]
     
     if missing_folders:
         logger.error(f"Missing required folders: {missing_folders}")
@@ -257,7 +415,8 @@ def asset_publish_validation(asset_dir: Path) -> bool:
     
     # Validate USD files
     linter = USDLinter()
-    usd_files = list(asset_dir.rglob("*.usd*"))
+    for subdir in subdirs:
+        usd_files.extend(iter_usd_files(subdir))
     
     if not usd_files:
         logger.error("No USD files found in asset")
@@ -289,7 +448,49 @@ def asset_publish_validation(asset_dir: Path) -> bool:
     return all_passed
 
 
-def batch_shot_validation(project_dir: Path, output_report: Path):
+# Per-process validator, created once per worker by _init_shot_worker
+_worker_validator: Optional[PipelineValidator] = None
+
+
+def _init_shot_worker(config_path: Optional[Path] = None) -> None:
+    """Build the pipeline validator used by a batch worker process.
+    
+    Args:
+        config_path: Optional path to configuration file
+    """
+    global _worker_validator
+    _worker_validator = PipelineValidator(config_path)
+
+
+def _validate_shot(shot_dir: Path, rules_path: Path) -> Dict[str, Any]:
+    """Validate one shot with the worker's pipeline validator.
+    
+    Args:
+        shot_dir: Path to shot directory
+        rules_path: Path to validation rules
+        
+    Returns:
+        Dictionary with validation results
+    """
+    if _worker_validator is None:
+        _init_shot_worker()
+    
+    try:
+        return _worker_validator.validate_shot_delivery(shot_dir, rules_path)
+    except Exception as e:
+        logger.error(f"Validation failed for {shot_dir}: {e}")
+        return {
+            "shot_dir": str(shot_dir),
+            "passed": False,
+            "error": str(e)
+        }
+
+
+def batch_shot_validation(
+    project_dir: Path,
+    output_report: Path,
+    config_path: Optional[Path] = None
+):
     """Batch validate all shots in a project.
     
     Args:
@@ -300,7 +501,6 @@ def batch_shot_validation(project_dir: Path, output_report: Path):
     logger.info("BATCH SHOT VALIDATION")
     logger.info("=" * 60)
     
-    validator = PipelineValidator()
     rules_path = project_dir / "shotlint_rules.yaml"
     
     # Find all shot directories
@@ -308,37 +508,54 @@ def batch_shot_validation(project_dir: Path, output_report: Path):
     
     logger.info(f"Found {len(shot_dirs)} shots to validate")
     
-    all_results = []
+    if not shot_dirs:
+        logger.warning("No shots found")
+        return
+    
+    passed = 0
+    failed = 0
     
-    for shot_dir in shot_dirs:
-        logger.info(f"\nValidating: {shot_dir.relative_to(project_dir)}")
+    # Stream each shot's result into the report as it completes, so only
+    # the pass/fail counters are kept in memory
+    with open(output_report, "w", encoding="utf-8") as report:
+        report.write('{\n  "project": %s,\n  "shots": [' % json.dumps(str(project_dir)))
         
-        try:
-            results = validator.validate_shot_delivery(shot_dir, rules_path)
-            all_results.append(results)
-            
-            status = "✅" if results["passed"] else "❌"
-            print(f"{status} {shot_dir.name}")
+        # Shots are independent, so fan them out across processes; each
+        # worker builds its PipelineValidator once in the initializer
+        workers = min(len(shot_dirs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_shot_worker,
+            initargs=(config_path,)
+        ) as executor:
+            futures = {
+                executor.submit(_validate_shot, shot_dir, rules_path): shot_dir
+                for shot_dir in shot_dirs
+            }
             
-        except Exception as e:
-            logger.error(f"Validation failed for {shot_dir}: {e}")
-            all_results.append({
-                "shot_dir": str(shot_dir),
-                "passed": False,
-                "error": str(e)
-            })
-    
-    # Generate summary report
-    summary = {
-        "project": str(project_dir),
-        "total_shots": len(all_results),
-        "passed": sum(1 for r in all_results if r.get("passed", False)),
-        "failed": sum(1 for r in all_results if not r.get("passed", False)),
-        "shots": all_results
-    }
+            for future in as_completed(futures):
+                shot_dir = futures[future]
+                results = future.result()
+                
+                if results.get("passed", False):
+                    passed += 1
+                else:
+                    failed += 1
+                
+                separator = "," if passed + failed > 1 else ""
+                report.write(f"{separator}\n    {_dumps(results)}")
+                report.flush()
+                
+                status = "✅" if results["passed"] else "❌"
+                print(f"{status} {shot_dir.name}")
+        
+        # Close the shot list and append the totals
+        report.write(
+            f'\n  ],\n  "total_shots": {passed + failed},\n'
+            f'  "passed": {passed},\n  "failed": {failed}\n}}\n'
+        )
     
-    # Save report
-    output_report.write_text(json.dumps(summary, indent=2))
+    summary = {"total_shots": passed + failed, "passed": passed, "failed": failed}
     logger.info(f"\n📄 Report saved to: {output_report}")
     
     # Print summary
@@ -351,40 +568,61 @@ def batch_shot_validation(project_dir: Path, output_report: Path):
     print(f"Success rate: {summary['passed']/summary['total_shots']*100:.1f}%")
 
 
+@lru_cache(maxsize=None)
+def _exists(path: str) -> bool:
+    """Check whether a path exists, remembering the answer for this run.
+    
+    Args:
+        path: Path to check
+        
+    Returns:
+        True if the path exists
+    """
+    return os.path.exists(path)
+
+
 def main():
     """Run pipeline integration examples."""
-    # Change to examples directory
-    examples_dir = Path(__file__).parent
-    import os
-    os.chdir(examples_dir)
+    # Configure logging only when run as a script, not when imported
+    setup_logging(level="INFO", force=True)
     
     print("Pipeline Integration Examples")
     print("=" * 60 + "\n")
     
+    # One listing of the project root answers the top-level existence
+    # checks; deeper paths go through the cached _exists()
+    try:
+        with os.scandir(PROJECT_DIR) as entries:
+            project_entries = {entry.name for entry in entries if entry.is_dir()}
+        project_exists = True
+    except OSError:
+        project_entries = set()
+        project_exists = False
+    
     try:
         # Example 1: Pre-render validation
-        shot_dir = Path("vfx_project/seq_010/shot_010")
-        if shot_dir.exists():
+        shot_dir = PROJECT_DIR / "seq_010/shot_010"
+        if "seq_010" in project_entries and _exists(str(shot_dir)):
             passed = pre_render_validation(shot_dir)
             if not passed:
                 print("\n⚠️  Pre-render validation failed - fix issues before rendering")
         
         # Example 2: Post-render validation
         print("\n")
-        sequence = "vfx_project/seq_010/shot_010/comp/v001/shot_010_v001_comp.%04d.exr"
+        sequence = str(PROJECT_DIR / "seq_010/shot_010/comp/v001/shot_010_v001_comp.%04d.exr")
         post_render_validation(sequence)
         
         # Example 3: Asset publish validation
         print("\n")
-        asset_dir = Path("vfx_project/assets/characters/hero")
-        if asset_dir.exists():
+        asset_dir = PROJECT_DIR / "assets/characters/hero"
+        if "assets" in project_entries and _exists(str(asset_dir)):
             asset_publish_validation(asset_dir)
         
         # Example 4: Batch validation
         print("\n")
-        project_dir = Path("vfx_project")
-        if project_dir.exists():
-            batch_shot_validation(project_dir, Path("batch_validation_report.json"))
+        project_dir = PROJECT_DIR
+        if project_exists:
+            batch_shot_validation(project_dir, EXAMPLES_DIR / "batch_validation_report.json")
         
     except Exception as e:
         logger.error(f"Pipeline integration error: {e}", exc_info=True)
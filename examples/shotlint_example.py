@@ -7,10 +7,15 @@ directory structures against studio standards defined in YAML rules.
 
 from pathlib import Path
 from vfxvox_pipeline_utils.shotlint.validator import ShotLintValidator
-from vfxvox_pipeline_utils.shotlint.reporters import render_console, render_json
 import sys
 
 
+# Paths are resolved against this directory rather than the working
+# directory, so the examples run from anywhere without os.chdir
+EXAMPLES_DIR = Path(__file__).resolve().parent
+PROJECT_DIR = EXAMPLES_DIR / "vfx_project"
+
+
 def validate_project_structure(project_dir: str, rules_file: str):
     """Validate a project directory structure.
     
@@ -18,6 +23,8 @@ def validate_project_structure(project_dir: str, rules_file: str):
         project_dir: Path to the project directory to validate
         rules_file: Path to the YAML rules file
     """
+    from vfxvox_pipeline_utils.shotlint.reporters import render_console
+    
     print(f"Validating project: {project_dir}")
     print(f"Using rules: {rules_file}\n")
     
@@ -52,8 +59,8 @@ def validate_with_custom_rules():
     print("=" * 60 + "\n")
     
     validate_project_structure(
-        project_dir="vfx_project",
-        rules_file="vfx_project/shotlint_rules_strict.yaml"
+        project_dir=PROJECT_DIR,
+        rules_file=str(PROJECT_DIR / "shotlint_rules_strict.yaml")
     )
 
 
@@ -64,32 +71,37 @@ def validate_with_minimal_rules():
     print("=" * 60 + "\n")
     
     validate_project_structure(
-        project_dir="vfx_project",
-        rules_file="vfx_project/shotlint_rules_minimal.yaml"
+        project_dir=PROJECT_DIR,
+        rules_file=str(PROJECT_DIR / "shotlint_rules_minimal.yaml")
     )
 
 
 def programmatic_validation():
     """Example of programmatic validation with result inspection."""
+    from vfxvox_pipeline_utils.shotlint.reporters import render_json
+    
     print("\n" + "=" * 60)
     print("Example 3: Programmatic validation with result inspection")
     print("=" * 60 + "\n")
     
     validator = ShotLintValidator()
     result = validator.validate(
-        root=Path("vfx_project"),
-        rules_path=Path("vfx_project/shotlint_rules.yaml")
+        root=PROJECT_DIR,
+        rules_path=PROJECT_DIR / "shotlint_rules.yaml"
     )
     
+    # Group issues by severity in a single pass
+    by_severity = {"error": [], "warning": [], "info": []}
+    for issue in result.issues:
+        by_severity.setdefault(issue.severity, []).append(issue)
+    errors = by_severity["error"]
+    warnings = by_severity["warning"]
+    
     # Inspect results programmatically
     print(f"Total issues: {len(result.issues)}")
-    print(f"Errors: {result.error_count()}")
-    print(f"Warnings: {result.warning_count()}")
-    print(f"Info: {result.info_count()}\n")
-    
-    # Group issues by severity
-    errors = [issue for issue in result.issues if issue.severity == "error"]
-    warnings = [issue for issue in result.issues if issue.severity == "warning"]
+    print(f"Errors: {len(errors)}")
+    print(f"Warnings: {len(warnings)}")
+    print(f"Info: {len(by_severity['info'])}\n")
     
     if errors:
         print("Critical errors found:")
@@ -107,18 +119,13 @@ def programmatic_validation():
     
     # Export to JSON for further processing
     json_output = render_json(result)
-    output_file = Path("validation_report.json")
+    output_file = EXAMPLES_DIR / "validation_report.json"
     output_file.write_text(json_output)
     print(f"\n📄 Full report saved to: {output_file}")
 
 
 def main():
     """Run all examples."""
-    # Change to examples directory
-    examples_dir = Path(__file__).parent
-    import os
-    os.chdir(examples_dir)
-    
     try:
         validate_with_custom_rules()
         validate_with_minimal_rules()
@@ -5,16 +5,37 @@ This script shows how to use the Sequence Validator module to check
 image sequences for missing frames, corrupted files, and consistency issues.
 """
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
 from vfxvox_pipeline_utils.sequences.validator import SequenceValidator
-from vfxvox_pipeline_utils.sequences.scanner import SequenceScanner
-from vfxvox_pipeline_utils.sequences.reporters import render_console, render_json
+from vfxvox_pipeline_utils.sequences.scanner import SequenceScanner, iter_missing_frames
 from vfxvox_pipeline_utils.core.config import Config
 import sys
+import traceback
+
+
+# Paths are resolved against this directory rather than the working
+# directory, so the examples run from anywhere without os.chdir
+EXAMPLES_DIR = Path(__file__).resolve().parent
+PROJECT_DIR = EXAMPLES_DIR / "vfx_project"
+
+# Upper bound on concurrent sequence validations in batch_validation()
+BATCH_MAX_WORKERS = 8
+
+
+def format_frame_range(result) -> str:
+    """Format a result's frame range for display."""
+    if result.frame_range is None:
+        return "N/A"
+    return f"{result.frame_range[0]}-{result.frame_range[1]}"
 
 
 def basic_sequence_validation():
     """Example 1: Basic sequence validation."""
+    from vfxvox_pipeline_utils.sequences.reporters import render_console
+    
     print("=" * 60)
     print("Example 1: Basic Sequence Validation")
     print("=" * 60 + "\n")
@@ -23,7 +44,7 @@ def basic_sequence_validation():
     validator = SequenceValidator()
     
     # Validate a sequence using printf-style pattern
-    pattern = "vfx_project/seq_010/shot_010/comp/v001/shot_010_v001_comp.%04d.exr"
+    pattern = str(PROJECT_DIR / "seq_010/shot_010/comp/v001/shot_010_v001_comp.%04d.exr")
     
     print(f"Validating sequence: {pattern}\n")
     
@@ -61,8 +82,8 @@ def validate_with_different_patterns():
         
         try:
             result = validator.validate(pattern)
-            print(f"  Frames found: {result.metadata.get('frame_count', 0)}")
-            print(f"  Frame range: {result.metadata.get('frame_range', 'N/A')}")
+            print(f"  Frames found: {result.frame_count}")
+            print(f"  Frame range: {format_frame_range(result)}")
             print(f"  Issues: {len(result.issues)}")
         except Exception as e:
             print(f"  Error: {e}")
@@ -70,6 +91,8 @@ def validate_with_different_patterns():
 
 def validate_with_custom_config():
     """Example 3: Validation with custom configuration."""
+    from vfxvox_pipeline_utils.sequences.reporters import render_console
+    
     print("\n" + "=" * 60)
     print("Example 3: Custom Configuration")
     print("=" * 60 + "\n")
@@ -86,7 +109,7 @@ def validate_with_custom_config():
     # Create validator with config
     validator = SequenceValidator(config=config)
     
-    pattern = "vfx_project/seq_010/shot_010/plate/shot_010_plate.%04d.exr"
+    pattern = str(PROJECT_DIR / "seq_010/shot_010/plate/shot_010_plate.%04d.exr")
     
     print(f"Validating with custom config: {pattern}\n")
     
@@ -100,7 +123,7 @@ def scan_sequence_details():
     print("Example 4: Detailed Sequence Scanning")
     print("=" * 60 + "\n")
     
-    pattern = "vfx_project/seq_010/shot_010/comp/v001/shot_010_v001_comp.%04d.exr"
+    pattern = str(PROJECT_DIR / "seq_010/shot_010/comp/v001/shot_010_v001_comp.%04d.exr")
     
     # Create scanner
     scanner = SequenceScanner(pattern)
@@ -114,18 +137,20 @@ def scan_sequence_details():
         frame_range = scanner.get_frame_range()
         print(f"Frame range: {frame_range[0]}-{frame_range[1]}")
         
-        # Check for gaps
-        expected_frames = set(range(frame_range[0], frame_range[1] + 1))
-        actual_frames = set(frame_numbers)
-        missing = sorted(expected_frames - actual_frames)
+        # Check for gaps. Detected frames are unique, so the count follows
+        # from the range, and only the frames shown are kept in memory
+        missing_count = frame_range[1] - frame_range[0] + 1 - len(frame_numbers)
         
-        if missing:
-            print(f"\n⚠️  Missing frames: {len(missing)}")
+        if missing_count:
+            print(f"\n⚠️  Missing frames: {missing_count}")
+            gaps = iter_missing_frames(frame_numbers)
             # Show first few missing frames
-            if len(missing) <= 10:
-                print(f"   {missing}")
+            if missing_count <= 10:
+                print(f"   {list(gaps)}")
             else:
-                print(f"   {missing[:5]} ... {missing[-5:]}")
+                first = list(islice(gaps, 5))
+                last = list(deque(gaps, maxlen=5))
+                print(f"   {first} ... {last}")
         else:
             print("\n✅ No missing frames")
         
@@ -150,30 +175,37 @@ def batch_validation():
     
     # List of sequences to validate
     sequences = [
-        "vfx_project/seq_010/shot_010/comp/v001/shot_010_v001_comp.%04d.exr",
-        "vfx_project/seq_010/shot_010/plate/shot_010_plate.%04d.exr",
-        "vfx_project/seq_010/shot_020/comp/v001/shot_020_v001_comp.%04d.exr",
+        str(PROJECT_DIR / "seq_010/shot_010/comp/v001/shot_010_v001_comp.%04d.exr"),
+        str(PROJECT_DIR / "seq_010/shot_010/plate/shot_010_plate.%04d.exr"),
+        str(PROJECT_DIR / "seq_010/shot_020/comp/v001/shot_020_v001_comp.%04d.exr"),
     ]
     
+    # validate() keeps no per-call state on the validator, so one instance
+    # is shared by all workers. Scanning and frame reads are I/O bound, so
+    # threads overlap the filesystem waits of different sequences.
     validator = SequenceValidator()
-    results = []
+    results = {}
     
-    for pattern in sequences:
-        print(f"\nValidating: {pattern}")
-        print("-" * 60)
+    with ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, len(sequences))) as executor:
+        futures = {executor.submit(validator.validate, p): p for p in sequences}
         
-        try:
-            result = validator.validate(pattern)
-            results.append((pattern, result))
-            
-            # Quick summary
-            status = "✅" if result.passed else "❌"
-            print(f"{status} Frames: {result.metadata.get('frame_count', 0)}, "
-                  f"Issues: {len(result.issues)}")
+        for future in as_completed(futures):
+            pattern = futures[future]
+            print(f"\nValidating: {pattern}")
+            print("-" * 60)
             
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            results.append((pattern, None))
+            try:
+                result = future.result()
+                results[pattern] = result
+                
+                # Quick summary
+                status = "✅" if result.passed else "❌"
+                print(f"{status} Frames: {result.frame_count}, "
+                      f"Issues: {len(result.issues)}")
+                
+            except Exception as e:
+                print(f"❌ Error: {e}")
+                results[pattern] = None
     
     # Overall summary
     print("\n" + "=" * 60)
@@ -181,9 +213,9 @@ def batch_validation():
     print("=" * 60)
     
     total_sequences = len(results)
-    passed = sum(1 for _, r in results if r and r.passed)
-    failed = sum(1 for _, r in results if r and not r.passed)
-    errors = sum(1 for _, r in results if r is None)
+    passed = sum(1 for r in results.values() if r and r.passed)
+    failed = sum(1 for r in results.values() if r and not r.passed)
+    errors = sum(1 for r in results.values() if r is None)
     
     print(f"\nTotal sequences: {total_sequences}")
     print(f"Passed: {passed}")
@@ -193,43 +225,43 @@ def batch_validation():
 
 def export_validation_report():
     """Example 6: Exporting validation reports."""
+    from vfxvox_pipeline_utils.sequences.reporters import render_json, render_yaml, render_markdown
+    
     print("\n" + "=" * 60)
     print("Example 6: Exporting Reports")
     print("=" * 60 + "\n")
     
     validator = SequenceValidator()
-    pattern = "vfx_project/seq_010/shot_010/comp/v001/shot_010_v001_comp.%04d.exr"
+    pattern = str(PROJECT_DIR / "seq_010/shot_010/comp/v001/shot_010_v001_comp.%04d.exr")
     
     result = validator.validate(pattern)
     
+    # Convert the result once and share it between the JSON and YAML renderers
+    data = result.to_dict()
+    
+    # Reports are streamed straight into their files rather than built as strings
+    
     # Export to JSON
-    json_report = render_json(result)
-    json_file = Path("sequence_validation_report.json")
-    json_file.write_text(json_report)
+    json_file = EXAMPLES_DIR / "sequence_validation_report.json"
+    with json_file.open("w", encoding="utf-8") as f:
+        render_json(result, data, f)
     print(f"📄 JSON report saved to: {json_file}")
     
     # Export to YAML
-    from vfxvox_pipeline_utils.sequences.reporters import render_yaml
-    yaml_report = render_yaml(result)
-    yaml_file = Path("sequence_validation_report.yaml")
-    yaml_file.write_text(yaml_report)
+    yaml_file = EXAMPLES_DIR / "sequence_validation_report.yaml"
+    with yaml_file.open("w", encoding="utf-8") as f:
+        render_yaml(result, data, f)
     print(f"📄 YAML report saved to: {yaml_file}")
     
     # Export to Markdown
-    from vfxvox_pipeline_utils.sequences.reporters import render_markdown
-    md_report = render_markdown(result)
-    md_file = Path("sequence_validation_report.md")
-    md_file.write_text(md_report)
+    md_file = EXAMPLES_DIR / "sequence_validation_report.md"
+    with md_file.open("w", encoding="utf-8") as f:
+        render_markdown(result, f)
     print(f"📄 Markdown report saved to: {md_file}")
 
 
 def main():
     """Run all examples."""
-    # Change to examples directory
-    examples_dir = Path(__file__).parent
-    import os
-    os.chdir(examples_dir)
-    
     try:
         basic_sequence_validation()
         validate_with_different_patterns()
@@ -240,7 +272,6 @@ def main():
         
     except Exception as e:
         print(f"\n❌ Error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
@@ -27,13 +27,15 @@ setup(
     extras_require={
         "usd": ["usd-core>=22.11"],
         "oiio": ["OpenImageIO>=2.4"],
-        "all": ["usd-core>=22.11", "OpenImageIO>=2.4"],
+        "json": ["orjson>=3.6"],
+        "all": ["usd-core>=22.11", "OpenImageIO>=2.4", "orjson>=3.6"],
         "dev": [
             "pytest>=7.0",
             "pytest-cov>=4.0",
             "black>=23.0",
             "flake8>=6.0",
             "mypy>=1.0",
+            "orjson>=3.6",
         ],
     },
     entry_points={
@@ -2,9 +2,52 @@
 
 import pytest
 from pathlib import Path
+import io
+import json
+import os
+import sys
 import tempfile
 import shutil
-from typing import Generator
+from functools import lru_cache, partial
+from typing import Dict, Generator
+
+
+@lru_cache(maxsize=None)
+def _encode_image(fmt: str, mode: str, size: tuple, color=0) -> bytes:
+    """Encode a solid-colour image with Pillow, once per distinct image.
+    
+    Args:
+        fmt: Pillow format name, e.g. "PNG" or "BMP"
+        mode: Pillow image mode
+        size: Image size as (width, height)
+        color: Fill colour, as accepted by ``Image.new``
+        
+    Returns:
+        Image file contents
+    """
+    from PIL import Image
+    
+    # Fixtures only need a decodable image; the fastest deflate level is enough
+    options = {"compress_level": 1} if fmt == "PNG" else {}
+    buffer = io.BytesIO()
+    Image.new(mode, size, color).save(buffer, format=fmt, **options)
+    return buffer.getvalue()
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    """Hard-link target to source, copying where links are unsupported.
+    
+    Args:
+        source: Existing file
+        target: Path to create
+    """
+    try:
+        os.link(source, target)
+    except FileExistsError:
+        target.unlink()
+        _link_or_copy(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
 
 
 @pytest.fixture
@@ -24,6 +67,32 @@ def temp_dir() -> Generator[Path, None, None]:
         shutil.rmtree(temp_path, ignore_errors=True)
 
 
+@pytest.fixture
+def plugin_dir(temp_dir: Path) -> Generator[Path, None, None]:
+    """Create an importable directory for test plugin modules.
+    
+    The directory is on ``sys.path`` for the duration of the test, and
+    modules imported from it are dropped from ``sys.modules`` afterwards.
+    
+    Args:
+        temp_dir: Temporary directory path
+        
+    Yields:
+        Path to plugin directory
+    """
+    plugin_path = temp_dir / "plugins"
+    plugin_path.mkdir()
+    sys.path.insert(0, str(plugin_path))
+    try:
+        yield plugin_path
+    finally:
+        sys.path.remove(str(plugin_path))
+        for name, module in list(sys.modules.items()):
+            module_file = getattr(module, "__file__", None) or ""
+            if module_file.startswith(str(plugin_path)):
+                del sys.modules[name]
+
+
 @pytest.fixture
 def fixtures_dir() -> Path:
     """Get path to test fixtures directory.
@@ -86,12 +155,13 @@ def sample_rules_file(fixtures_dir: Path) -> Path:
     return fixtures_dir / "shotlint_rules.yaml"
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def reset_logging():
-    """Reset logging configuration between tests.
+    """Reset logging configuration after a test.
     
-    This fixture automatically runs for every test to ensure
-    logging state doesn't leak between tests.
+    Request this fixture (or mark the test with
+    ``@pytest.mark.usefixtures("reset_logging")``) in tests that call
+    ``setup_logging()`` so their configuration doesn't leak into others.
     """
     from vfxvox_pipeline_utils.core.logging import reset_logging
     
@@ -131,6 +201,19 @@ def mock_config():
     })
 
 
+@pytest.fixture
+def png_bytes():
+    """Encoder for PNG test frames, taking the same arguments as ``Image.new``.
+    
+    Identical images are encoded once per session, so tests writing many
+    frames only pay for a file write per frame.
+    
+    Returns:
+        Function returning PNG file contents
+    """
+    return partial(_encode_image, "PNG")
+
+
 @pytest.fixture
 def create_test_sequence(temp_dir: Path):
     """Factory fixture to create test image sequences.
@@ -146,49 +229,81 @@ def create_test_sequence(temp_dir: Path):
         start_frame: int,
         end_frame: int,
         missing_frames: list = None,
-        padding: int = 4
+        padding: int = 4,
+        ext: str = "png"
     ) -> Path:
         """Create a test image sequence.
         
+        Every frame is a hard link to the first one, so replace a frame
+        with a new file rather than writing into an existing one.
+        
         Args:
             base_name: Base name for sequence files
             start_frame: First frame number
             end_frame: Last frame number
             missing_frames: List of frame numbers to skip
             padding: Frame number padding
+            ext: Frame format, "png" or uncompressed "bmp"
             
         Returns:
             Path to sequence directory
         """
-        from PIL import Image
-        
         seq_dir = temp_dir / "sequences"
         seq_dir.mkdir(parents=True, exist_ok=True)
         
+        if ext not in ("png", "bmp"):
+            raise ValueError(f"Unsupported test frame format: {ext}")
+        
         missing_frames = missing_frames or []
+        frame_bytes = _encode_image(ext.upper(), "RGB", (1920, 1080))
+        first_file = None
         
         for frame in range(start_frame, end_frame + 1):
             if frame in missing_frames:
                 continue
                 
             frame_str = str(frame).zfill(padding)
-            frame_file = seq_dir / f"{base_name}.{frame_str}.png"
+            frame_file = seq_dir / f"{base_name}.{frame_str}.{ext}"
             
-            # Create a simple test image
-            img = Image.new('RGB', (1920, 1080), color=(frame % 255, 128, 200))
-            img.save(frame_file)
+            # Frames only need a valid header, so they share one encoded
+            # image; write it once and link the rest of the frames to it
+            if first_file is None:
+                if frame_file.exists():
+                    frame_file.unlink()
+                frame_file.write_bytes(frame_bytes)
+                first_file = frame_file
+            else:
+                _link_or_copy(first_file, frame_file)
         
         return seq_dir
     
     return _create_sequence
 
 
+@pytest.fixture(scope="session")
+def _directory_structure_cache(tmp_path_factory) -> Dict[str, Path]:
+    """Session-wide map of structure definitions to directories built for them.
+    
+    Args:
+        tmp_path_factory: Pytest session temporary path factory
+        
+    Returns:
+        Dictionary keyed by canonical JSON of the structure
+    """
+    return {}
+
+
 @pytest.fixture
-def create_test_directory_structure(temp_dir: Path):
+def create_test_directory_structure(tmp_path_factory, _directory_structure_cache):
     """Factory fixture to create test directory structures.
     
+    Identical structures are built once per session and shared, so tests
+    must treat the returned tree as read-only; write any extra files to
+    ``temp_dir`` or pass ``base_path`` to get a private copy.
+    
     Args:
-        temp_dir: Temporary directory path
+        tmp_path_factory: Pytest session temporary path factory
+        _directory_structure_cache: Session cache of built structures
         
     Returns:
         Function to create directory structures
@@ -203,13 +318,22 @@ def create_test_directory_structure(temp_dir: Path):
                         - dict: subdirectory structure
                         - str: file content
                         - None: empty directory
-            base_path: Base path for structure (uses temp_dir if None)
+            base_path: Base path for structure (uses a shared session
+                       directory if None)
             
         Returns:
             Path to created structure root
         """
         if base_path is None:
-            base_path = temp_dir
+            key = json.dumps(structure, sort_keys=True)
+            cached = _directory_structure_cache.get(key)
+            if cached is not None:
+                return cached
+            
+            base_path = tmp_path_factory.mktemp("structure")
+            _create_structure(structure, base_path)
+            _directory_structure_cache[key] = base_path
+            return base_path
         
         for name, content in structure.items():
             path = base_path / name
@@ -0,0 +1,67 @@
+"""Tests for the CLI entry point."""
+
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from vfxvox_pipeline_utils.cli.main import cli
+
+SUBCOMMAND_MODULES = [
+    "vfxvox_pipeline_utils.cli.shotlint_cmd",
+    "vfxvox_pipeline_utils.cli.sequence_cmd",
+    "vfxvox_pipeline_utils.cli.usd_cmd",
+]
+
+
+@pytest.mark.unit
+def test_help_lists_commands_without_importing_them(monkeypatch):
+    """Test that --help lists subcommands without loading their modules."""
+    for module in SUBCOMMAND_MODULES:
+        monkeypatch.delitem(sys.modules, module, raising=False)
+    for name in list(cli.lazy_subcommands):
+        monkeypatch.delitem(cli.commands, name, raising=False)
+
+    result = CliRunner().invoke(cli, ["--no-logo", "--help"])
+
+    assert result.exit_code == 0
+    for name in ("shotlint", "validate-sequence", "lint-usd"):
+        assert name in result.output
+    for module in SUBCOMMAND_MODULES:
+        assert module not in sys.modules
+
+
+@pytest.mark.unit
+def test_subcommand_loaded_on_demand():
+    """Test that invoking a subcommand resolves it lazily."""
+    result = CliRunner().invoke(cli, ["--no-logo", "shotlint", "--help"])
+
+    assert result.exit_code == 0
+    assert "Validate directory structure against rules." in result.output
+    assert "shotlint" in cli.commands
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("format", ["console", "json", "yaml", "md"])
+def test_shotlint_writes_report_file(temp_dir, format):
+    """Test that reports are written straight to the --report file."""
+    (temp_dir / "project" / "plates").mkdir(parents=True)
+    rules_file = temp_dir / "rules.yaml"
+    rules_file.write_text(
+        "rules:\n"
+        "  - name: Plates\n"
+        "    type: must_exist\n"
+        "    glob: plates\n"
+        "  - name: Comp\n"
+        "    type: must_exist\n"
+        "    glob: comp\n"
+    )
+    report = temp_dir / f"report.{format}"
+
+    result = CliRunner().invoke(cli, [
+        "--no-logo", "shotlint", str(temp_dir / "project"),
+        "--rules", str(rules_file), "--format", format, "--report", str(report),
+    ])
+
+    assert result.exit_code == 1
+    assert "No matches for glob: comp" in report.read_text(encoding="utf-8")
@@ -0,0 +1,101 @@
+"""Tests for configuration loading."""
+
+import pytest
+import yaml
+
+from vfxvox_pipeline_utils.core.config import Config
+
+
+@pytest.mark.unit
+def test_config_file_parsed_once_until_changed(temp_dir, monkeypatch):
+    """Test that an unchanged config file is only parsed once."""
+    config_file = temp_dir / "vfxvox.yaml"
+    config_file.write_text("sequences:\n  check_bit_depth: false\n")
+    
+    calls = []
+    real_load = yaml.load
+    
+    def counting_load(stream, Loader):
+        calls.append(stream)
+        return real_load(stream, Loader=Loader)
+    
+    monkeypatch.setattr(yaml, "load", counting_load)
+    
+    first = Config(config_file)
+    first._config["sequences"]["check_bit_depth"] = True
+    second = Config(config_file)
+    
+    assert len(calls) == 1
+    assert second.get("sequences.check_bit_depth") is False
+    assert second.get("sequences.check_resolution") is True
+    
+    config_file.write_text("sequences:\n  check_resolution: false\n")
+    third = Config(config_file)
+    
+    assert len(calls) == 2
+    assert third.get("sequences.check_resolution") is False
+    assert third.get("sequences.check_bit_depth") is True
+
+
+@pytest.mark.unit
+def test_merge_configs_merges_nested_sections():
+    """Test that overrides replace leaves and merge nested sections."""
+    base = {"a": {"b": {"c": 1, "d": 2}, "e": 3}, "f": [1]}
+    override = {"a": {"b": {"c": 10}, "g": {"h": 4}}, "f": [2]}
+    
+    merged = Config()._merge_configs(base, override)
+    
+    assert merged == {"a": {"b": {"c": 10, "d": 2}, "e": 3, "g": {"h": 4}}, "f": [2]}
+
+
+@pytest.mark.unit
+def test_get_resolves_dotted_keys():
+    """Test lookups of leaves, sections, missing and None values."""
+    config = Config.from_dict({
+        "usd": {"check_references": False, "custom_rules_path": None},
+        "shotlint": {"fail_on": "warning"},
+    })
+    
+    assert config.get("usd.check_references") is False
+    assert config.get("usd") == {"check_references": False, "custom_rules_path": None}
+    assert config.get("usd.custom_rules_path", "rules.yaml") == "rules.yaml"
+    assert config.get("usd.missing", 7) == 7
+    assert config.get("shotlint.fail_on.level", "error") == "error"
+    assert config.get("sequences.check_resolution") is None
+
+
+@pytest.mark.unit
+def test_get_unaffected_by_edits_to_input():
+    """Test that editing the source dict after from_dict() has no effect."""
+    data = {"usd": {"check_references": False}}
+    config = Config.from_dict(data)
+    assert config.get("usd.check_references") is False
+    
+    data["usd"]["check_references"] = True
+    
+    assert config.get("usd.check_references") is False
+    assert config.get("usd") == {"check_references": False}
+
+
+@pytest.mark.unit
+def test_get_sees_edits_to_returned_sections():
+    """Test that a returned section is live and edits to it show up in lookups."""
+    config = Config.from_dict({"usd": {"check_references": False}})
+    assert config.get("usd.check_references") is False
+    
+    section = config.get("usd")
+    assert config.get("usd") is section
+    
+    section["check_references"] = True
+    section["max_layer_depth"] = 4
+    
+    assert config.get("usd.check_references") is True
+    assert config.get("usd.max_layer_depth") == 4
+
+
+@pytest.mark.unit
+def test_missing_config_file_uses_defaults(temp_dir):
+    """Test that a config path that doesn't exist falls back to defaults."""
+    config = Config(temp_dir / "missing" / "vfxvox.yaml")
+    
+    assert config.get("sequences.check_resolution") is True
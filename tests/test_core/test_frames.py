@@ -0,0 +1,17 @@
+"""Tests for frame range helpers."""
+
+import pytest
+
+from vfxvox_pipeline_utils.core.frames import format_frame_ranges, iter_frame_ranges
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("frame_numbers,ranges,text", [
+    ([1001, 1002, 1003, 1007, 1009, 1010], [(1001, 1003), (1007, 1007), (1009, 1010)], "1001-1003, 1007, 1009-1010"),
+    ([1005], [(1005, 1005)], "1005"),
+    ([], [], ""),
+])
+def test_iter_frame_ranges(frame_numbers, ranges, text):
+    """Test collapsing frame numbers into contiguous runs."""
+    assert list(iter_frame_ranges(frame_numbers)) == ranges
+    assert format_frame_ranges(ranges) == text
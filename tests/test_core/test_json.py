@@ -0,0 +1,48 @@
+"""Tests for JSON report output."""
+
+import io
+import json
+
+import pytest
+
+from vfxvox_pipeline_utils.core import _json
+
+
+@pytest.mark.unit
+def test_dump_json_same_data_with_and_without_orjson(monkeypatch):
+    """Test that the orjson and stdlib encoders produce the same report."""
+    pytest.importorskip("orjson")
+    data = {
+        "passed": False,
+        "issues": [{"severity": "error", "message": "Missing frames: 1002, 1004"}],
+        "details_by_frame": {1002: "missing"},
+        "metadata": {"shot": "Plate é", "empty": [], "ratio": 1.5, "note": None},
+    }
+    
+    with_orjson = _json.dump_json(data)
+    
+    monkeypatch.setattr(_json, "ORJSON_AVAILABLE", False)
+    without_orjson = _json.dump_json(data)
+    
+    assert with_orjson == without_orjson
+
+
+@pytest.mark.unit
+def test_dump_json_writes_non_ascii_unescaped(monkeypatch):
+    """Test that the stdlib fallback keeps non-ASCII text as is."""
+    monkeypatch.setattr(_json, "ORJSON_AVAILABLE", False)
+    
+    text = _json.dump_json({"message": "Plate é missing"})
+    
+    assert '"Plate é missing"' in text
+    assert json.loads(text) == {"message": "Plate é missing"}
+
+
+@pytest.mark.unit
+def test_dump_json_to_stream_matches_string():
+    """Test that streaming JSON writes the same text that is returned otherwise."""
+    data = {"passed": True, "issues": []}
+    stream = io.StringIO()
+    
+    assert _json.dump_json(data, stream) is None
+    assert stream.getvalue() == _json.dump_json(data)
@@ -0,0 +1,25 @@
+"""Tests for logging setup."""
+
+import pytest
+
+from vfxvox_pipeline_utils.core import logging as vfx_logging
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("reset_logging")
+def test_get_logger_is_cached_until_reset(monkeypatch):
+    """Test that get_logger only sets up logging once until it is reset."""
+    vfx_logging.reset_logging()
+    calls = []
+    real_setup = vfx_logging.setup_logging
+    monkeypatch.setattr(
+        vfx_logging, "setup_logging", lambda: calls.append(1) or real_setup()
+    )
+
+    logger = vfx_logging.get_logger("vfxvox.test")
+    assert vfx_logging.get_logger("vfxvox.test") is logger
+    assert len(calls) == 1
+
+    vfx_logging.reset_logging()
+    assert vfx_logging.get_logger("vfxvox.test") is logger
+    assert len(calls) == 2
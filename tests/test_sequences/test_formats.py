@@ -8,7 +8,9 @@ from vfxvox_pipeline_utils.sequences.formats import (
     get_format_handler,
     register_format_handler,
     StandardImageHandler,
-    ImageFormatHandler
+    ImageFormatHandler,
+    EXRHandler,
+    DPXHandler
 )
 
 
@@ -70,7 +72,7 @@ def test_standard_handler_read_metadata(temp_dir):
     # Create test image
     img_file = temp_dir / "test.png"
     img = Image.new('RGB', (1920, 1080), color=(100, 100, 100))
-    img.save(img_file)
+    img.save(img_file, compress_level=1)
     
     handler = StandardImageHandler()
     metadata = handler.read_metadata(img_file)
@@ -154,7 +156,7 @@ def test_read_metadata_with_different_resolutions(temp_dir):
     for width, height in resolutions:
         img_file = temp_dir / f"test_{width}x{height}.png"
         img = Image.new('RGB', (width, height))
-        img.save(img_file)
+        img.save(img_file, compress_level=1)
         
         metadata = handler.read_metadata(img_file)
         assert metadata["resolution"] == (width, height)
@@ -170,8 +172,103 @@ def test_read_metadata_with_different_modes(temp_dir):
     for mode in modes:
         img_file = temp_dir / f"test_{mode}.png"
         img = Image.new(mode, (1920, 1080))
-        img.save(img_file)
+        img.save(img_file, compress_level=1)
         
         metadata = handler.read_metadata(img_file)
         assert metadata is not None
         assert metadata["resolution"] == (1920, 1080)
+
+
+@pytest.mark.unit
+def test_custom_format_handler_with_extensions():
+    """Test that a handler declaring extensions is found by suffix."""
+    
+    class RawHandler(ImageFormatHandler):
+        extensions = (".raw",)
+        
+        def can_handle(self, file_path: Path) -> bool:
+            return file_path.suffix.lower() == ".raw"
+        
+        def read_metadata(self, file_path: Path) -> dict:
+            return {"format": "raw", "resolution": None}
+    
+    handler = RawHandler()
+    register_format_handler(handler)
+    
+    assert get_format_handler(Path("frame.1001.RAW")) is handler
+
+
+@pytest.mark.unit
+def test_register_format_handler_replaces_cached_lookup():
+    """Test that registering a handler takes effect after a suffix was looked up."""
+    
+    class CineonHandler(ImageFormatHandler):
+        extensions = (".cin",)
+        
+        def can_handle(self, file_path: Path) -> bool:
+            return file_path.suffix.lower() == ".cin"
+        
+        def read_metadata(self, file_path: Path) -> dict:
+            return {"format": "cin", "resolution": None}
+    
+    assert get_format_handler(Path("frame.1001.cin")) is None
+    
+    handler = CineonHandler()
+    register_format_handler(handler)
+    
+    assert get_format_handler(Path("frame.1001.cin")) is handler
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("mode,ext", [
+    ("RGB", "png"),
+    ("RGBA", "png"),
+    ("L", "png"),
+    ("P", "png"),
+    ("1", "png"),
+    ("RGB", "jpg"),
+    ("L", "jpg"),
+    ("CMYK", "jpg"),
+    ("RGB", "bmp"),
+    ("RGB", "tiff"),
+])
+def test_read_metadata_matches_pillow(temp_dir, mode, ext):
+    """Test that header parsing reports the same metadata as Pillow."""
+    img_file = temp_dir / f"test_{mode}.{ext}"
+    Image.new(mode, (321, 123)).save(img_file)
+    
+    metadata = StandardImageHandler().read_metadata(img_file)
+    
+    with Image.open(img_file) as img:
+        assert metadata["resolution"] == img.size
+        assert metadata["mode"] == img.mode
+
+
+@pytest.mark.integration
+def test_read_metadata_batch(temp_dir):
+    """Test batch metadata reads keep input order and skip unreadable files."""
+    paths = []
+    for width in (64, 128, 256):
+        img_file = temp_dir / f"frame_{width}.png"
+        Image.new('RGB', (width, 32)).save(img_file)
+        paths.append(img_file)
+    
+    corrupted = temp_dir / "corrupted.png"
+    corrupted.write_bytes(b"not an image")
+    paths.insert(1, corrupted)
+    
+    results = StandardImageHandler().read_metadata_batch(paths, max_workers=4)
+    
+    assert results[1] is None
+    assert [r["resolution"] for r in results if r] == [(64, 32), (128, 32), (256, 32)]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("handler_class,ext", [(EXRHandler, "exr"), (DPXHandler, "dpx")])
+def test_read_metadata_rejects_corrupted_file(temp_dir, handler_class, ext):
+    """Test that EXR and DPX handlers fail on files that are not images."""
+    frame_file = temp_dir / f"corrupted.{ext}"
+    frame_file.write_text("not an image")
+    
+    with pytest.raises(Exception):
+        handler_class().read_metadata(frame_file)
@@ -0,0 +1,50 @@
+"""Tests for sequence pattern parsing."""
+
+import pytest
+
+from vfxvox_pipeline_utils.core.exceptions import InvalidFormatError
+from vfxvox_pipeline_utils.sequences.pattern import compile_pattern
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("filename_pattern,pattern_type,padding,frame_range", [
+    ("shot_010.%04d.exr", "printf", 4, None),
+    ("shot_010.%d.exr", "printf", 0, None),
+    ("shot_010.####.exr", "hash", 4, None),
+    ("shot_010.[1001-1100].exr", "range", 4, (1001, 1100)),
+    ("shot#1.%03d.exr", "printf", 3, None),
+])
+def test_compile_pattern(filename_pattern, pattern_type, padding, frame_range):
+    """Test parsing of each pattern style."""
+    spec = compile_pattern(filename_pattern)
+    
+    assert spec.pattern_type == pattern_type
+    assert spec.padding == padding
+    assert spec.frame_range == frame_range
+    assert spec.extension == ".exr"
+    assert spec.format_name == "exr"
+
+
+@pytest.mark.unit
+def test_compile_pattern_regex_and_template():
+    """Test that the regex and filename template round-trip frame numbers."""
+    spec = compile_pattern("shot_010.####.exr")
+    
+    filename = spec.format_template.format(1001)
+    
+    assert filename == "shot_010.1001.exr"
+    assert int(spec.regex.match(filename).group(1)) == 1001
+    assert spec.regex.match("shot_010.1001.dpx") is None
+
+
+@pytest.mark.unit
+def test_compile_pattern_is_cached():
+    """Test that a pattern string is parsed only once."""
+    assert compile_pattern("cache_test.%04d.exr") is compile_pattern("cache_test.%04d.exr")
+
+
+@pytest.mark.unit
+def test_compile_pattern_invalid():
+    """Test that a pattern without a frame token is rejected."""
+    with pytest.raises(InvalidFormatError):
+        compile_pattern("shot_010.exr")
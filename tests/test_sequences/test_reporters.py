@@ -0,0 +1,33 @@
+"""Tests for sequence reporters."""
+
+import io
+import pytest
+
+from vfxvox_pipeline_utils.core.validators import ValidationResult
+from vfxvox_pipeline_utils.sequences.reporters import render_json, render_yaml, render_markdown
+
+
+@pytest.fixture
+def sample_result():
+    """Validation result with issues of every severity."""
+    result = ValidationResult(passed=False)
+    result.metadata = {"pattern": "shot.%04d.exr", "frame_count": 3, "frame_range": "1001-1005"}
+    result.add_issue(
+        severity="error",
+        message="Missing frames: [1002, 1004]",
+        location="frames 1001-1005",
+        details={"missing_frames": [1002, 1004]}
+    )
+    result.add_issue(severity="warning", message="Bit depth mismatch", details={"expected": 16})
+    result.add_issue(severity="info", message="Scanned 3 frames")
+    return result
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("render", [render_json, render_yaml, render_markdown])
+def test_render_to_stream_matches_string(sample_result, render):
+    """Test that streaming a report writes the same text that is returned otherwise."""
+    stream = io.StringIO()
+    
+    assert render(sample_result, stream=stream) is None
+    assert stream.getvalue() == render(sample_result)
@@ -2,9 +2,12 @@
 
 import pytest
 from pathlib import Path
-from PIL import Image
 
-from vfxvox_pipeline_utils.sequences.scanner import SequenceScanner, FrameInfo
+from vfxvox_pipeline_utils.sequences.scanner import (
+    SequenceScanner,
+    FrameInfo,
+    iter_missing_frames,
+)
 
 
 @pytest.mark.unit
@@ -124,16 +127,18 @@ def test_scan_nonexistent_frame(temp_dir):
 
 
 @pytest.mark.integration
-def test_scan_all_frames(create_test_sequence):
+@pytest.mark.parametrize("ext", ["png", "bmp"])
+def test_scan_all_frames(create_test_sequence, ext):
     """Test scanning all frames in sequence."""
     seq_dir = create_test_sequence(
         base_name="test",
         start_frame=1001,
         end_frame=1005,
-        missing_frames=[]
+        missing_frames=[],
+        ext=ext
     )
     
-    pattern = str(seq_dir / "test.%04d.png")
+    pattern = str(seq_dir / f"test.%04d.{ext}")
     scanner = SequenceScanner(pattern)
     
     frames = scanner.scan_all()
@@ -193,7 +198,7 @@ def test_detect_frames_empty_directory(temp_dir):
 
 
 @pytest.mark.integration
-def test_scan_sequence_with_different_padding(temp_dir):
+def test_scan_sequence_with_different_padding(temp_dir, png_bytes):
     """Test scanning sequence with different frame padding."""
     seq_dir = temp_dir / "sequences"
     seq_dir.mkdir()
@@ -201,8 +206,7 @@ def test_scan_sequence_with_different_padding(temp_dir):
     # Create frames with 3-digit padding
     for frame in [101, 102, 103]:
         frame_file = seq_dir / f"test.{frame:03d}.png"
-        img = Image.new('RGB', (1920, 1080))
-        img.save(frame_file)
+        frame_file.write_bytes(png_bytes('RGB', (1920, 1080)))
     
     pattern = str(seq_dir / "test.%03d.png")
     scanner = SequenceScanner(pattern)
@@ -212,3 +216,157 @@ def test_scan_sequence_with_different_padding(temp_dir):
     assert len(frames) == 3
     assert 101 in frames
     assert 103 in frames
+
+
+@pytest.mark.integration
+def test_detect_frames_sees_new_frames(create_test_sequence, png_bytes):
+    """Test that a repeated scan picks up frames added since the last one."""
+    seq_dir = create_test_sequence(
+        base_name="test",
+        start_frame=1001,
+        end_frame=1003,
+        missing_frames=[]
+    )
+    
+    scanner = SequenceScanner(str(seq_dir / "test.%04d.png"))
+    assert scanner.detect_frames() == [1001, 1002, 1003]
+    
+    (seq_dir / "test.1004.png").write_bytes(png_bytes('RGB', (8, 8)))
+    
+    assert scanner.detect_frames() == [1001, 1002, 1003, 1004]
+    assert scanner.get_frame_range() == (1001, 1004)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("filename_pattern,frame,expected", [
+    ("shot.%04d.exr", 7, "shot.0007.exr"),
+    ("shot.%d.exr", 7, "shot.7.exr"),
+    ("shot.###.exr", 1001, "shot.1001.exr"),
+    ("shot_{v1}.[1001-1100].exr", 1001, "shot_{v1}.1001.exr"),
+])
+def test_scan_frame_file_path(temp_dir, filename_pattern, frame, expected):
+    """Test that frame file paths are built from the parsed pattern."""
+    scanner = SequenceScanner(str(temp_dir / filename_pattern))
+    
+    frame_info = scanner.scan_frame(frame)
+    
+    assert frame_info.file_path == temp_dir / expected
+    assert frame_info.format == "exr"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("frame_numbers,expected", [
+    ([1001, 1002, 1003], []),
+    ([1001, 1004, 1005, 1008], [1002, 1003, 1006, 1007]),
+    ([1005, 1001, 1003], [1002, 1004]),
+    ([1001], []),
+    ([], []),
+])
+def test_iter_missing_frames(frame_numbers, expected):
+    """Test missing frame detection between the first and last frame."""
+    assert list(iter_missing_frames(frame_numbers)) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("frame_numbers,start,end,expected", [
+    ([1003, 1004], 1001, 1006, [1001, 1002, 1005, 1006]),
+    ([999, 1002, 1010], 1001, 1004, [1001, 1003, 1004]),
+    ([1002, 1002], 1001, 1003, [1001, 1003]),
+    ([], 1001, 1003, [1001, 1002, 1003]),
+])
+def test_iter_missing_frames_with_range(frame_numbers, start, end, expected):
+    """Test missing frame detection within an explicit frame range."""
+    assert list(iter_missing_frames(frame_numbers, start, end)) == expected
+
+
+@pytest.mark.integration
+def test_scanners_share_directory_listing(temp_dir):
+    """Test that sequences in the same directory are listed from one read."""
+    from vfxvox_pipeline_utils.sequences._dircache import list_files
+    
+    for frame in (1001, 1002):
+        (temp_dir / f"beauty.{frame}.exr").write_bytes(b"")
+        (temp_dir / f"depth.{frame}.exr").write_bytes(b"")
+    (temp_dir / "beauty.1003.exr").mkdir()
+    
+    list_files.cache_clear()
+    beauty = SequenceScanner(str(temp_dir / "beauty.%04d.exr")).detect_frames()
+    depth = SequenceScanner(str(temp_dir / "depth.%04d.exr")).detect_frames()
+    
+    assert beauty == [1001, 1002]
+    assert depth == [1001, 1002]
+    assert list_files.cache_info().misses == 1
+    assert list_files.cache_info().hits == 1
+
+
+@pytest.mark.integration
+def test_scan_frames_batch_keeps_order(create_test_sequence):
+    """Test that batched scans span several chunks and keep frame order."""
+    seq_dir = create_test_sequence(
+        base_name="test",
+        start_frame=1001,
+        end_frame=1150,
+        missing_frames=[1070]
+    )
+    
+    scanner = SequenceScanner(str(seq_dir / "test.%04d.png"))
+    frame_numbers = list(range(1001, 1151))
+    
+    frames = scanner.scan_frames_batch(frame_numbers, max_workers=4)
+    
+    assert [f.frame_number for f in frames] == frame_numbers
+    assert not frames[69].exists
+    assert all(f.resolution == (1920, 1080) for f in frames if f.exists)
+
+
+@pytest.mark.unit
+def test_detect_frames_ignores_partial_matches(temp_dir):
+    """Test that only whole file names matching the pattern count as frames."""
+    for name in ("test.1001.exr", "test.1002.exr", "test.1003.exr.bak", "test.1004.exr~"):
+        (temp_dir / name).write_bytes(b"")
+    
+    scanner = SequenceScanner(str(temp_dir / "test.%04d.exr"))
+    
+    assert scanner.detect_frames() == [1001, 1002]
+
+
+@pytest.mark.unit
+def test_scanners_reuse_compiled_pattern(temp_dir):
+    """Test that scanners of the same pattern share one parsed spec."""
+    pattern = str(temp_dir / "test.####.png")
+    
+    first = SequenceScanner(pattern)
+    second = SequenceScanner(pattern)
+    
+    assert first.spec is second.spec
+    assert first.frame_regex is first.spec.regex
+    assert first.base_path == temp_dir
+
+
+@pytest.mark.integration
+def test_scan_all_takes_existence_from_listing(create_test_sequence, monkeypatch):
+    """Test that scan_all does not stat frames the directory listing found."""
+    import os.path
+    
+    seq_dir = create_test_sequence(
+        base_name="test",
+        start_frame=1001,
+        end_frame=1020,
+        missing_frames=[1005]
+    )
+    scanner = SequenceScanner(str(seq_dir / "test.%04d.png"))
+    
+    stat_calls = []
+    original_exists = os.path.exists
+    
+    def counting_exists(path):
+        stat_calls.append(path)
+        return original_exists(path)
+    
+    monkeypatch.setattr(os.path, "exists", counting_exists)
+    
+    frames = scanner.scan_all(max_workers=1)
+    
+    assert len(frames) == 19
+    assert all(f.exists for f in frames)
+    assert stat_calls == []
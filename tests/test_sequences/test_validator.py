@@ -2,7 +2,6 @@
 
 import pytest
 from pathlib import Path
-from PIL import Image
 
 from vfxvox_pipeline_utils.sequences.validator import SequenceValidator
 from vfxvox_pipeline_utils.core.config import Config
@@ -48,6 +47,8 @@ def test_validate_complete_sequence(create_test_sequence):
     assert result.passed
     assert result.error_count() == 0
     assert result.metadata["frame_count"] == 10
+    assert result.frame_count == 10
+    assert result.frame_range == (1001, 1010)
 
 
 @pytest.mark.integration
@@ -69,8 +70,9 @@ def test_validate_sequence_with_missing_frames(create_test_sequence):
     assert result.error_count() > 0
     
     # Check that missing frames are reported
-    missing_issue = next((i for i in result.issues if "missing" in i.message.lower()), None)
-    assert missing_issue is not None
+    missing_issues = result.issues_by_category.get("missing_frames")
+    assert missing_issues is not None
+    assert "missing" in missing_issues[0].message.lower()
 
 
 @pytest.mark.integration
@@ -83,11 +85,11 @@ def test_validate_empty_sequence(temp_dir):
     
     # Should have warning about no frames found
     assert len(result.issues) > 0
-    assert any("no frames" in i.message.lower() for i in result.issues)
+    assert "no_frames" in result.issues_by_category
 
 
 @pytest.mark.integration
-def test_validate_sequence_with_corrupted_frames(temp_dir):
+def test_validate_sequence_with_corrupted_frames(temp_dir, png_bytes):
     """Test validation detects corrupted frames."""
     seq_dir = temp_dir / "sequences"
     seq_dir.mkdir()
@@ -95,8 +97,7 @@ def test_validate_sequence_with_corrupted_frames(temp_dir):
     # Create valid frames
     for frame in [1001, 1002, 1004]:
         frame_file = seq_dir / f"test.{frame:04d}.png"
-        img = Image.new('RGB', (1920, 1080), color=(100, 100, 100))
-        img.save(frame_file)
+        frame_file.write_bytes(png_bytes('RGB', (1920, 1080), color=(100, 100, 100)))
     
     # Create corrupted frame
     corrupted_file = seq_dir / "test.1003.png"
@@ -109,12 +110,11 @@ def test_validate_sequence_with_corrupted_frames(temp_dir):
     
     # Should detect corrupted frame
     assert not result.passed
-    corrupted_issue = next((i for i in result.issues if "corrupted" in i.message.lower() or "unreadable" in i.message.lower()), None)
-    assert corrupted_issue is not None
+    assert "corrupted_frames" in result.issues_by_category
 
 
 @pytest.mark.integration
-def test_validate_sequence_resolution_consistency(temp_dir):
+def test_validate_sequence_resolution_consistency(temp_dir, png_bytes):
     """Test validation detects resolution inconsistencies."""
     seq_dir = temp_dir / "sequences"
     seq_dir.mkdir()
@@ -122,13 +122,11 @@ def test_validate_sequence_resolution_consistency(temp_dir):
     # Create frames with different resolutions
     for frame in [1001, 1002]:
         frame_file = seq_dir / f"test.{frame:04d}.png"
-        img = Image.new('RGB', (1920, 1080), color=(100, 100, 100))
-        img.save(frame_file)
+        frame_file.write_bytes(png_bytes('RGB', (1920, 1080), color=(100, 100, 100)))
     
     # Create frame with different resolution
     frame_file = seq_dir / "test.1003.png"
-    img = Image.new('RGB', (1280, 720), color=(100, 100, 100))  # Different resolution
-    img.save(frame_file)
+    frame_file.write_bytes(png_bytes('RGB', (1280, 720), color=(100, 100, 100)))  # Different resolution
     
     pattern = str(seq_dir / "test.%04d.png")
     
@@ -137,12 +135,11 @@ def test_validate_sequence_resolution_consistency(temp_dir):
     
     # Should detect resolution mismatch
     assert not result.passed
-    resolution_issue = next((i for i in result.issues if "resolution" in i.message.lower()), None)
-    assert resolution_issue is not None
+    assert "resolution_mismatch" in result.issues_by_category
 
 
 @pytest.mark.integration
-def test_validate_sequence_with_resolution_check_disabled(temp_dir):
+def test_validate_sequence_with_resolution_check_disabled(temp_dir, png_bytes):
     """Test validation with resolution check disabled."""
     seq_dir = temp_dir / "sequences"
     seq_dir.mkdir()
@@ -150,12 +147,10 @@ def test_validate_sequence_with_resolution_check_disabled(temp_dir):
     # Create frames with different resolutions
     for frame in [1001, 1002]:
         frame_file = seq_dir / f"test.{frame:04d}.png"
-        img = Image.new('RGB', (1920, 1080), color=(100, 100, 100))
-        img.save(frame_file)
+        frame_file.write_bytes(png_bytes('RGB', (1920, 1080), color=(100, 100, 100)))
     
     frame_file = seq_dir / "test.1003.png"
-    img = Image.new('RGB', (1280, 720), color=(100, 100, 100))
-    img.save(frame_file)
+    frame_file.write_bytes(png_bytes('RGB', (1280, 720), color=(100, 100, 100)))
     
     pattern = str(seq_dir / "test.%04d.png")
     
@@ -170,12 +165,11 @@ def test_validate_sequence_with_resolution_check_disabled(temp_dir):
     result = validator.validate(pattern)
     
     # Should not report resolution issues
-    resolution_issue = next((i for i in result.issues if "resolution" in i.message.lower()), None)
-    assert resolution_issue is None
+    assert "resolution_mismatch" not in result.issues_by_category
 
 
 @pytest.mark.integration
-def test_validate_sequence_bit_depth_consistency(temp_dir):
+def test_validate_sequence_bit_depth_consistency(temp_dir, png_bytes):
     """Test validation detects bit depth inconsistencies."""
     seq_dir = temp_dir / "sequences"
     seq_dir.mkdir()
@@ -183,13 +177,11 @@ def test_validate_sequence_bit_depth_consistency(temp_dir):
     # Create RGB frames
     for frame in [1001, 1002]:
         frame_file = seq_dir / f"test.{frame:04d}.png"
-        img = Image.new('RGB', (1920, 1080), color=(100, 100, 100))
-        img.save(frame_file)
+        frame_file.write_bytes(png_bytes('RGB', (1920, 1080), color=(100, 100, 100)))
     
     # Create RGBA frame (different bit depth)
     frame_file = seq_dir / "test.1003.png"
-    img = Image.new('RGBA', (1920, 1080), color=(100, 100, 100, 255))
-    img.save(frame_file)
+    frame_file.write_bytes(png_bytes('RGBA', (1920, 1080), color=(100, 100, 100, 255)))
     
     pattern = str(seq_dir / "test.%04d.png")
     
@@ -229,7 +221,28 @@ def test_check_missing_frames(create_test_sequence):
 
 
 @pytest.mark.unit
-def test_check_corrupted_frames(temp_dir):
+def test_check_missing_frames_counts_nonexistent_frames(temp_dir):
+    """Test that scanned frames not found on disk are reported as missing."""
+    from vfxvox_pipeline_utils.sequences.scanner import FrameInfo
+    from vfxvox_pipeline_utils.core.validators import ValidationResult
+    
+    frames = [
+        FrameInfo(frame_number=n, file_path=temp_dir / f"test.{n}.png", exists=n != 1001, readable=True)
+        for n in (1001, 1002, 1004)
+    ]
+    
+    validator = SequenceValidator()
+    result = ValidationResult(passed=True)
+    
+    validator.check_missing_frames(frames, result)
+    
+    assert result.issues[0].details["missing_frames"] == [1001, 1003]
+    assert result.issues[0].details["missing_ranges"] == [[1001, 1001], [1003, 1003]]
+    assert result.issues[0].details["found_count"] == 2
+
+
+@pytest.mark.unit
+def test_check_corrupted_frames(temp_dir, png_bytes):
     """Test check_corrupted_frames method."""
     from vfxvox_pipeline_utils.sequences.scanner import SequenceScanner, FrameInfo
     from vfxvox_pipeline_utils.core.validators import ValidationResult
@@ -239,8 +252,7 @@ def test_check_corrupted_frames(temp_dir):
     
     # Create one valid frame
     frame_file = seq_dir / "test.1001.png"
-    img = Image.new('RGB', (1920, 1080))
-    img.save(frame_file)
+    frame_file.write_bytes(png_bytes('RGB', (1920, 1080)))
     
     # Create corrupted frame
     corrupted_file = seq_dir / "test.1002.png"
@@ -283,3 +295,145 @@ def test_check_resolution_consistency(create_test_sequence):
     
     # All frames have same resolution, should have no issues
     assert len(result.issues) == 0
+
+
+@pytest.mark.unit
+def test_check_consistency_accepts_frame_array():
+    """Test consistency checks give the same issues for lists and FrameArrays."""
+    from vfxvox_pipeline_utils.sequences.scanner import FrameArray, FrameInfo
+    from vfxvox_pipeline_utils.core.validators import ValidationResult
+    
+    frames = [
+        FrameInfo(1001, Path("a.1001.png"), True, True, (1920, 1080), 8),
+        FrameInfo(1002, Path("a.1002.png"), True, True, (1920, 1080), 16),
+        FrameInfo(1003, Path("a.1003.png"), False, False),
+        FrameInfo(1004, Path("a.1004.png"), True, True, (1280, 720), 8),
+    ]
+    columns = FrameArray.from_frames(frames)
+    assert len(columns) == 4
+    
+    validator = SequenceValidator()
+    for check in (validator.check_resolution_consistency, validator.check_bit_depth_consistency):
+        from_list = ValidationResult(passed=True)
+        from_array = ValidationResult(passed=True)
+        check(frames, from_list)
+        check(columns, from_array)
+        
+        assert len(from_list.issues) == 1
+        assert from_list.issues[0].details == from_array.issues[0].details
+    
+    assert from_list.issues[0].details["mismatches"] == [
+        {"frame": 1002, "expected": 8, "actual": 16}
+    ]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("scan_workers", [1, 4])
+def test_validate_with_scan_workers(create_test_sequence, scan_workers):
+    """Test that serial and threaded frame scans give the same result."""
+    seq_dir = create_test_sequence(
+        base_name="test",
+        start_frame=1001,
+        end_frame=1040,
+        missing_frames=[1020]
+    )
+    config = Config.from_dict({"sequences": {"scan_workers": scan_workers}})
+    
+    result = SequenceValidator(config=config).validate(str(seq_dir / "test.%04d.png"))
+    
+    assert result.frame_count == 39
+    assert result.error_count() == 1
+
+
+@pytest.mark.integration
+def test_validate_scans_each_frame_once(create_test_sequence, monkeypatch):
+    """Test that all checks share a single scan of the sequence."""
+    from vfxvox_pipeline_utils.sequences.scanner import SequenceScanner
+    
+    seq_dir = create_test_sequence(
+        base_name="test",
+        start_frame=1001,
+        end_frame=1005,
+        missing_frames=[]
+    )
+    
+    scanned = []
+    original_scan_frame = SequenceScanner.scan_frame
+    
+    def counting_scan_frame(self, frame_number):
+        scanned.append(frame_number)
+        return original_scan_frame(self, frame_number)
+    
+    monkeypatch.setattr(SequenceScanner, "scan_frame", counting_scan_frame)
+    
+    result = SequenceValidator().validate(str(seq_dir / "test.%04d.png"))
+    
+    assert result.passed
+    assert sorted(scanned) == [1001, 1002, 1003, 1004, 1005]
+
+
+@pytest.mark.unit
+def test_check_resolution_consistency_uses_majority():
+    """Test that an odd first frame is reported instead of every other frame."""
+    from vfxvox_pipeline_utils.sequences.scanner import FrameInfo
+    from vfxvox_pipeline_utils.core.validators import ValidationResult
+    
+    frames = [FrameInfo(1001, Path("a.1001.png"), True, True, (1280, 720), 8)]
+    frames += [
+        FrameInfo(frame, Path(f"a.{frame}.png"), True, True, (1920, 1080), 8)
+        for frame in range(1002, 1010)
+    ]
+    
+    result = ValidationResult(passed=True)
+    SequenceValidator().check_resolution_consistency(frames, result)
+    
+    assert len(result.issues) == 1
+    details = result.issues[0].details
+    assert details["reference_resolution"] == (1920, 1080)
+    assert details["mismatch_count"] == 1
+    assert details["mismatches"][0]["frame"] == 1001
+
+
+@pytest.mark.unit
+def test_issues_by_category_tracks_new_issues():
+    """Test the category index picks up issues added after it was built."""
+    from vfxvox_pipeline_utils.core.validators import ValidationIssue, ValidationResult
+    
+    result = ValidationResult(passed=True)
+    result.add_issue("error", "Missing frames: 1003", category="missing_frames")
+    result.add_issue("info", "Uncategorised note")
+    assert list(result.issues_by_category) == ["missing_frames"]
+    
+    result.issues.append(ValidationIssue("error", "Corrupted", category="corrupted_frames"))
+    result.add_issue("error", "Missing frames: 1005", category="missing_frames")
+    
+    index = result.issues_by_category
+    assert len(index["missing_frames"]) == 2
+    assert len(index["corrupted_frames"]) == 1
+    
+    result.issues.sort(key=lambda issue: issue.message)
+    assert index is not result.issues_by_category
+    assert [i.message for i in result.issues_by_category["missing_frames"]] == [
+        "Missing frames: 1003",
+        "Missing frames: 1005",
+    ]
+    
+    result.issues[0] = ValidationIssue("error", "Corrupted", category="other")
+    assert "corrupted_frames" not in result.issues_by_category
+    assert len(result.issues_by_category["other"]) == 1
+    
+    result.issues = []
+    assert result.issues_by_category == {}
+
+
+@pytest.mark.unit
+def test_issues_by_category_is_read_only():
+    """Test callers cannot modify the category index."""
+    from vfxvox_pipeline_utils.core.validators import ValidationResult
+    
+    result = ValidationResult(passed=True)
+    result.add_issue("error", "Missing frames: 1003", category="missing_frames")
+    
+    with pytest.raises(TypeError):
+        result.issues_by_category["missing_frames"] = ()
+    assert isinstance(result.issues_by_category["missing_frames"], tuple)
@@ -3,7 +3,7 @@
 import pytest
 from pathlib import Path
 
-from vfxvox_pipeline_utils.shotlint.engine import RuleEngine
+from vfxvox_pipeline_utils.shotlint.engine import RuleEngine, compile_rules
 
 
 @pytest.mark.unit
@@ -252,4 +252,145 @@ def test_engine_with_mixed_results(create_test_directory_structure):
     assert isinstance(issues, list)
     # First rule passes, second fails
     assert len(issues) > 0
-    assert any("plate" in issue.message.lower() for issue in issues)
+    assert any(
+        (issue.details or {}).get("glob") == "seq_*/shot_*/plate" for issue in issues
+    )
+    assert all(issue.category == "must_exist" for issue in issues)
+
+
+@pytest.mark.unit
+def test_compile_rules_precompiles_regex_rules(temp_dir):
+    """Test that rule regexes and glob matchers are compiled once, up front."""
+    engine = RuleEngine(temp_dir)
+    
+    path_rule = {"type": "path_pattern", "pattern": "seq_{seq}", "vars": {"seq": r"\d{3}"}}
+    regex_rule = {"type": "filename_regex", "regex": r"^shot_\d{3}\.exr$"}
+    invalid_rule = {"type": "filename_regex", "regex": "[invalid"}
+    glob_rule = {"type": "must_exist", "glob": "seq_*"}
+    
+    compiled = compile_rules([path_rule, regex_rule, invalid_rule, glob_rule])
+    
+    assert set(compiled) == {id(path_rule), id(regex_rule), id(glob_rule)}
+    assert compiled[id(path_rule)].match("seq_010")
+    assert compiled[id(regex_rule)].match("shot_010.exr")
+    anchor, segments = compiled[id(glob_rule)]
+    assert anchor == ""
+    assert segments[0][1].match("seq_010")
+    
+    # Invalid regexes are still reported by the rule itself
+    issues = engine.execute_all([invalid_rule])
+    assert len(issues) == 1
+    assert "Invalid regex" in issues[0].message
+
+
+@pytest.mark.unit
+def test_iter_all_yields_issues_lazily(temp_dir):
+    """Test that iter_all runs rules only as issues are consumed."""
+    engine = RuleEngine(temp_dir)
+    
+    rules = [
+        {"name": "First", "type": "unknown_a"},
+        {"name": "Second", "type": "unknown_b"},
+    ]
+    
+    executed = []
+    original_execute_rule = engine.execute_rule
+    
+    def recording_execute_rule(rule, compiled=None):
+        executed.append(rule["name"])
+        return original_execute_rule(rule, compiled)
+    
+    engine.execute_rule = recording_execute_rule
+    
+    issues = engine.iter_all(rules)
+    assert executed == []
+    
+    first = next(issues)
+    assert first.location == "First"
+    assert executed == ["First"]
+    
+    assert [issue.location for issue in issues] == ["Second"]
+    assert engine.execute_all(rules)[1].location == "Second"
+
+
+@pytest.mark.unit
+def test_tree_rules_share_one_walk(create_test_directory_structure, monkeypatch):
+    """Test that tree-walking rules are served by a single directory walk."""
+    import os
+    from vfxvox_pipeline_utils.shotlint import rules as rules_module
+    
+    structure = {
+        "seq_010": {
+            "shot_010": {
+                "comp": {
+                    "shot_010_comp.0001.exr": ""
+                }
+            }
+        }
+    }
+    
+    root = create_test_directory_structure(structure)
+    engine = RuleEngine(root)
+    
+    rules = [
+        {"name": "Structure", "type": "path_pattern", "pattern": "seq_{seq}/shot_{shot}/render",
+         "vars": {"seq": r"\d{3}", "shot": r"\d{3}"}},
+        {"name": "EXR naming", "type": "filename_regex", "regex": r"^shot_\d{3}_comp\.\d{4}\.exr$"},
+        {"name": "Bad regex", "type": "filename_regex", "regex": "[invalid"},
+    ]
+    
+    listed = []
+    original_scandir = os.scandir
+    
+    def counting_scandir(path):
+        listed.append(path)
+        return original_scandir(path)
+    
+    monkeypatch.setattr(rules_module.os, "scandir", counting_scandir)
+    
+    issues = engine.execute_all(rules)
+    
+    # Each of the four directories is listed once, not once per rule
+    assert len(listed) == 4
+    assert [issue.category for issue in issues] == ["path_pattern", "filename_regex"]
+    assert issues[0].message == "No path matched pattern 'seq_{seq}/shot_{shot}/render'"
+    assert "Invalid regex" in issues[1].message
+
+
+@pytest.mark.unit
+def test_must_exist_rules_checked_in_one_pass(create_test_directory_structure, monkeypatch):
+    """Test must_exist globs sharing a prefix list each directory once."""
+    import os
+    from vfxvox_pipeline_utils.shotlint import rules as rules_module
+    
+    structure = {
+        "seq_010": {
+            "shot_010": {"comp": None, "plate": None},
+            "shot_020": {"comp": None},
+        }
+    }
+    
+    root = create_test_directory_structure(structure)
+    engine = RuleEngine(root)
+    
+    rules = [
+        {"name": "Comp", "type": "must_exist", "glob": "seq_*/shot_*/comp"},
+        {"name": "Plate", "type": "must_exist", "glob": "seq_*/shot_*/plate"},
+        {"name": "Roto", "type": "must_exist", "glob": "seq_*/shot_*/roto"},
+    ]
+    
+    listed = []
+    original_scandir = os.scandir
+    
+    def counting_scandir(path):
+        listed.append(path)
+        return original_scandir(path)
+    
+    monkeypatch.setattr(rules_module.os, "scandir", counting_scandir)
+    
+    issues = engine.execute_all(rules)
+    
+    # The root and seq_010 are listed once for all three globs
+    assert len(listed) == 2
+    assert [issue.message for issue in issues] == ["No matches for glob: seq_*/shot_*/roto"]
+    assert issues[0].category == "must_exist"
@@ -15,7 +15,7 @@ def test_plugin_loader_initialization():
 
 
 @pytest.mark.unit
-def test_load_plugin_with_function_spec(temp_dir):
+def test_load_plugin_with_function_spec(plugin_dir):
     """Test loading plugin with module:function specification."""
     # Create a test plugin module
     plugin_code = '''
@@ -24,25 +24,18 @@ def custom_validator(context):
     return []
 '''
     
-    plugin_file = temp_dir / "test_plugin.py"
+    plugin_file = plugin_dir / "test_plugin.py"
     plugin_file.write_text(plugin_code)
     
     loader = PluginLoader()
     
-    # Add temp_dir to sys.path temporarily
-    import sys
-    sys.path.insert(0, str(temp_dir))
-    
-    try:
-        plugin = loader.load_plugin("test_plugin:custom_validator")
-        assert plugin is not None
-        assert callable(plugin)
-    finally:
-        sys.path.remove(str(temp_dir))
+    plugin = loader.load_plugin("test_plugin:custom_validator")
+    assert plugin is not None
+    assert callable(plugin)
 
 
 @pytest.mark.unit
-def test_load_plugin_with_module_spec(temp_dir):
+def test_load_plugin_with_module_spec(plugin_dir):
     """Test loading plugin with module specification (uses validate function)."""
     # Create a test plugin module with validate function
     plugin_code = '''
@@ -51,20 +44,14 @@ def validate(context):
     return []
 '''
     
-    plugin_file = temp_dir / "test_plugin2.py"
+    plugin_file = plugin_dir / "test_plugin2.py"
     plugin_file.write_text(plugin_code)
     
     loader = PluginLoader()
     
-    import sys
-    sys.path.insert(0, str(temp_dir))
-    
-    try:
-        plugin = loader.load_plugin("test_plugin2")
-        assert plugin is not None
-        assert callable(plugin)
-    finally:
-        sys.path.remove(str(temp_dir))
+    plugin = loader.load_plugin("test_plugin2")
+    assert plugin is not None
+    assert callable(plugin)
 
 
 @pytest.mark.unit
@@ -77,7 +64,7 @@ def test_load_nonexistent_plugin():
 
 
 @pytest.mark.unit
-def test_execute_plugin_with_valid_results(temp_dir):
+def test_execute_plugin_with_valid_results(temp_dir, plugin_dir):
     """Test executing plugin that returns valid results."""
     plugin_code = '''
 def custom_validator(context):
@@ -92,33 +79,27 @@ def custom_validator(context):
     ]
 '''
     
-    plugin_file = temp_dir / "test_plugin3.py"
+    plugin_file = plugin_dir / "test_plugin3.py"
     plugin_file.write_text(plugin_code)
     
     loader = PluginLoader()
     
-    import sys
-    sys.path.insert(0, str(temp_dir))
+    plugin = loader.load_plugin("test_plugin3:custom_validator")
     
-    try:
-        plugin = loader.load_plugin("test_plugin3:custom_validator")
-        
-        context = {
-            "root": temp_dir,
-            "options": {}
-        }
-        
-        results = loader.execute_plugin(plugin, context)
-        
-        assert len(results) == 1
-        assert results[0]["rule"] == "custom_check"
-        assert results[0]["level"] == "warning"
-    finally:
-        sys.path.remove(str(temp_dir))
+    context = {
+        "root": temp_dir,
+        "options": {}
+    }
+    
+    results = loader.execute_plugin(plugin, context)
+    
+    assert len(results) == 1
+    assert results[0]["rule"] == "custom_check"
+    assert results[0]["level"] == "warning"
 
 
 @pytest.mark.unit
-def test_execute_plugin_with_exception(temp_dir):
+def test_execute_plugin_with_exception(temp_dir, plugin_dir):
     """Test executing plugin that raises exception."""
     plugin_code = '''
 def failing_validator(context):
@@ -126,33 +107,27 @@ def failing_validator(context):
     raise ValueError("Plugin error")
 '''
     
-    plugin_file = temp_dir / "test_plugin4.py"
+    plugin_file = plugin_dir / "test_plugin4.py"
     plugin_file.write_text(plugin_code)
     
     loader = PluginLoader()
     
-    import sys
-    sys.path.insert(0, str(temp_dir))
+    plugin = loader.load_plugin("test_plugin4:failing_validator")
     
-    try:
-        plugin = loader.load_plugin("test_plugin4:failing_validator")
-        
-        context = {
-            "root": temp_dir,
-            "options": {}
-        }
-        
-        # Plugin errors should be caught and handled gracefully
-        results = loader.execute_plugin(plugin, context)
-        
-        # Should return empty list or error result
-        assert isinstance(results, list)
-    finally:
-        sys.path.remove(str(temp_dir))
+    context = {
+        "root": temp_dir,
+        "options": {}
+    }
+    
+    # Plugin errors should be caught and handled gracefully
+    results = loader.execute_plugin(plugin, context)
+    
+    # Should return empty list or error result
+    assert isinstance(results, list)
 
 
 @pytest.mark.integration
-def test_plugin_rule_integration(temp_dir, create_test_directory_structure):
+def test_plugin_rule_integration(plugin_dir, create_test_directory_structure):
     """Test PluginRule integration with validator."""
     # Create test plugin
     plugin_code = '''
@@ -174,7 +149,7 @@ def check_metadata(context):
     return issues
 '''
     
-    plugin_file = temp_dir / "metadata_plugin.py"
+    plugin_file = plugin_dir / "metadata_plugin.py"
     plugin_file.write_text(plugin_code)
     
     # Create test structure without metadata
@@ -186,29 +161,23 @@ def check_metadata(context):
     
     test_dir = create_test_directory_structure(structure)
     
-    import sys
-    sys.path.insert(0, str(temp_dir))
+    rule_config = {
+        "name": "Metadata check",
+        "type": "plugin",
+        "module": "metadata_plugin:check_metadata",
+        "level": "warning",
+        "options": {}
+    }
     
-    try:
-        rule_config = {
-            "name": "Metadata check",
-            "type": "plugin",
-            "module": "metadata_plugin:check_metadata",
-            "level": "warning",
-            "options": {}
-        }
-        
-        rule = PluginRule()
-        issues = rule.check(test_dir, rule_config)
-        
-        assert len(issues) > 0
-        assert any("metadata" in issue.message.lower() for issue in issues)
-    finally:
-        sys.path.remove(str(temp_dir))
+    rule = PluginRule()
+    issues = rule.check(test_dir, rule_config)
+    
+    assert len(issues) > 0
+    assert any("metadata" in issue.message.lower() for issue in issues)
 
 
 @pytest.mark.unit
-def test_plugin_with_options(temp_dir):
+def test_plugin_with_options(temp_dir, plugin_dir):
     """Test plugin receives and uses options."""
     plugin_code = '''
 def configurable_validator(context):
@@ -228,27 +197,41 @@ def configurable_validator(context):
     return issues
 '''
     
-    plugin_file = temp_dir / "test_plugin5.py"
+    plugin_file = plugin_dir / "test_plugin5.py"
     plugin_file.write_text(plugin_code)
     
     loader = PluginLoader()
     
-    import sys
-    sys.path.insert(0, str(temp_dir))
-    
-    try:
-        plugin = loader.load_plugin("test_plugin5:configurable_validator")
-        
-        context = {
-            "root": temp_dir,
-            "options": {
-                "required_fields": ["artist", "date", "version"]
-            }
+    plugin = loader.load_plugin("test_plugin5:configurable_validator")
+    
+    context = {
+        "root": temp_dir,
+        "options": {
+            "required_fields": ["artist", "date", "version"]
         }
-        
-        results = loader.execute_plugin(plugin, context)
-        
-        assert len(results) == 3
-        assert all("Checking field:" in r["message"] for r in results)
-    finally:
-        sys.path.remove(str(temp_dir))
+    }
+    
+    results = loader.execute_plugin(plugin, context)
+    
+    assert len(results) == 3
+    assert all("Checking field:" in r["message"] for r in results)
+
+
+@pytest.mark.unit
+def test_load_plugin_caches_until_reload(plugin_dir):
+    """Test that plugins are cached and reload() picks up module changes."""
+    plugin_file = plugin_dir / "cached_plugin.py"
+    plugin_file.write_text("def validate(context):\n    return []\n")
+    
+    plugin = PluginLoader.load_plugin("cached_plugin")
+    assert PluginLoader.load_plugin("cached_plugin:validate") is plugin
+    
+    plugin_file.write_text(
+        "def validate(context):\n    return [{'level': 'info', 'message': 'reloaded'}]\n"
+    )
+    assert PluginLoader.load_plugin("cached_plugin") is plugin
+    
+    PluginLoader.reload()
+    reloaded = PluginLoader.load_plugin("cached_plugin")
+    assert reloaded is not plugin
+    assert reloaded({})[0]["message"] == "reloaded"
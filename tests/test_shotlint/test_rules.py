@@ -7,7 +7,10 @@ from vfxvox_pipeline_utils.shotlint.rules import (
     PathPatternRule,
     FilenameRegexRule,
     FrameSequenceRule,
-    MustExistRule
+    MustExistRule,
+    TreeVisitor,
+    iter_tree,
+    walk_tree,
 )
 
 
@@ -65,7 +68,25 @@ class TestPathPatternRule:
         issues = rule.check(root, rule_config)
         
         assert len(issues) > 0
-        assert any("pattern" in issue.message.lower() for issue in issues)
+        assert any(
+            (issue.details or {}).get("pattern") == rule_config["pattern"] for issue in issues
+        )
+    
+    def test_compiled_pattern_is_reused(self):
+        """Test equal patterns share one compiled regex whatever the vars order."""
+        rule = PathPatternRule()
+        
+        first = rule.compile({
+            "pattern": "seq_{sequence}/shot_{shot}",
+            "vars": {"sequence": r"\d{3}", "shot": r"\d{3}"}
+        })
+        second = rule.compile({
+            "pattern": "seq_{sequence}/shot_{shot}",
+            "vars": {"shot": r"\d{3}", "sequence": r"\d{3}"}
+        })
+        
+        assert first is second
+        assert first.match("seq_010/shot_020").group("shot") == "020"
     
     def test_path_pattern_with_multiple_levels(self, create_test_directory_structure):
         """Test path pattern with multiple directory levels."""
@@ -96,6 +117,31 @@ class TestPathPatternRule:
         issues = rule.check(root, rule_config)
         
         assert len(issues) == 0
+    
+    @pytest.mark.parametrize("pattern, vars_dict, expected", [
+        ("seq_{sequence}/shot_{shot}/comp", {"sequence": r"\d{3}", "shot": r"\d{3}"}, True),
+        ("seq_{sequence}/shot_{shot}", {"sequence": r"\d{3}", "shot": r"\d{3}"}, True),
+        ("seq_{sequence}/comp", {"sequence": r"\d{3}"}, False),
+        ("seq_{rest}/comp", {"rest": r".+"}, True),
+        ("seq_{rest}", {"rest": r"[^/]+/shot_\d{3}"}, True),
+    ])
+    def test_path_pattern_depth_filter(
+        self, create_test_directory_structure, pattern, vars_dict, expected
+    ):
+        """Test that skipping paths by depth never hides a real match."""
+        structure = {
+            "seq_010": {
+                "shot_010": {
+                    "comp": None
+                }
+            }
+        }
+        
+        root = create_test_directory_structure(structure)
+        
+        issues = PathPatternRule().check(root, {"pattern": pattern, "vars": vars_dict})
+        
+        assert (len(issues) == 0) is expected
 
 
 @pytest.mark.unit
@@ -174,6 +220,26 @@ class TestFilenameRegexRule:
         issues = rule.check(root, rule_config)
         
         assert len(issues) == 0
+    
+    @pytest.mark.parametrize("regex, expected", [
+        (r"^shot_\d{3}\.exr$", True),
+        (r"shot_\d{3}", True),
+        (r"s", True),
+        (r"^shot_\d{3}_comp_v\d{3}\.exr$", False),
+    ])
+    def test_filename_regex_length_filter(
+        self, create_test_directory_structure, regex, expected
+    ):
+        """Test that skipping names too short to match keeps prefix matches."""
+        structure = {
+            "shot_010.exr": ""
+        }
+        
+        root = create_test_directory_structure(structure)
+        
+        issues = FilenameRegexRule().check(root, {"regex": regex})
+        
+        assert (len(issues) == 0) is expected
 
 
 @pytest.mark.unit
@@ -238,8 +304,10 @@ class TestFrameSequenceRule:
         rule = FrameSequenceRule()
         issues = rule.check(root, rule_config)
         
-        assert len(issues) > 0
-        assert any("1003" in issue.message for issue in issues)
+        assert len(issues) == 1
+        assert issues[0].details["missing_count"] == 1
+        assert issues[0].details["missing_frames"] == [1003]
+        assert issues[0].details["missing_ranges"] == [[1003, 1003]]
     
     def test_frame_sequence_with_variables(self, create_test_directory_structure):
         """Test frame sequence with variable substitution."""
@@ -275,6 +343,68 @@ class TestFrameSequenceRule:
         issues = rule.check(root, rule_config)
         
         assert len(issues) == 0
+    
+    def test_missing_frames_reported_as_ranges(self, create_test_directory_structure):
+        """Test missing frames are collapsed into ranges and padding is respected."""
+        structure = {
+            "comp": {
+                "shot_010_comp.1001.exr": "",
+                "shot_010_comp.1005.exr": "",
+                "shot_010_comp.1007.exr": "",
+                "shot_010_comp.10000.exr": "",
+                # Too little padding to count as frame 1006
+                "shot_010_comp.106.exr": ""
+            }
+        }
+        
+        root = create_test_directory_structure(structure)
+        
+        rule_config = {
+            "folder": "comp",
+            "base": "shot_010_comp",
+            "ext": ".exr",
+            "start": 1001,
+            "end": 1007,
+            "padding": 4
+        }
+        
+        issues = FrameSequenceRule().check(root, rule_config)
+        
+        assert len(issues) == 1
+        assert issues[0].message == "Missing frames: 1002-1004, 1006"
+        assert issues[0].details["missing_ranges"] == [[1002, 1004], [1006, 1006]]
+        assert issues[0].details["missing_count"] == 4
+        assert issues[0].details["missing_frames"] == [1002, 1003, 1004, 1006]
+        assert issues[0].details["found_count"] == 4
+    
+    @pytest.mark.parametrize("folder, expected_message", [
+        ("missing", "Folder missing"),
+        ("comp/shot_010_comp.1001.exr", "not a directory"),
+    ])
+    def test_frame_sequence_folder_errors(
+        self, create_test_directory_structure, folder, expected_message
+    ):
+        """Test frame sequence reports missing folders and non-directories."""
+        structure = {
+            "comp": {
+                "shot_010_comp.1001.exr": ""
+            }
+        }
+        
+        root = create_test_directory_structure(structure)
+        
+        rule_config = {
+            "folder": folder,
+            "base": "shot_010_comp",
+            "ext": ".exr",
+            "start": 1001,
+            "end": 1001
+        }
+        
+        issues = FrameSequenceRule().check(root, rule_config)
+        
+        assert len(issues) == 1
+        assert expected_message in issues[0].message
 
 
 @pytest.mark.unit
@@ -328,7 +458,9 @@ class TestMustExistRule:
         issues = rule.check(root, rule_config)
         
         assert len(issues) > 0
-        assert any("plate" in issue.message.lower() for issue in issues)
+        assert any(
+            (issue.details or {}).get("glob") == "seq_*/shot_*/plate" for issue in issues
+        )
     
     def test_must_exist_with_file_pattern(self, create_test_directory_structure):
         """Test must_exist rule with file pattern."""
@@ -352,3 +484,144 @@ class TestMustExistRule:
         issues = rule.check(root, rule_config)
         
         assert len(issues) == 0
+    
+    @pytest.mark.parametrize("glob_pattern, expected", [
+        ("**/comp", True),
+        ("seq_010/**/*.exr", True),
+        ("seq_*/shot_*/comp/*.exr", False),
+        ("*/shot_020", False),
+        (".cache/shot_020", True),
+    ])
+    def test_must_exist_matches_glob_semantics(
+        self, create_test_directory_structure, glob_pattern, expected
+    ):
+        """Test the segment walk follows glob's recursive and hidden-entry rules."""
+        structure = {
+            ".cache": {
+                "shot_020": None
+            },
+            "seq_010": {
+                "shot_010": {
+                    "comp": None,
+                    "plate": {
+                        "plate.1001.exr": ""
+                    }
+                }
+            }
+        }
+        
+        root = create_test_directory_structure(structure)
+        
+        issues = MustExistRule().check(root, {"glob": glob_pattern})
+        
+        assert (len(issues) == 0) is expected
+
+    def test_check_batch_matches_single_checks(self, create_test_directory_structure):
+        """Test that checking globs together gives the same result as one by one."""
+        structure = {
+            ".cache": {
+                "shot_020": None
+            },
+            "seq_010": {
+                "shot_010": {
+                    "comp": None,
+                    "plate": {
+                        "plate.1001.exr": ""
+                    },
+                    "shot_info.yaml": "metadata: test"
+                },
+                "shot_020": {
+                    "comp": None
+                }
+            }
+        }
+        root = create_test_directory_structure(structure)
+        rules = [
+            {"glob": pattern} for pattern in [
+                "seq_*/shot_*/comp",
+                "seq_*/shot_*/plate",
+                "seq_*/shot_*/plate/*.exr",
+                "seq_*/shot_*/plate/*.dpx",
+                "seq_*/shot_020/plate",
+                "seq_010/shot_010/shot_info.yaml",
+                "seq_010/shot_010/shot_info.yaml/x",
+                "*/shot_020",
+                ".cache/shot_020",
+                "seq_010/**/*.exr",
+            ]
+        ]
+        rule = MustExistRule()
+
+        results = rule.check_batch(root, rules)
+
+        # ** globs are left to check()
+        assert id(rules[-1]) not in results
+        for config in rules[:-1]:
+            assert len(results[id(config)]) == len(rule.check(root, config)), config["glob"]
+
+
+class _CollectingVisitor(TreeVisitor):
+    """Records every path it is fed."""
+
+    def __init__(self):
+        self.paths = []
+
+    def visit(self, rel_path, entry):
+        self.paths.append(rel_path)
+
+    def finalize(self):
+        return []
+
+
+@pytest.mark.unit
+class TestWalkTree:
+    """Tests for the shared directory walk."""
+
+    @pytest.mark.parametrize("max_workers", [0, 1, 4])
+    def test_walk_visits_every_entry(self, create_test_directory_structure, max_workers):
+        """Test that serial and threaded walks see the same entries."""
+        structure = {
+            "seq_010": {"shot_010": {"comp": {"a.exr": ""}}, "shot_020": {}},
+            "seq_020": {"shot_010": {"plate": {"b.exr": ""}}},
+            "seq_030": {},
+            "notes.txt": "",
+        }
+        root = create_test_directory_structure(structure)
+        visitor = _CollectingVisitor()
+
+        walk_tree(root, [visitor], max_workers=max_workers)
+
+        assert sorted(visitor.paths) == [
+            "notes.txt",
+            "seq_010",
+            "seq_010/shot_010",
+            "seq_010/shot_010/comp",
+            "seq_010/shot_010/comp/a.exr",
+            "seq_010/shot_020",
+            "seq_020",
+            "seq_020/shot_010",
+            "seq_020/shot_010/plate",
+            "seq_020/shot_010/plate/b.exr",
+            "seq_030",
+        ]
+
+    def test_iter_tree_streams_entries(self, create_test_directory_structure):
+        """Test that iter_tree yields every entry lazily with its relative path."""
+        structure = {
+            "seq_010": {"shot_010": {"comp": {"a.exr": ""}}},
+            "notes.txt": "",
+        }
+        root = create_test_directory_structure(structure)
+
+        entries = iter_tree(root)
+        first_path, first_entry = next(entries)
+        rest = [rel_path for rel_path, _ in entries]
+
+        assert first_entry.name == first_path.rsplit("/", 1)[-1]
+        assert sorted([first_path] + rest) == [
+            "notes.txt",
+            "seq_010",
+            "seq_010/shot_010",
+            "seq_010/shot_010/comp",
+            "seq_010/shot_010/comp/a.exr",
+        ]
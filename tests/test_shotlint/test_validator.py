@@ -102,6 +102,36 @@ rules:
     assert rules[0]["type"] == "path_pattern"
 
 
+@pytest.mark.unit
+def test_load_rules_cached_until_file_changes(temp_dir, monkeypatch):
+    """Test that an unchanged rules file is only parsed once."""
+    validator = ShotLintValidator()
+    rules_file = temp_dir / "cached_rules.yaml"
+    rules_file.write_text("rules:\n  - name: first\n    type: must_exist\n")
+
+    calls = []
+    real_load = yaml.load
+
+    def counting_load(stream, Loader):
+        calls.append(stream)
+        return real_load(stream, Loader=Loader)
+
+    monkeypatch.setattr(yaml, "load", counting_load)
+
+    first = validator.load_rules(rules_file)
+    first[0]["name"] = "mutated"
+    second = validator.load_rules(rules_file)
+
+    assert len(calls) == 1
+    assert second[0]["name"] == "first"
+
+    rules_file.write_text("rules:\n  - name: second rule\n    type: must_exist\n")
+    third = validator.load_rules(rules_file)
+
+    assert len(calls) == 2
+    assert third[0]["name"] == "second rule"
+
+
 @pytest.mark.integration
 def test_validate_valid_directory_structure(create_test_directory_structure, temp_dir):
     """Test validation passes with valid directory structure."""
@@ -197,3 +227,78 @@ def test_validate_with_file_instead_of_directory(temp_dir):
         validator.validate(test_file, rules_file)
     
     assert "not a directory" in str(exc_info.value).lower()
+
+
+@pytest.mark.unit
+def test_validate_parsed_rules(temp_dir):
+    """Test validation against already-loaded rules."""
+    validator = ShotLintValidator()
+    test_dir = temp_dir / "test_project"
+    (test_dir / "shots").mkdir(parents=True)
+    
+    rules = [
+        {"name": "Shots folder", "type": "must_exist", "glob": "shots"}
+    ]
+    
+    result = validator.validate_parsed(test_dir, rules, rules_source="inline")
+    
+    assert result.passed
+    assert result.metadata["rules_file"] == "inline"
+    assert result.metadata["rule_count"] == 1
+
+
+@pytest.mark.unit
+def test_validate_parsed_with_nonexistent_directory(temp_dir):
+    """Test validate_parsed fails gracefully with nonexistent directory."""
+    validator = ShotLintValidator()
+    
+    with pytest.raises(FileNotFoundError):
+        validator.validate_parsed(temp_dir / "nonexistent", [])
+
+
+@pytest.mark.unit
+def test_rules_cache_file_skips_yaml_parse(temp_dir, monkeypatch):
+    """Test that the .yamlc rules cache is written, reused and refreshed."""
+    from vfxvox_pipeline_utils.core.config import Config
+    from vfxvox_pipeline_utils.shotlint import validator as validator_module
+    
+    config = Config.from_dict({"shotlint": {"rules_cache": True}})
+    validator = ShotLintValidator(config)
+    rules_file = temp_dir / "studio_rules.yaml"
+    rules_file.write_text("rules:\n  - name: first\n    type: must_exist\n")
+    
+    calls = []
+    real_load = yaml.load
+    
+    def counting_load(stream, Loader):
+        calls.append(stream)
+        return real_load(stream, Loader=Loader)
+    
+    monkeypatch.setattr(yaml, "load", counting_load)
+    
+    assert validator.load_rules(rules_file)[0]["name"] == "first"
+    assert (temp_dir / "studio_rules.yamlc").exists()
+    
+    # A fresh process only has the file cache to go on
+    validator_module._load_rules_cached.cache_clear()
+    assert validator.load_rules(rules_file)[0]["name"] == "first"
+    assert len(calls) == 1
+    
+    rules_file.write_text("rules:\n  - name: second rule\n    type: must_exist\n")
+    assert validator.load_rules(rules_file)[0]["name"] == "second rule"
+    assert len(calls) == 2
+
+
+@pytest.mark.unit
+def test_failed_rules_cache_write_leaves_no_temp_file(temp_dir, monkeypatch):
+    """Test that a rules cache write failing after the temp file is opened cleans it up."""
+    from vfxvox_pipeline_utils.shotlint import validator as validator_module
+    
+    def failing_replace(src, dst):
+        raise OSError("read-only")
+    
+    monkeypatch.setattr(validator_module.os, "replace", failing_replace)
+    
+    validator_module._write_rules_cache(str(temp_dir / "rules.yamlc"), 1, 2, [{"name": "first"}])
+    
+    assert list(temp_dir.iterdir()) == []
@@ -0,0 +1,48 @@
+"""Tests for USD linter helpers."""
+
+import pytest
+
+from vfxvox_pipeline_utils.usd.linter import USD_EXTENSIONS, iter_usd_files
+
+
+@pytest.mark.unit
+def test_iter_usd_files_finds_nested_files(temp_dir):
+    """Test that USD files are found at every depth."""
+    (temp_dir / "assets" / "hero" / "model").mkdir(parents=True)
+    (temp_dir / "assets" / "hero" / "model" / "hero.usd").touch()
+    (temp_dir / "assets" / "hero" / "look.usda").touch()
+    (temp_dir / "assets" / "prop.usdc").touch()
+    (temp_dir / "assets" / "prop.usdz").touch()
+    (temp_dir / "assets" / "notes.txt").touch()
+    
+    found = sorted(p.name for p in iter_usd_files(temp_dir))
+    
+    assert found == ["hero.usd", "look.usda", "prop.usdc", "prop.usdz"]
+
+
+@pytest.mark.unit
+def test_iter_usd_files_with_extensions(temp_dir):
+    """Test restricting the walk to specific extensions."""
+    (temp_dir / "a.usd").touch()
+    (temp_dir / "b.usdz").touch()
+    
+    found = [p.name for p in iter_usd_files(temp_dir, (".usd",))]
+    
+    assert found == ["a.usd"]
+
+
+@pytest.mark.unit
+def test_iter_usd_files_ignores_usd_named_directories(temp_dir):
+    """Test that directories with USD-like names are descended, not yielded."""
+    (temp_dir / "cache.usd").mkdir()
+    (temp_dir / "cache.usd" / "inner.usda").touch()
+    
+    found = [p.name for p in iter_usd_files(temp_dir)]
+    
+    assert found == ["inner.usda"]
+
+
+@pytest.mark.unit
+def test_usd_extensions():
+    """Test the recognised USD extensions."""
+    assert USD_EXTENSIONS == {".usd", ".usda", ".usdc", ".usdz"}
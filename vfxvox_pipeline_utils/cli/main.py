@@ -1,5 +1,6 @@
 """Main CLI entry point for VFXVox Pipeline Utils."""
 
+import importlib
 import sys
 import click
 from vfxvox_pipeline_utils import __version__
@@ -12,7 +13,72 @@ if "--no-logo" not in sys.argv and "--version" not in sys.argv:
     click.echo()
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """Click group that imports subcommands only when they are used.
+
+    Each subcommand module pulls in its validator stack (PyYAML, Pillow,
+    USD bindings), so importing them all up front makes ``--help`` and
+    ``--version`` slow. Subcommands are registered by import path and
+    short help instead, and loaded on first lookup.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        """Initialize group.
+
+        Args:
+            lazy_subcommands: Mapping of command name to
+                ("module:attribute", short help) tuples
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            import_path, _ = self.lazy_subcommands[cmd_name]
+            module_name, attr = import_path.split(":")
+            module = importlib.import_module(module_name)
+            self.add_command(getattr(module, attr), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        # List commands from their registered short help so that --help
+        # doesn't import every subcommand module
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.commands:
+                command = self.commands[name]
+                if command.hidden:
+                    continue
+                help_text = command.get_short_help_str(formatter.width)
+            else:
+                help_text = self.lazy_subcommands[name][1]
+            rows.append((name, help_text))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "shotlint": (
+            "vfxvox_pipeline_utils.cli.shotlint_cmd:shotlint_command",
+            "Validate directory structure against rules.",
+        ),
+        "validate-sequence": (
+            "vfxvox_pipeline_utils.cli.sequence_cmd:validate_sequence_command",
+            "Validate an image sequence for missing or corrupted frames.",
+        ),
+        "lint-usd": (
+            "vfxvox_pipeline_utils.cli.usd_cmd:lint_usd_command",
+            "Lint a USD file for issues and best practices.",
+        ),
+    },
+)
 @click.version_option(version=__version__)
 @click.option("--config", type=click.Path(), help="Configuration file path")
 @click.option("--log-level", default="INFO", help="Logging level")
@@ -41,15 +107,5 @@ def cli(ctx, config, log_level, no_logo):
     ctx.obj["log_level"] = log_level
 
 
-# Register commands
-from .shotlint_cmd import shotlint_command
-from .sequence_cmd import validate_sequence_command
-from .usd_cmd import lint_usd_command
-
-cli.add_command(shotlint_command)
-cli.add_command(validate_sequence_command)
-cli.add_command(lint_usd_command)
-
-
 if __name__ == "__main__":
     cli()
@@ -79,33 +79,26 @@ def validate_sequence_command(ctx, pattern, format, report, check_resolution, ch
         logger.info(f"Validating sequence: {pattern}")
         result = validator.validate(pattern)
 
-        # Format output
-        if format == "json":
-            output = reporters.render_json(result)
+        # Format output, streaming straight into the report file if given
+        if report:
+            with open(report, 'w', encoding='utf-8') as f:
+                if format == "json":
+                    reporters.render_json(result, stream=f)
+                elif format == "yaml":
+                    reporters.render_yaml(result, stream=f)
+                elif format == "md":
+                    reporters.render_markdown(result, stream=f)
+                else:  # console
+                    reporters.render_console(result, f)
+            logger.info(f"Report written to: {report}")
+        elif format == "json":
+            print(reporters.render_json(result))
         elif format == "yaml":
-            output = reporters.render_yaml(result)
+            print(reporters.render_yaml(result))
         elif format == "md":
-            output = reporters.render_markdown(result)
+            print(reporters.render_markdown(result))
         else:  # console
-            if report:
-                # For console format with file output, render to string
-                import io
-                stream = io.StringIO()
-                reporters.render_console(result, stream)
-                output = stream.getvalue()
-            else:
-                # Render directly to stdout
-                reporters.render_console(result, sys.stdout)
-                output = None
-
-        # Write to file if specified
-        if report and output:
-            with open(report, 'w', encoding='utf-8') as f:
-                f.write(output)
-            logger.info(f"Report written to: {report}")
-        elif output:
-            # Print to stdout for non-console formats
-            print(output)
+            reporters.render_console(result, sys.stdout)
 
         # Determine exit code
         exit_code = 0
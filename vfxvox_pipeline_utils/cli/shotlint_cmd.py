@@ -6,6 +6,7 @@ from pathlib import Path
 
 from vfxvox_pipeline_utils.shotlint import ShotLintValidator
 from vfxvox_pipeline_utils.shotlint import reporters
+from vfxvox_pipeline_utils.core.config import Config
 from vfxvox_pipeline_utils.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -36,8 +37,19 @@ logger = get_logger(__name__)
     default="error",
     help="Exit code policy: fail on errors, warnings, or never fail"
 )
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=0),
+    default=1,
+    help="Threads walking the directory tree (1 walks serially, 0 picks a default)"
+)
+@click.option(
+    "--rules-cache",
+    is_flag=True,
+    help="Cache parsed rules in a .yamlc file next to the rules file"
+)
 @click.pass_context
-def shotlint_command(ctx, directory, rules, format, report, fail_on):
+def shotlint_command(ctx, directory, rules, format, report, fail_on, jobs, rules_cache):
     """Validate directory structure against rules.
 
     Validates VFX project directory structures using declarative YAML rules.
@@ -59,39 +71,35 @@ def shotlint_command(ctx, directory, rules, format, report, fail_on):
     """
     try:
         # Create validator
-        validator = ShotLintValidator()
+        config = Config.from_dict({
+            "shotlint": {"walk_workers": jobs, "rules_cache": rules_cache}
+        })
+        validator = ShotLintValidator(config)
 
         # Run validation
         logger.info(f"Validating directory: {directory}")
         result = validator.validate(Path(directory), Path(rules))
 
-        # Format output
-        if format == "json":
-            output = reporters.render_json(result)
+        # Format output, streaming straight into the report file if given
+        if report:
+            with open(report, 'w', encoding='utf-8') as f:
+                if format == "json":
+                    reporters.render_json(result, stream=f)
+                elif format == "yaml":
+                    reporters.render_yaml(result, stream=f)
+                elif format == "md":
+                    reporters.render_markdown(result, stream=f)
+                else:  # console
+                    reporters.render_console(result, f)
+            logger.info(f"Report written to: {report}")
+        elif format == "json":
+            print(reporters.render_json(result))
         elif format == "yaml":
-            output = reporters.render_yaml(result)
+            print(reporters.render_yaml(result))
         elif format == "md":
-            output = reporters.render_markdown(result)
+            print(reporters.render_markdown(result))
         else:  # console
-            if report:
-                # For console format with file output, render to string
-                import io
-                stream = io.StringIO()
-                reporters.render_console(result, stream)
-                output = stream.getvalue()
-            else:
-                # Render directly to stdout
-                reporters.render_console(result, sys.stdout)
-                output = None
-
-        # Write to file if specified
-        if report and output:
-            with open(report, 'w', encoding='utf-8') as f:
-                f.write(output)
-            logger.info(f"Report written to: {report}")
-        elif output:
-            # Print to stdout for non-console formats
-            print(output)
+            reporters.render_console(result, sys.stdout)
 
         # Determine exit code based on fail-on policy
         exit_code = 0
@@ -4,8 +4,6 @@ import sys
 import click
 from pathlib import Path
 
-from vfxvox_pipeline_utils.usd import USDLinter
-from vfxvox_pipeline_utils.usd import reporters
 from vfxvox_pipeline_utils.core.config import Config
 from vfxvox_pipeline_utils.core.logging import get_logger
 
@@ -73,6 +71,11 @@ def lint_usd_command(ctx, filepath, config, format, report, check_references, ch
         vfxvox lint-usd asset.usd --no-check-performance
     """
     try:
+        # Imported here so the USD stack only loads when actually linting;
+        # the ImportError handler below covers missing bindings
+        from vfxvox_pipeline_utils.usd import USDLinter
+        from vfxvox_pipeline_utils.usd import reporters
+
         # Create config with options
         config_dict = {
             "usd": {
@@ -88,36 +91,29 @@ def lint_usd_command(ctx, filepath, config, format, report, check_references, ch
         linter = USDLinter(config_obj)
 
         # Run linting
-        logger.info(f"Linting USD file: {filepath}")
+        logger.info("Linting USD file: %s", filepath)
         result = linter.validate(Path(filepath))
 
-        # Format output
-        if format == "json":
-            output = reporters.render_json(result)
+        # Format output, streaming straight into the report file if given
+        if report:
+            with open(report, 'w', encoding='utf-8') as f:
+                if format == "json":
+                    reporters.render_json(result, stream=f)
+                elif format == "yaml":
+                    reporters.render_yaml(result, stream=f)
+                elif format == "md":
+                    reporters.render_markdown(result, stream=f)
+                else:  # console
+                    reporters.render_console(result, f)
+            logger.info("Report written to: %s", report)
+        elif format == "json":
+            print(reporters.render_json(result))
         elif format == "yaml":
-            output = reporters.render_yaml(result)
+            print(reporters.render_yaml(result))
         elif format == "md":
-            output = reporters.render_markdown(result)
+            print(reporters.render_markdown(result))
         else:  # console
-            if report:
-                # For console format with file output, render to string
-                import io
-                stream = io.StringIO()
-                reporters.render_console(result, stream)
-                output = stream.getvalue()
-            else:
-                # Render directly to stdout
-                reporters.render_console(result, sys.stdout)
-                output = None
-
-        # Write to file if specified
-        if report and output:
-            with open(report, 'w', encoding='utf-8') as f:
-                f.write(output)
-            logger.info(f"Report written to: {report}")
-        elif output:
-            # Print to stdout for non-console formats
-            print(output)
+            reporters.render_console(result, sys.stdout)
 
         # Determine exit code
         exit_code = 0
@@ -127,7 +123,7 @@ def lint_usd_command(ctx, filepath, config, format, report, check_references, ch
             exit_code = 2
 
         if exit_code != 0:
-            logger.warning(f"Linting failed with exit code {exit_code}")
+            logger.warning("Linting failed with exit code %s", exit_code)
 
         sys.exit(exit_code)
 
@@ -140,6 +136,6 @@ def lint_usd_command(ctx, filepath, config, format, report, check_references, ch
         )
         sys.exit(3)
     except Exception as e:
-        logger.error(f"USD linting command failed: {e}", exc_info=True)
+        logger.error("USD linting command failed: %s", e, exc_info=True)
         click.echo(f"Error: {e}", err=True)
         sys.exit(3)  # Exit code 3 for execution failure
@@ -9,6 +9,7 @@ from .exceptions import (
     ConfigurationError,
 )
 from .config import Config
+from .frames import iter_frame_ranges, format_frame_ranges
 from .logging import setup_logging, get_logger, reset_logging
 
 __all__ = [
@@ -21,6 +22,8 @@ __all__ = [
     "InvalidFormatError",
     "ConfigurationError",
     "Config",
+    "iter_frame_ranges",
+    "format_frame_ranges",
     "setup_logging",
     "get_logger",
     "reset_logging",
@@ -0,0 +1,51 @@
+"""JSON output for the validators' reporters."""
+
+import json
+from typing import Optional, TextIO
+
+# Optional C JSON encoder, several times faster on large reports
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dump_json(data: dict, stream: Optional[TextIO] = None) -> Optional[str]:
+    """Serialize a report dictionary to indented JSON.
+
+    Uses orjson when it is installed and can encode the data, and the
+    standard library otherwise. Both write the same text, with non-ASCII
+    characters as UTF-8 rather than escapes, except for non-finite
+    floats: orjson writes NaN and infinities as null, the standard
+    library as NaN and Infinity.
+
+    Args:
+        data: Report dictionary
+        stream: Optional text stream to write to instead of returning a
+            string
+
+    Returns:
+        JSON string, or None when written to ``stream``
+    """
+    text = None
+    if ORJSON_AVAILABLE:
+        try:
+            text = orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            # JSONEncodeError, e.g. for integers beyond 64 bits
+            pass
+
+    if text is None:
+        # Stdlib fallback, streamed so the report isn't built up in memory
+        if stream is not None:
+            json.dump(data, stream, indent=2, ensure_ascii=False)
+            return None
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
+    if stream is not None:
+        stream.write(text)
+        return None
+    return text
@@ -0,0 +1,12 @@
+"""YAML loading shared by the configuration and rules loaders."""
+
+from typing import Type, Union
+
+import yaml
+
+# Prefer the libyaml-backed loader; the pure-Python one is several times slower
+YamlLoader: Type[Union["yaml.CSafeLoader", yaml.SafeLoader]]
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    YamlLoader = yaml.SafeLoader
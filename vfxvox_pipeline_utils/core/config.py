@@ -1,12 +1,41 @@
 """Configuration management for VFXVox Pipeline Utils."""
 
-import yaml
+import copy
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional, Dict
 
 
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Dict:
+    """Parse a YAML configuration file, once per version of the file.
+
+    Args:
+        path_str: Path to YAML file
+        mtime_ns: Modification time of the file, part of the cache key
+        size: Size of the file, part of the cache key
+
+    Returns:
+        Configuration dictionary; callers must not modify it
+    """
+    # Imported here so the default, file-less config never loads PyYAML
+    import yaml
+    from ._yaml import YamlLoader
+
+    # Read as bytes: libyaml decodes UTF-8 itself, in C
+    with open(path_str, "rb") as f:
+        return yaml.load(f, Loader=YamlLoader) or {}
+
+
 class Config:
-    """Manages configuration loading and access."""
+    """Manages configuration loading and access.
+
+    Lookups go through a flattened copy of the nested dictionaries, built
+    on first use. A Config keeps its own copy of the data it was given.
+    Sections are returned as they are, so once one has been handed out the
+    flattened copy may be stale, and lookups walk the dictionaries instead.
+    """
 
     def __init__(self, config_path: Optional[Path] = None):
         """Load configuration from file or use defaults.
@@ -14,11 +43,34 @@ class Config:
         Args:
             config_path: Path to YAML configuration file
         """
-        self._config = self._load_default_config()
+        config = self._load_default_config()
+
+        if config_path:
+            # A missing file means defaults only; _load_yaml's stat tells us
+            # that without a separate exists() check
+            try:
+                user_config = self._load_yaml(config_path)
+            except (FileNotFoundError, NotADirectoryError):
+                user_config = None
+            if user_config is not None:
+                config = self._merge_configs(config, user_config)
+
+        self._init_state(config)
+
+    def _init_state(self, config: Dict) -> None:
+        """Set up the instance around its configuration dictionary.
 
-        if config_path and Path(config_path).exists():
-            user_config = self._load_yaml(config_path)
-            self._config = self._merge_configs(self._config, user_config)
+        Shared by __init__() and from_dict(), which skips __init__().
+
+        Args:
+            config: Configuration dictionary, owned by this instance
+        """
+        self._config = config
+        # Dotted key -> value for every section and leaf of _config
+        self._flat: Dict[str, Any] = {}
+        self._flat_source: Optional[Dict] = None
+        # Set once get() has returned a section that callers may edit
+        self._sections_shared = False
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by key.
@@ -27,13 +79,40 @@ class Config:
             key: Configuration key (supports dot notation like 'sequences.check_resolution')
             default: Default value if key not found
 
+        Returns:
+            Configuration value or default. Sections are returned as the
+            dictionaries this config holds, so edits to them show up in
+            later lookups.
+        """
+        if self._sections_shared:
+            return self._walk(key, default)
+
+        # Rebuilt whenever _config has been replaced, e.g. by from_dict()
+        if self._flat_source is not self._config:
+            self._flat = self._flatten(self._config)
+            self._flat_source = self._config
+
+        value = self._flat.get(key)
+        if value is None:
+            return default
+        if isinstance(value, dict):
+            # The caller may edit this section, which _flat would not see
+            self._sections_shared = True
+        return value
+
+    def _walk(self, key: str, default: Any) -> Any:
+        """Resolve a dotted key by walking the nested dictionaries.
+
+        Args:
+            key: Configuration key in dot notation
+            default: Default value if key not found
+
         Returns:
             Configuration value or default
         """
-        keys = key.split(".")
-        value = self._config
+        value: Any = self._config
 
-        for k in keys:
+        for k in key.split("."):
             if isinstance(value, dict):
                 value = value.get(k)
             else:
@@ -44,6 +123,35 @@ class Config:
 
         return value
 
+    @staticmethod
+    def _flatten(config: Dict) -> Dict[str, Any]:
+        """Map every dotted key path in a configuration to its value.
+
+        Sections are included as well as leaves, so get() can return
+        nested dictionaries as before. Keys that get() could never address
+        (non-strings, or containing a dot) are left out.
+
+        Args:
+            config: Nested configuration dictionary
+
+        Returns:
+            Dictionary from dotted key to value
+        """
+        flat: Dict[str, Any] = {}
+        stack = [("", config)]
+
+        while stack:
+            prefix, section = stack.pop()
+            for key, value in section.items():
+                if not isinstance(key, str) or "." in key:
+                    continue
+                path = prefix + key
+                flat[path] = value
+                if isinstance(value, dict):
+                    stack.append((path + ".", value))
+
+        return flat
+
     @classmethod
     def from_dict(cls, data: dict) -> "Config":
         """Create config from dictionary.
@@ -54,21 +162,26 @@ class Config:
         Returns:
             Config instance
         """
-        config = cls()
-        config._config = data
+        # Skip __init__: the defaults it builds would be replaced anyway.
+        # Own copy: the caller's dictionary may be edited after this
+        config = cls.__new__(cls)
+        config._init_state(copy.deepcopy(data))
         return config
 
     def _load_yaml(self, path: Path) -> Dict:
         """Load YAML configuration file.
 
+        Parsed files are cached by path, modification time and size, so
+        creating many configs from an unchanged file only parses it once.
+
         Args:
             path: Path to YAML file
 
         Returns:
             Configuration dictionary
         """
-        with open(path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+        st = os.stat(path)
+        return copy.deepcopy(_load_yaml_cached(str(path), st.st_mtime_ns, st.st_size))
 
     def _load_default_config(self) -> Dict:
         """Load default configuration.
@@ -82,6 +195,7 @@ class Config:
                 "check_resolution": True,
                 "check_bit_depth": True,
                 "check_metadata": False,
+                "scan_workers": 16,  # Threads reading frame headers; 1 disables
             },
             "usd": {
                 "max_layer_depth": 10,
@@ -92,6 +206,8 @@ class Config:
             },
             "shotlint": {
                 "fail_on": "error",  # 'error', 'warning', 'none'
+                "walk_workers": 1,  # Threads walking the tree; 1 walks serially, 0 is auto
+                "rules_cache": False,  # Store parsed rules in .yamlc files next to them
             },
             "logging": {
                 "level": "INFO",
@@ -101,21 +217,29 @@ class Config:
         }
 
     def _merge_configs(self, base: Dict, override: Dict) -> Dict:
-        """Merge two configuration dictionaries recursively.
+        """Merge a configuration dictionary into another, in place.
+
+        Nested sections are merged level by level with an explicit stack
+        rather than by copying and recursing. Both dictionaries must be
+        owned by this config: base is modified and override's values are
+        adopted as they are.
 
         Args:
-            base: Base configuration
+            base: Base configuration, updated in place
             override: Configuration to merge (takes precedence)
 
         Returns:
-            Merged configuration
+            The merged base configuration
         """
-        result = base.copy()
-
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_configs(result[key], value)
-            else:
-                result[key] = value
-
-        return result
+        stack = [(base, override)]
+
+        while stack:
+            target, changes = stack.pop()
+            for key, value in changes.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    target[key] = value
+
+        return base
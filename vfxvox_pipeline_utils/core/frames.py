@@ -0,0 +1,47 @@
+"""Frame range helpers shared by the sequence and ShotLint validators."""
+
+from typing import Iterable, Iterator, Sequence, Tuple
+
+
+def iter_frame_ranges(frame_numbers: Iterable[int]) -> Iterator[Tuple[int, int]]:
+    """Collapse ascending frame numbers into contiguous (first, last) runs.
+
+    Args:
+        frame_numbers: Frame numbers in ascending order
+
+    Yields:
+        (first_frame, last_frame) for each run of consecutive frames
+
+    Example:
+        >>> list(iter_frame_ranges([1001, 1002, 1003, 1007, 1009, 1010]))
+        [(1001, 1003), (1007, 1007), (1009, 1010)]
+    """
+    frames = iter(frame_numbers)
+    first = next(frames, None)
+    if first is None:
+        return
+
+    last = first
+    for frame in frames:
+        if frame == last + 1:
+            last = frame
+            continue
+        yield (first, last)
+        first = last = frame
+
+    yield (first, last)
+
+
+def format_frame_ranges(ranges: Iterable[Sequence[int]]) -> str:
+    """Format frame runs for display, e.g. "1003, 1005-1010".
+
+    Args:
+        ranges: (first_frame, last_frame) runs, as tuples or lists
+
+    Returns:
+        Comma-separated runs, with single frames shown on their own
+    """
+    return ", ".join(
+        str(first) if first == last else f"{first}-{last}"
+        for first, last in ranges
+    )
@@ -2,6 +2,7 @@
 
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -52,9 +53,13 @@ def setup_logging(
     _logging_configured = True
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance for a module.
 
+    Results are cached per name, so default logging setup only happens on
+    the first call after import or after reset_logging().
+
     Args:
         name: Logger name (typically __name__)
 
@@ -82,3 +87,5 @@ def reset_logging() -> None:
         root_logger.removeHandler(handler)
 
     _logging_configured = False
+    # Let the next get_logger() call configure logging again
+    get_logger.cache_clear()
@@ -1,12 +1,19 @@
 """Base validator classes and data models."""
 
+import operator
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from datetime import datetime
 
+# Large trees can produce thousands of issues; on Python 3.10+ they are
+# stored in slots rather than a per-instance __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class ValidationIssue:
     """Represents a single validation issue.
 
@@ -15,12 +22,15 @@ class ValidationIssue:
         message: Human-readable issue description
         location: Optional location where issue was found
         details: Optional dictionary with additional context
+        category: Optional machine-readable kind of issue, such as
+            'missing_frames' or the rule that raised it
     """
 
     severity: str  # 'error', 'warning', 'info'
     message: str
     location: Optional[str] = None
     details: Optional[dict] = None
+    category: Optional[str] = None
 
     def __post_init__(self):
         """Validate severity level."""
@@ -41,6 +51,7 @@ class ValidationIssue:
             "message": self.message,
             "location": self.location,
             "details": self.details,
+            "category": self.category,
         }
 
 
@@ -58,11 +69,48 @@ class ValidationResult:
     issues: List[ValidationIssue] = field(default_factory=list)
     metadata: dict = field(default_factory=dict)
 
+    # Category index and the issues it was built from, rebuilt on change
+    _category_index: Mapping[str, Tuple[ValidationIssue, ...]] = field(
+        default_factory=lambda: MappingProxyType({}),
+        init=False, repr=False, compare=False,
+    )
+    _indexed_issues: Tuple[ValidationIssue, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         """Add timestamp to metadata if not present."""
         if "timestamp" not in self.metadata:
             self.metadata["timestamp"] = datetime.now().isoformat()
 
+    @property
+    def issues_by_category(self) -> Mapping[str, Tuple[ValidationIssue, ...]]:
+        """Issues grouped by category, for lookups without scanning messages.
+
+        Issues without a category are left out. The index is rebuilt
+        whenever ``issues`` no longer holds the same issues in the same
+        order, so appending, sorting, filtering or replacing the list is
+        always reflected. Changing the category of an issue already in
+        the list is not detected.
+
+        Returns:
+            Read-only mapping from each category to its issues, in order
+        """
+        indexed = self._indexed_issues
+        if len(indexed) != len(self.issues) or not all(
+            map(operator.is_, indexed, self.issues)
+        ):
+            grouped: Dict[str, List[ValidationIssue]] = {}
+            for issue in self.issues:
+                if issue.category is not None:
+                    grouped.setdefault(issue.category, []).append(issue)
+            self._category_index = MappingProxyType(
+                {category: tuple(issues) for category, issues in grouped.items()}
+            )
+            self._indexed_issues = tuple(self.issues)
+
+        return self._category_index
+
     def has_errors(self) -> bool:
         """Check if result contains any errors.
 
@@ -111,13 +159,27 @@ class ValidationResult:
         """
         return [issue for issue in self.issues if issue.severity == "info"]
 
+    def count_by_severity(self) -> Dict[str, int]:
+        """Count issues of every severity in a single pass.
+
+        Prefer this over calling error_count(), warning_count() and
+        info_count() separately when more than one count is needed.
+
+        Returns:
+            Dictionary mapping 'error', 'warning' and 'info' to counts
+        """
+        counts = {"error": 0, "warning": 0, "info": 0}
+        for issue in self.issues:
+            counts[issue.severity] += 1
+        return counts
+
     def error_count(self) -> int:
         """Get count of error-level issues.
 
         Returns:
             Number of errors
         """
-        return len(self.get_errors())
+        return sum(1 for issue in self.issues if issue.severity == "error")
 
     def warning_count(self) -> int:
         """Get count of warning-level issues.
@@ -125,7 +187,7 @@ class ValidationResult:
         Returns:
             Number of warnings
         """
-        return len(self.get_warnings())
+        return sum(1 for issue in self.issues if issue.severity == "warning")
 
     def info_count(self) -> int:
         """Get count of info-level issues.
@@ -133,7 +195,7 @@ class ValidationResult:
         Returns:
             Number of info messages
         """
-        return len(self.get_info())
+        return sum(1 for issue in self.issues if issue.severity == "info")
 
     def add_issue(
         self,
@@ -141,6 +203,7 @@ class ValidationResult:
         message: str,
         location: Optional[str] = None,
         details: Optional[dict] = None,
+        category: Optional[str] = None,
     ) -> None:
         """Add a new issue to the result.
 
@@ -149,8 +212,9 @@ class ValidationResult:
             message: Human-readable issue description
             location: Optional location where issue was found
             details: Optional dictionary with additional context
+            category: Optional machine-readable kind of issue
         """
-        issue = ValidationIssue(severity, message, location, details)
+        issue = ValidationIssue(severity, message, location, details, category)
         self.issues.append(issue)
 
         # Update passed status if error added
@@ -163,15 +227,16 @@ class ValidationResult:
         Returns:
             Dictionary representation of the result
         """
+        counts = self.count_by_severity()
         return {
             "passed": self.passed,
             "issues": [issue.to_dict() for issue in self.issues],
             "metadata": self.metadata,
             "summary": {
                 "total_issues": len(self.issues),
-                "errors": self.error_count(),
-                "warnings": self.warning_count(),
-                "info": self.info_count(),
+                "errors": counts["error"],
+                "warnings": counts["warning"],
+                "info": counts["info"],
             },
         }
 
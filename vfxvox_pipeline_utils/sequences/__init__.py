@@ -1,13 +1,22 @@
 """Sequence validation module."""
 
-from .validator import SequenceValidator
-from .scanner import SequenceScanner, FrameInfo
+from .validator import SequenceValidator, SequenceValidationResult
+from vfxvox_pipeline_utils.core.frames import iter_frame_ranges, format_frame_ranges
+from .scanner import SequenceScanner, FrameInfo, FrameArray, iter_missing_frames
+from .pattern import PatternSpec, compile_pattern
 from .reporters import render_console, render_json, render_yaml, render_markdown
 
 __all__ = [
     "SequenceValidator",
+    "SequenceValidationResult",
     "SequenceScanner",
     "FrameInfo",
+    "FrameArray",
+    "iter_missing_frames",
+    "iter_frame_ranges",
+    "format_frame_ranges",
+    "PatternSpec",
+    "compile_pattern",
     "render_console",
     "render_json",
     "render_yaml",
@@ -0,0 +1,30 @@
+"""Process-wide cache of directory listings for sequence scanning."""
+
+import os
+from functools import lru_cache
+from typing import Tuple
+
+
+@lru_cache(maxsize=256)
+def list_files(path: str, mtime_ns: int) -> Tuple[str, ...]:
+    """List the regular files in a directory.
+
+    Keyed on the directory's modification time as well as its path:
+    adding, removing or renaming an entry changes the mtime, so a stale
+    listing is never returned. Scanners for different sequences in the
+    same directory share one listing.
+
+    Args:
+        path: Directory path
+        mtime_ns: Directory ``st_mtime_ns`` at the time of the call
+
+    Returns:
+        Names of the regular files in the directory
+
+    Raises:
+        OSError: If the directory cannot be read
+    """
+    # entry.is_file() uses the type returned by the directory read on most
+    # platforms, avoiding a stat per file
+    with os.scandir(path) as entries:
+        return tuple(entry.name for entry in entries if entry.is_file())
@@ -1,16 +1,167 @@
 """Image format handlers for reading metadata."""
 
+import os
+import struct
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple, List
+from typing import Dict, Iterable, Optional, Tuple, List
 
 from vfxvox_pipeline_utils.core.logging import get_logger
+from vfxvox_pipeline_utils.core.exceptions import InvalidFormatError
 
 logger = get_logger(__name__)
 
+# Keeps Windows from translating line endings on raw descriptor reads
+_O_BINARY = getattr(os, 'O_BINARY', 0)
+
+_EXR_MAGIC = b'\x76\x2f\x31\x01'
+_DPX_MAGICS = (b'SDPX', b'XPDS')  # Big- and little-endian
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# PNG (colour type, bit depth) -> Pillow mode. 16-bit greyscale (with or
+# without alpha) is left out because the mode Pillow reports for it has
+# changed between versions; those files fall back to Pillow.
+_PNG_MODES = {
+    (0, 1): '1', (0, 2): 'L', (0, 4): 'L', (0, 8): 'L',
+    (2, 8): 'RGB', (2, 16): 'RGB',
+    (3, 1): 'P', (3, 2): 'P', (3, 4): 'P', (3, 8): 'P',
+    (4, 8): 'LA',
+    (6, 8): 'RGBA', (6, 16): 'RGBA',
+}
+
+# JPEG component count -> Pillow mode
+_JPEG_MODES = {1: 'L', 3: 'RGB', 4: 'CMYK'}
+
+# JPEG start-of-frame markers (0xC4, 0xC8 and 0xCC are other segments)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _read_jpeg_header(f) -> Optional[Tuple[Tuple[int, int], str]]:
+    """Find the start-of-frame segment of a JPEG stream.
+
+    Args:
+        f: Binary file positioned just after the SOI marker
+
+    Returns:
+        ((width, height), mode) or None if the header cannot be parsed
+    """
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        code = marker[1]
+        while code == 0xFF:  # Fill bytes
+            byte = f.read(1)
+            if not byte:
+                return None
+            code = byte[0]
+
+        # Standalone markers carry no length
+        if code == 0x01 or 0xD0 <= code <= 0xD8:
+            continue
+        # End of image or start of scan before any frame header
+        if code in (0xD9, 0xDA):
+            return None
+
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack('>H', length_bytes)[0]
+
+        if code in _JPEG_SOF_MARKERS:
+            data = f.read(6)
+            if len(data) < 6:
+                return None
+            precision, height, width, components = struct.unpack('>BHHB', data)
+            mode = _JPEG_MODES.get(components)
+            if precision != 8 or not height or not width or mode is None:
+                return None
+            return (width, height), mode
+
+        f.seek(length - 2, 1)
+
+
+def _read_image_header(file_path: Path) -> Optional[Tuple[Tuple[int, int], str]]:
+    """Read resolution and Pillow-equivalent mode from the file header.
+
+    Handles PNG, baseline JPEG and uncompressed 24-bit BMP, which covers
+    typical sequence frames, by reading a few header bytes instead of
+    going through Pillow.
+
+    Args:
+        file_path: Path to image file
+
+    Returns:
+        ((width, height), mode) or None if the format or variant is not
+        recognised, in which case callers should fall back to Pillow
+    """
+    # A raw descriptor read skips the buffered io stack; the descriptor is
+    # only wrapped in a file object for the JPEG segment walk
+    fd = os.open(file_path, os.O_RDONLY | _O_BINARY)
+    try:
+        head = os.read(fd, 34)
+
+        if head.startswith(_PNG_SIGNATURE):
+            if len(head) < 29 or head[12:16] != b'IHDR':
+                return None
+            width, height, bit_depth, color_type = struct.unpack('>IIBB', head[16:26])
+            mode = _PNG_MODES.get((color_type, bit_depth))
+            if mode is None or not width or not height:
+                return None
+            return (width, height), mode
+
+        if head.startswith(b'\xff\xd8'):
+            with open(fd, 'rb', closefd=False) as f:
+                f.seek(2)
+                return _read_jpeg_header(f)
+
+        if head.startswith(b'BM') and len(head) >= 34:
+            header_size, width, height, _planes, bpp, compression = struct.unpack(
+                '<IiiHHI', head[14:34]
+            )
+            if header_size < 40 or bpp != 24 or compression != 0 or width <= 0:
+                return None
+            return (width, abs(height)), 'RGB'
+    finally:
+        os.close(fd)
+
+    return None
+
+
+def _check_magic(file_path: Path, magics: Tuple[bytes, ...], format_name: str) -> None:
+    """Check that a file starts with one of a format's magic numbers.
+
+    Used when no reader library is available, so that unreadable or
+    corrupt frames are still reported as such.
+
+    Args:
+        file_path: Path to image file
+        magics: Accepted magic numbers, all of the same length
+        format_name: Format name for the error message
+
+    Raises:
+        OSError: If the file cannot be read
+        InvalidFormatError: If the magic number does not match
+    """
+    with open(file_path, 'rb') as f:
+        head = f.read(len(magics[0]))
+    if head not in magics:
+        raise InvalidFormatError(f"Not a valid {format_name} file: {file_path}", format=format_name)
+
 
 class ImageFormatHandler(ABC):
-    """Abstract base for image format handlers."""
+    """Abstract base for image format handlers.
+
+    Attributes:
+        extensions: Lower-case file suffixes (including the dot) handled by
+            this class. Handlers that declare them are looked up by suffix;
+            handlers that leave this empty are probed with can_handle().
+    """
+
+    extensions: Tuple[str, ...] = ()
 
     @abstractmethod
     def can_handle(self, file_path: Path) -> bool:
@@ -39,11 +190,72 @@ class ImageFormatHandler(ABC):
         """
         pass
 
+    def read_metadata_batch(
+        self,
+        file_paths: Iterable[Path],
+        max_workers: Optional[int] = None
+    ) -> List[Optional[Dict]]:
+        """Read metadata for many files, overlapping their I/O on threads.
+
+        Header reads are dominated by open/read/close round trips to the
+        filesystem, which release the GIL, so a thread pool keeps several
+        of them in flight at once.
+
+        Args:
+            file_paths: Paths to image files
+            max_workers: Maximum number of reader threads (defaults to the
+                ThreadPoolExecutor default)
+
+        Returns:
+            Metadata dictionaries in input order, with None for files whose
+            metadata could not be read
+        """
+        file_paths = list(file_paths)
+        if len(file_paths) < 2:
+            return [self._read_metadata_or_none(path) for path in file_paths]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._read_metadata_or_none, file_paths))
+
+    def _read_metadata_or_none(self, file_path: Path) -> Optional[Dict]:
+        """Read metadata, returning None instead of raising on failure.
+
+        Args:
+            file_path: Path to the image file
+
+        Returns:
+            Metadata dictionary or None
+        """
+        try:
+            return self.read_metadata(file_path)
+        except Exception as e:
+            logger.debug(f"Failed to read metadata for {file_path}: {e}")
+            return None
+
 
 class StandardImageHandler(ImageFormatHandler):
     """Handler for standard formats (PNG, JPG, TIFF) using Pillow."""
 
-    SUPPORTED_FORMATS = {'.png', '.jpg', '.jpeg', '.tiff', '.tif', '.bmp'}
+    SUPPORTED_FORMATS = frozenset({'.png', '.jpg', '.jpeg', '.tiff', '.tif', '.bmp'})
+    extensions = tuple(sorted(SUPPORTED_FORMATS))
+
+    # Bit depth per Pillow image mode
+    MODE_TO_DEPTH = {
+        '1': 1,      # 1-bit pixels, black and white
+        'L': 8,      # 8-bit pixels, grayscale
+        'P': 8,      # 8-bit pixels, mapped to any other mode
+        'RGB': 8,    # 3x8-bit pixels, true color
+        'RGBA': 8,   # 4x8-bit pixels, true color with transparency
+        'CMYK': 8,   # 4x8-bit pixels, color separation
+        'YCbCr': 8,  # 3x8-bit pixels, color video format
+        'LAB': 8,    # 3x8-bit pixels, L*a*b color space
+        'HSV': 8,    # 3x8-bit pixels, Hue, Saturation, Value
+        'I': 32,     # 32-bit signed integer pixels
+        'F': 32,     # 32-bit floating point pixels
+        'I;16': 16,  # 16-bit unsigned integer pixels
+        'I;16B': 16, # 16-bit big endian unsigned integer
+        'I;16L': 16, # 16-bit little endian unsigned integer
+    }
 
     def can_handle(self, file_path: Path) -> bool:
         """Check if file is a standard image format.
@@ -69,6 +281,16 @@ class StandardImageHandler(ImageFormatHandler):
             ImportError: If Pillow is not installed
             Exception: If file cannot be read
         """
+        # Fast path: parse the header directly for common formats
+        try:
+            header = _read_image_header(file_path)
+        except (OSError, struct.error):
+            header = None
+
+        if header is not None:
+            resolution, mode = header
+            return self._build_metadata(file_path, resolution, mode)
+
         try:
             from PIL import Image
         except ImportError:
@@ -77,44 +299,41 @@ class StandardImageHandler(ImageFormatHandler):
 
         try:
             with Image.open(file_path) as img:
-                # Get resolution
-                resolution = (img.width, img.height)
-
-                # Get bit depth
-                mode_to_depth = {
-                    '1': 1,      # 1-bit pixels, black and white
-                    'L': 8,      # 8-bit pixels, grayscale
-                    'P': 8,      # 8-bit pixels, mapped to any other mode
-                    'RGB': 8,    # 3x8-bit pixels, true color
-                    'RGBA': 8,   # 4x8-bit pixels, true color with transparency
-                    'CMYK': 8,   # 4x8-bit pixels, color separation
-                    'YCbCr': 8,  # 3x8-bit pixels, color video format
-                    'LAB': 8,    # 3x8-bit pixels, L*a*b color space
-                    'HSV': 8,    # 3x8-bit pixels, Hue, Saturation, Value
-                    'I': 32,     # 32-bit signed integer pixels
-                    'F': 32,     # 32-bit floating point pixels
-                    'I;16': 16,  # 16-bit unsigned integer pixels
-                    'I;16B': 16, # 16-bit big endian unsigned integer
-                    'I;16L': 16, # 16-bit little endian unsigned integer
-                }
-
-                bit_depth = mode_to_depth.get(img.mode, 8)
-
-                return {
-                    'resolution': resolution,
-                    'bit_depth': bit_depth,
-                    'format': file_path.suffix.lstrip('.').lower(),
-                    'mode': img.mode,
-                }
+                return self._build_metadata(file_path, (img.width, img.height), img.mode)
 
         except Exception as e:
             logger.error(f"Failed to read {file_path}: {e}")
             raise
 
+    def _build_metadata(
+        self,
+        file_path: Path,
+        resolution: Tuple[int, int],
+        mode: str
+    ) -> Dict:
+        """Build the metadata dictionary for a Pillow image mode.
+
+        Args:
+            file_path: Path to image file
+            resolution: Image resolution as (width, height)
+            mode: Pillow image mode
+
+        Returns:
+            Metadata dictionary
+        """
+        return {
+            'resolution': resolution,
+            'bit_depth': self.MODE_TO_DEPTH.get(mode, 8),
+            'format': file_path.suffix.lstrip('.').lower(),
+            'mode': mode,
+        }
+
 
 class EXRHandler(ImageFormatHandler):
     """Handler for OpenEXR files using OpenImageIO."""
 
+    extensions = ('.exr',)
+
     def can_handle(self, file_path: Path) -> bool:
         """Check if file is an EXR file.
 
@@ -194,6 +413,7 @@ class EXRHandler(ImageFormatHandler):
             Basic metadata dictionary
         """
         # Return minimal metadata when OpenImageIO is not available
+        _check_magic(file_path, (_EXR_MAGIC,), "EXR")
         return {
             'resolution': None,
             'bit_depth': 16,  # Assume half-float
@@ -204,6 +424,8 @@ class EXRHandler(ImageFormatHandler):
 class DPXHandler(ImageFormatHandler):
     """Handler for DPX files."""
 
+    extensions = ('.dpx',)
+
     def can_handle(self, file_path: Path) -> bool:
         """Check if file is a DPX file.
 
@@ -231,6 +453,7 @@ class DPXHandler(ImageFormatHandler):
             import OpenImageIO as oiio
         except ImportError:
             logger.warning("OpenImageIO not installed, cannot read DPX metadata")
+            _check_magic(file_path, _DPX_MAGICS, "DPX")
             return {
                 'resolution': None,
                 'bit_depth': 10,  # Common default
@@ -268,12 +491,28 @@ class DPXHandler(ImageFormatHandler):
             raise
 
 
-# Registry of format handlers
-_HANDLERS: List[ImageFormatHandler] = [
-    EXRHandler(),
-    DPXHandler(),
-    StandardImageHandler(),
-]
+# Registry of format handlers, keyed by lower-case suffix
+_EXT_MAP: Dict[str, ImageFormatHandler] = {}
+
+# Handlers without declared extensions, probed in priority order
+_PROBE_HANDLERS: List[ImageFormatHandler] = []
+
+
+@lru_cache(maxsize=64)
+def _handler_for_ext(suffix: str) -> Optional[ImageFormatHandler]:
+    """Look up the registered handler for a file suffix, case-insensitively.
+
+    Cached on the suffix as it appears in the file name, so the lowercasing
+    and map lookup happen once per distinct suffix. The cache is cleared
+    whenever a handler is registered.
+
+    Args:
+        suffix: File suffix including the leading dot (e.g. '.EXR')
+
+    Returns:
+        Registered handler or None
+    """
+    return _EXT_MAP.get(suffix.lower())
 
 
 def get_format_handler(file_path: Path) -> Optional[ImageFormatHandler]:
@@ -285,19 +524,38 @@ def get_format_handler(file_path: Path) -> Optional[ImageFormatHandler]:
     Returns:
         ImageFormatHandler instance or None if no handler found
     """
-    for handler in _HANDLERS:
+    for handler in _PROBE_HANDLERS:
         if handler.can_handle(file_path):
             return handler
 
-    logger.warning(f"No handler found for {file_path.suffix}")
+    suffix = file_path.suffix
+    ext_handler = _handler_for_ext(suffix)
+    if ext_handler is not None:
+        return ext_handler
+
+    logger.warning(f"No handler found for {suffix}")
     return None
 
 
 def register_format_handler(handler: ImageFormatHandler) -> None:
     """Register a custom format handler.
 
+    Handlers that declare ``extensions`` replace any existing handler for
+    those suffixes. Other handlers are probed with ``can_handle()`` before
+    the suffix lookup, most recently registered first.
+
     Args:
         handler: ImageFormatHandler instance to register
     """
-    _HANDLERS.insert(0, handler)  # Insert at beginning for priority
+    if handler.extensions:
+        for extension in handler.extensions:
+            _EXT_MAP[extension.lower()] = handler
+        _handler_for_ext.cache_clear()
+    else:
+        _PROBE_HANDLERS.insert(0, handler)  # Insert at beginning for priority
     logger.debug(f"Registered format handler: {handler.__class__.__name__}")
+
+
+for _handler in (StandardImageHandler(), DPXHandler(), EXRHandler()):
+    register_format_handler(_handler)
+del _handler
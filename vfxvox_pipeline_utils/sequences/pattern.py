@@ -0,0 +1,115 @@
+"""Parsing of image sequence filename patterns."""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Match, Optional, Pattern, Tuple
+
+from vfxvox_pipeline_utils.core.logging import get_logger
+from vfxvox_pipeline_utils.core.exceptions import InvalidFormatError
+
+logger = get_logger(__name__)
+
+# Frame tokens of every supported style, found in a single scan of the name
+_FRAME_TOKEN_RE = re.compile(
+    r'(?P<printf>%(?P<width>\d*)d)'
+    r'|(?P<hash>#+)'
+    r'|(?P<range>\[(?P<start>\d+)-(?P<end>\d+)\])'
+)
+
+# Token styles in the order they take precedence when several are present
+_STYLE_PRIORITY = ("printf", "hash", "range")
+
+
+@dataclass(frozen=True)
+class PatternSpec:
+    """Compiled form of a sequence filename pattern.
+
+    Attributes:
+        pattern_type: Pattern style ('printf', 'hash' or 'range')
+        base_name: Filename text before the frame token
+        extension: Filename text after the frame token
+        padding: Zero-padding width of frame numbers (0 for none)
+        frame_range: (start, end) for range-style patterns, else None
+        regex: Regex matching frame filenames, capturing the frame number
+        format_template: str.format template building a frame filename
+        format_name: Lower-case image format taken from the extension
+    """
+
+    pattern_type: str
+    base_name: str
+    extension: str
+    padding: int
+    frame_range: Optional[Tuple[int, int]]
+    regex: Pattern
+    format_template: str
+    format_name: Optional[str]
+
+
+@lru_cache(maxsize=256)
+def compile_pattern(filename_pattern: str) -> PatternSpec:
+    """Parse a sequence filename pattern into a PatternSpec.
+
+    Supports printf-style (``shot.%04d.exr``), hash-style (``shot.####.exr``)
+    and range-style (``shot.[1001-1100].exr``) patterns. When a name holds
+    tokens of several styles, printf wins over hash, and hash over range.
+    Results are cached per pattern string.
+
+    Args:
+        filename_pattern: Sequence filename pattern, without directories
+
+    Returns:
+        PatternSpec for the pattern
+
+    Raises:
+        InvalidFormatError: If the pattern has no recognised frame token
+    """
+    # First token of each style, collected in one pass over the name
+    tokens: Dict[Optional[str], Match[str]] = {}
+    for match in _FRAME_TOKEN_RE.finditer(filename_pattern):
+        tokens.setdefault(match.lastgroup, match)
+
+    style = next((s for s in _STYLE_PRIORITY if s in tokens), None)
+    if style is None:
+        raise InvalidFormatError(
+            f"Unrecognized pattern format: {filename_pattern}",
+            format=filename_pattern,
+            supported_formats=["printf (%04d)", "hash (####)", "range ([1001-1100])"]
+        )
+
+    match = tokens[style]
+    base_name = filename_pattern[:match.start()]
+    extension = filename_pattern[match.end():]
+    frame_range = None
+
+    if style == "printf":
+        padding = int(match.group("width")) if match.group("width") else 0
+    elif style == "hash":
+        padding = len(match.group("hash"))
+    else:
+        frame_range = (int(match.group("start")), int(match.group("end")))
+        padding = len(match.group("start"))
+
+    # Literal braces in the pattern are doubled so str.format leaves them be
+    spec = f":0{padding}d" if padding > 0 else ""
+    format_template = "{}{{{}}}{}".format(
+        base_name.replace('{', '{{').replace('}', '}}'),
+        spec,
+        extension.replace('{', '{{').replace('}', '}}'),
+    )
+
+    logger.debug(
+        f"Parsed {style} pattern: base={base_name}, padding={padding}, "
+        f"range={frame_range}, ext={extension}"
+    )
+
+    return PatternSpec(
+        pattern_type=style,
+        base_name=base_name,
+        extension=extension,
+        padding=padding,
+        frame_range=frame_range,
+        regex=re.compile(re.escape(base_name) + r'(\d+)' + re.escape(extension)),
+        format_template=format_template,
+        format_name=extension.lstrip('.').lower() if extension else None,
+    )
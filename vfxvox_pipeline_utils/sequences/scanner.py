@@ -1,15 +1,66 @@
 """Frame detection and scanning for image sequences."""
 
-import re
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import FrozenSet, Iterable, Iterator, List, Optional, Tuple
 
 from vfxvox_pipeline_utils.core.logging import get_logger
-from vfxvox_pipeline_utils.core.exceptions import InvalidFormatError
+from ._dircache import list_files
+from .formats import get_format_handler
+from .pattern import compile_pattern
 
 logger = get_logger(__name__)
 
+# Frame scans are file opens and header reads that release the GIL, so
+# threads keep several in flight; chunking bounds the pending futures
+SCAN_MAX_WORKERS = 16
+SCAN_CHUNK_SIZE = 16
+
+
+def iter_missing_frames(
+    frame_numbers: Iterable[int],
+    start: Optional[int] = None,
+    end: Optional[int] = None
+) -> Iterator[int]:
+    """Yield the frame numbers missing from a frame range.
+
+    Walks the sorted frame numbers once and yields the gap before each
+    one, so no set of the full expected range is built.
+
+    Args:
+        frame_numbers: Frame numbers present in the sequence, in any order
+        start: First frame of the range (defaults to the first present frame)
+        end: Last frame of the range (defaults to the last present frame)
+
+    Yields:
+        Missing frame numbers in ascending order
+
+    Example:
+        >>> list(iter_missing_frames([1001, 1002, 1005]))
+        [1003, 1004]
+        >>> list(iter_missing_frames([1002], start=1001, end=1003))
+        [1001, 1003]
+    """
+    # Sorting is linear for the already sorted output of detect_frames()
+    frames = sorted(frame_numbers)
+    if not frames and (start is None or end is None):
+        return
+
+    first = frames[0] if start is None else start
+    last = frames[-1] if end is None else end
+
+    previous = first - 1
+    for current in frames:
+        if current > last:
+            break
+        if current > previous + 1:
+            yield from range(previous + 1, current)
+        previous = max(previous, current)
+
+    yield from range(previous + 1, last + 1)
+
 
 @dataclass
 class FrameInfo:
@@ -34,6 +85,51 @@ class FrameInfo:
     format: Optional[str] = None
 
 
+@dataclass
+class FrameArray:
+    """Column-wise (structure-of-arrays) view of scanned frames.
+
+    Each attribute of the frames is held in its own list, index-aligned
+    with ``frame_numbers``. Checks that look at one attribute across the
+    whole sequence can then reduce over a single column.
+
+    Attributes:
+        frame_numbers: Frame numbers
+        exists: Whether each frame exists
+        readable: Whether each frame can be read
+        resolutions: Resolution of each frame, or None
+        bit_depths: Bit depth of each frame, or None
+    """
+
+    frame_numbers: List[int]
+    exists: List[bool]
+    readable: List[bool]
+    resolutions: List[Optional[Tuple[int, int]]]
+    bit_depths: List[Optional[int]]
+
+    @classmethod
+    def from_frames(cls, frames: List[FrameInfo]) -> "FrameArray":
+        """Transpose a list of FrameInfo into columns.
+
+        Args:
+            frames: Scanned frames
+
+        Returns:
+            FrameArray with one entry per frame
+        """
+        return cls(
+            frame_numbers=[f.frame_number for f in frames],
+            exists=[f.exists for f in frames],
+            readable=[f.readable for f in frames],
+            resolutions=[f.resolution for f in frames],
+            bit_depths=[f.bit_depth for f in frames],
+        )
+
+    def __len__(self) -> int:
+        """Return the number of frames."""
+        return len(self.frame_numbers)
+
+
 class SequenceScanner:
     """Scans and analyzes image sequences.
 
@@ -58,67 +154,26 @@ class SequenceScanner:
             InvalidFormatError: If pattern format is not recognized
         """
         self.pattern = pattern
-        self.base_path = Path(pattern).parent
-        self.filename_pattern = Path(pattern).name
-
-        # Parse pattern to extract components
-        self._parse_pattern()
-
-    def _parse_pattern(self) -> None:
-        """Parse the pattern to extract base name, frame format, and extension.
-
-        Raises:
-            InvalidFormatError: If pattern cannot be parsed
-        """
-        # Try printf-style: %04d, %d, etc.
-        printf_match = re.search(r'%(\d*)d', self.filename_pattern)
-        if printf_match:
-            self.pattern_type = "printf"
-            self.padding = int(printf_match.group(1)) if printf_match.group(1) else 0
-            self.base_name = self.filename_pattern[:printf_match.start()]
-            self.extension = self.filename_pattern[printf_match.end():]
-            self.frame_regex = re.compile(
-                re.escape(self.base_name) + r'(\d+)' + re.escape(self.extension)
-            )
-            logger.debug(f"Parsed printf pattern: base={self.base_name}, padding={self.padding}, ext={self.extension}")
-            return
-
-        # Try hash-style: ####, ###, etc.
-        hash_match = re.search(r'(#+)', self.filename_pattern)
-        if hash_match:
-            self.pattern_type = "hash"
-            self.padding = len(hash_match.group(1))
-            self.base_name = self.filename_pattern[:hash_match.start()]
-            self.extension = self.filename_pattern[hash_match.end():]
-            self.frame_regex = re.compile(
-                re.escape(self.base_name) + r'(\d+)' + re.escape(self.extension)
-            )
-            logger.debug(f"Parsed hash pattern: base={self.base_name}, padding={self.padding}, ext={self.extension}")
-            return
-
-        # Try range-style: [1001-1100]
-        range_match = re.search(r'\[(\d+)-(\d+)\]', self.filename_pattern)
-        if range_match:
-            self.pattern_type = "range"
-            self.frame_start = int(range_match.group(1))
-            self.frame_end = int(range_match.group(2))
-            self.padding = len(range_match.group(1))
-            self.base_name = self.filename_pattern[:range_match.start()]
-            self.extension = self.filename_pattern[range_match.end():]
-            self.frame_regex = re.compile(
-                re.escape(self.base_name) + r'(\d+)' + re.escape(self.extension)
-            )
-            logger.debug(
-                f"Parsed range pattern: base={self.base_name}, "
-                f"range={self.frame_start}-{self.frame_end}, ext={self.extension}"
-            )
-            return
-
-        raise InvalidFormatError(
-            f"Unrecognized pattern format: {self.filename_pattern}",
-            format=self.filename_pattern,
-            supported_formats=["printf (%04d)", "hash (####)", "range ([1001-1100])"]
-        )
+        pattern_path = Path(pattern)
+        self.base_path = pattern_path.parent
+        self.filename_pattern = pattern_path.name
+
+        # Plain-string directory for the per-frame filesystem calls
+        self._dir = str(self.base_path)
+
+        # Directory listing from the last detect_frames() call, as
+        # (directory mtime_ns, sorted frame numbers, matching file names)
+        self._listing: Optional[Tuple[int, List[int], FrozenSet[str]]] = None
+
+        # Parse pattern to extract components; compiled once per pattern
+        self.spec = compile_pattern(self.filename_pattern)
+        self.pattern_type = self.spec.pattern_type
+        self.padding = self.spec.padding
+        self.base_name = self.spec.base_name
+        self.extension = self.spec.extension
+        self.frame_regex = self.spec.regex
+        if self.spec.frame_range is not None:
+            self.frame_start, self.frame_end = self.spec.frame_range
 
     def detect_frames(self) -> List[int]:
         """Detect all frame numbers in the sequence by scanning the directory.
@@ -131,22 +186,41 @@ class SequenceScanner:
             >>> frames = scanner.detect_frames()
             >>> print(frames)  # [1001, 1002, 1003, ...]
         """
-        if not self.base_path.exists():
+        return list(self._detect_frames())
+
+    def _detect_frames(self) -> List[int]:
+        """Detect frame numbers, returning the cached list itself.
+
+        Internal callers only read the result, so they skip the copy that
+        detect_frames() hands to outside callers.
+
+        Returns:
+            Sorted list of frame numbers found; must not be modified
+        """
+        try:
+            mtime_ns = os.stat(self._dir).st_mtime_ns
+        except OSError:
             logger.warning(f"Directory does not exist: {self.base_path}")
             return []
 
-        frame_numbers = []
+        # Adding or removing files changes the directory mtime, so an
+        # unchanged mtime means the previous listing is still valid
+        if self._listing is not None and self._listing[0] == mtime_ns:
+            return self._listing[1]
 
-        for file_path in self.base_path.iterdir():
-            if not file_path.is_file():
-                continue
+        frame_numbers = []
+        names = set()
 
-            match = self.frame_regex.match(file_path.name)
+        # The listing itself is shared with other scanners of this directory
+        for name in list_files(self._dir, mtime_ns):
+            # fullmatch, so names like "shot.1001.exr.bak" are not frames
+            match = self.frame_regex.fullmatch(name)
             if match:
-                frame_number = int(match.group(1))
-                frame_numbers.append(frame_number)
+                frame_numbers.append(int(match.group(1)))
+                names.add(name)
 
         frame_numbers.sort()
+        self._listing = (mtime_ns, frame_numbers, frozenset(names))
         logger.debug(f"Detected {len(frame_numbers)} frames")
 
         return frame_numbers
@@ -160,64 +234,49 @@ class SequenceScanner:
         Returns:
             FrameInfo with frame details
         """
-        # Construct filename
-        if self.padding > 0:
-            frame_str = str(frame_number).zfill(self.padding)
-        else:
-            frame_str = str(frame_number)
-
-        filename = f"{self.base_name}{frame_str}{self.extension}"
-        file_path = self.base_path / filename
+        filename = self.spec.format_template.format(frame_number)
+        path_str = os.path.join(self._dir, filename)
 
-        # Check existence
-        exists = file_path.exists()
+        # Check existence, trusting the last directory listing for files it
+        # saw and falling back to a stat otherwise
+        if self._listing is not None and filename in self._listing[2]:
+            exists = True
+        else:
+            exists = os.path.exists(path_str)
+        file_path = Path(path_str)
         readable = False
+        metadata = None
 
         if exists:
+            # A frame is readable when its handler can parse the header, which
+            # only reads the first bytes and never decodes pixels. Formats
+            # without a handler just need to open.
+            handler = get_format_handler(file_path)
             try:
-                # Try to open file to check readability
-                with open(file_path, 'rb') as f:
-                    f.read(1)
+                if handler is not None:
+                    metadata = handler.read_metadata(file_path)
+                else:
+                    with open(path_str, 'rb') as f:
+                        f.read(1)
                 readable = True
             except Exception as e:
-                logger.debug(f"Frame {frame_number} not readable: {e}")
-
-        # Get format from extension
-        format_name = self.extension.lstrip('.').lower() if self.extension else None
+                logger.debug("Frame %s not readable: %s", frame_number, e)
 
-        frame_info = FrameInfo(
+        return FrameInfo(
             frame_number=frame_number,
             file_path=file_path,
             exists=exists,
             readable=readable,
-            format=format_name
+            resolution=metadata.get('resolution') if metadata else None,
+            bit_depth=metadata.get('bit_depth') if metadata else None,
+            format=self.spec.format_name
         )
 
-        # Read metadata if file is readable
-        if readable:
-            self._read_frame_metadata(frame_info)
-
-        return frame_info
-
-    def _read_frame_metadata(self, frame_info: FrameInfo) -> None:
-        """Read metadata from frame file.
+    def scan_all(self, max_workers: int = SCAN_MAX_WORKERS) -> List[FrameInfo]:
+        """Scan all detected frames.
 
         Args:
-            frame_info: FrameInfo to populate with metadata
-        """
-        from .formats import get_format_handler
-
-        try:
-            handler = get_format_handler(frame_info.file_path)
-            if handler:
-                metadata = handler.read_metadata(frame_info.file_path)
-                frame_info.resolution = metadata.get('resolution')
-                frame_info.bit_depth = metadata.get('bit_depth')
-        except Exception as e:
-            logger.debug(f"Failed to read metadata for {frame_info.file_path}: {e}")
-
-    def scan_all(self) -> List[FrameInfo]:
-        """Scan all detected frames.
+            max_workers: Maximum number of scanning threads (1 scans serially)
 
         Returns:
             List of FrameInfo for all frames
@@ -228,23 +287,72 @@ class SequenceScanner:
             >>> for frame in frames:
             ...     print(f"Frame {frame.frame_number}: {frame.resolution}")
         """
-        frame_numbers = self.detect_frames()
-        frames = []
-
-        for frame_number in frame_numbers:
-            frame_info = self.scan_frame(frame_number)
-            frames.append(frame_info)
+        frames = self.scan_frames_batch(self._detect_frames(), max_workers)
 
         logger.info(f"Scanned {len(frames)} frames")
         return frames
 
+    def scan_all_arrays(self, max_workers: int = SCAN_MAX_WORKERS) -> FrameArray:
+        """Scan all detected frames into a column-wise FrameArray.
+
+        Args:
+            max_workers: Maximum number of scanning threads (1 scans serially)
+
+        Returns:
+            FrameArray for all frames
+        """
+        return FrameArray.from_frames(self.scan_all(max_workers))
+
+    def scan_frames_batch(
+        self,
+        frame_numbers: List[int],
+        max_workers: int = SCAN_MAX_WORKERS
+    ) -> List[FrameInfo]:
+        """Scan several frames, overlapping their file reads on threads.
+
+        Frames are handed to the pool in chunks of ``SCAN_CHUNK_SIZE`` so
+        the number of pending futures stays bounded for long sequences.
+        Sequences of a single chunk are scanned inline.
+
+        Args:
+            frame_numbers: Frame numbers to scan
+            max_workers: Maximum number of scanning threads
+
+        Returns:
+            List of FrameInfo in the order of ``frame_numbers``
+        """
+        if len(frame_numbers) <= SCAN_CHUNK_SIZE or max_workers <= 1:
+            return [self.scan_frame(frame_number) for frame_number in frame_numbers]
+
+        chunks = [
+            frame_numbers[i:i + SCAN_CHUNK_SIZE]
+            for i in range(0, len(frame_numbers), SCAN_CHUNK_SIZE)
+        ]
+
+        frames = []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            for chunk_frames in executor.map(self._scan_chunk, chunks):
+                frames.extend(chunk_frames)
+        return frames
+
+    def _scan_chunk(self, frame_numbers: List[int]) -> List[FrameInfo]:
+        """Scan a chunk of frames on a worker thread.
+
+        Args:
+            frame_numbers: Frame numbers to scan
+
+        Returns:
+            List of FrameInfo
+        """
+        return [self.scan_frame(frame_number) for frame_number in frame_numbers]
+
     def get_frame_range(self) -> Optional[Tuple[int, int]]:
         """Get the frame range from detected frames.
 
         Returns:
             Tuple of (first_frame, last_frame) or None if no frames found
         """
-        frames = self.detect_frames()
+        frames = self._detect_frames()
         if not frames:
             return None
         return (frames[0], frames[-1])
@@ -1,16 +1,41 @@
 """Sequence validator for image sequences."""
 
+from collections import Counter
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple, Union
 
 from vfxvox_pipeline_utils.core.validators import BaseValidator, ValidationResult, ValidationIssue
 from vfxvox_pipeline_utils.core.config import Config
+from vfxvox_pipeline_utils.core.frames import format_frame_ranges, iter_frame_ranges
 from vfxvox_pipeline_utils.core.logging import get_logger
-from .scanner import SequenceScanner, FrameInfo
+from .scanner import (
+    SCAN_MAX_WORKERS,
+    SequenceScanner,
+    FrameArray,
+    FrameInfo,
+    iter_missing_frames,
+)
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class SequenceValidationResult(ValidationResult):
+    """Result of validating an image sequence.
+
+    The frame count and range are also kept in ``metadata`` for reporters
+    and serialization; the attributes save callers the dictionary lookups.
+
+    Attributes:
+        frame_count: Number of frames found
+        frame_range: (first_frame, last_frame), or None if no frames were found
+    """
+
+    frame_count: int = 0
+    frame_range: Optional[Tuple[int, int]] = None
+
+
 class SequenceValidator(BaseValidator):
     """Validates image sequences for common issues.
 
@@ -35,19 +60,24 @@ class SequenceValidator(BaseValidator):
         """
         self.config = config or Config()
 
-    def validate(self, pattern: str) -> ValidationResult:
+        # Check toggles are read once here rather than on every validate()
+        self._check_resolution = self.config.get("sequences.check_resolution", True)
+        self._check_bit_depth = self.config.get("sequences.check_bit_depth", True)
+        self._scan_workers = self.config.get("sequences.scan_workers", SCAN_MAX_WORKERS)
+
+    def validate(self, pattern: str) -> SequenceValidationResult:
         """Validate a sequence and return results.
 
         Args:
             pattern: File pattern for the sequence (e.g., "shot.%04d.exr")
 
         Returns:
-            ValidationResult with issues found
+            SequenceValidationResult with issues found
         """
         logger.info(f"Validating sequence: {pattern}")
 
         # Create result
-        result = ValidationResult(
+        result = SequenceValidationResult(
             passed=True,
             metadata={
                 "validator": "SequenceValidator",
@@ -60,36 +90,45 @@ class SequenceValidator(BaseValidator):
             scanner = SequenceScanner(pattern)
 
             # Scan all frames
-            frames = scanner.scan_all()
+            frames = scanner.scan_all(max_workers=self._scan_workers)
 
             if not frames:
                 result.add_issue(
                     severity="warning",
                     message="No frames found matching pattern",
-                    location=pattern
+                    location=pattern,
+                    category="no_frames"
                 )
                 return result
 
-            # Update metadata
-            frame_range = scanner.get_frame_range()
+            # Update metadata. Frames come back in frame order, so the range
+            # is read off the scan instead of asking the scanner again
+            frame_range = (frames[0].frame_number, frames[-1].frame_number)
+            result.frame_count = len(frames)
+            result.frame_range = frame_range
             result.metadata.update({
                 "frame_count": len(frames),
-                "frame_range": f"{frame_range[0]}-{frame_range[1]}" if frame_range else None,
+                "frame_range": f"{frame_range[0]}-{frame_range[1]}",
             })
 
             # Run checks
             self.check_missing_frames(frames, result)
             self.check_corrupted_frames(frames, result)
 
-            if self.config.get("sequences.check_resolution", True):
-                self.check_resolution_consistency(frames, result)
+            # Both consistency checks read whole columns, so transpose once
+            if self._check_resolution or self._check_bit_depth:
+                columns = FrameArray.from_frames(frames)
+
+            if self._check_resolution:
+                self.check_resolution_consistency(columns, result)
 
-            if self.config.get("sequences.check_bit_depth", True):
-                self.check_bit_depth_consistency(frames, result)
+            if self._check_bit_depth:
+                self.check_bit_depth_consistency(columns, result)
 
+            counts = result.count_by_severity()
             logger.info(
-                f"Validation complete: {result.error_count()} errors, "
-                f"{result.warning_count()} warnings"
+                f"Validation complete: {counts['error']} errors, "
+                f"{counts['warning']} warnings"
             )
 
         except Exception as e:
@@ -113,22 +152,29 @@ class SequenceValidator(BaseValidator):
             return
 
         # Get frame range
-        frame_numbers = [f.frame_number for f in frames]
-        first_frame = min(frame_numbers)
-        last_frame = max(frame_numbers)
+        first_frame = min(f.frame_number for f in frames)
+        last_frame = max(f.frame_number for f in frames)
 
-        # Check for gaps
-        expected_frames = set(range(first_frame, last_frame + 1))
-        present_frames = set(frame_numbers)
-        missing_frames = sorted(expected_frames - present_frames)
+        # Gaps are worked out from the scan results alone; frames scanned but
+        # not found on disk count as missing, with no further filesystem checks
+        present_frames = [f.frame_number for f in frames if f.exists]
+        missing_frames = list(iter_missing_frames(present_frames, first_frame, last_frame))
 
         if missing_frames:
+            # Report gaps as contiguous runs, which stay short however many
+            # frames a gap spans. Lists rather than tuples keep the details
+            # plain for the YAML reporter.
+            missing_ranges = [[first, last] for first, last in iter_frame_ranges(missing_frames)]
+
             # Format message
-            if len(missing_frames) > 10:
-                sample = missing_frames[:10]
-                message = f"{len(missing_frames)} frames missing. Sample: {sample}"
+            if len(missing_ranges) > 10:
+                sample = format_frame_ranges(missing_ranges[:10])
+                message = (
+                    f"{len(missing_frames)} frames missing in "
+                    f"{len(missing_ranges)} gaps. Sample: {sample}"
+                )
             else:
-                message = f"Missing frames: {missing_frames}"
+                message = f"Missing frames: {format_frame_ranges(missing_ranges)}"
 
             result.add_issue(
                 severity="error",
@@ -137,9 +183,11 @@ class SequenceValidator(BaseValidator):
                 details={
                     "missing_count": len(missing_frames),
                     "missing_frames": missing_frames,
+                    "missing_ranges": missing_ranges,
                     "expected_range": f"{first_frame}-{last_frame}",
                     "found_count": len(present_frames)
-                }
+                },
+                category="missing_frames"
             )
 
             logger.warning(f"Missing {len(missing_frames)} frames")
@@ -171,99 +219,101 @@ class SequenceValidator(BaseValidator):
                 details={
                     "corrupted_count": len(corrupted),
                     "corrupted_frames": corrupted
-                }
+                },
+                category="corrupted_frames"
             )
 
             logger.error(f"Found {len(corrupted)} corrupted frames")
 
-    def check_resolution_consistency(self, frames: List[FrameInfo], result: ValidationResult) -> None:
+    def check_resolution_consistency(
+        self,
+        frames: Union[List[FrameInfo], FrameArray],
+        result: ValidationResult
+    ) -> None:
         """Check that all frames have consistent resolution.
 
         Args:
-            frames: List of FrameInfo objects
+            frames: List of FrameInfo objects or a FrameArray
             result: ValidationResult to add issues to
         """
-        # Get frames with resolution info
-        frames_with_res = [f for f in frames if f.resolution is not None]
-
-        if not frames_with_res:
-            logger.debug("No resolution information available")
-            return
-
-        # Use first frame as reference
-        reference_res = frames_with_res[0].resolution
-        mismatches = []
-
-        for frame in frames_with_res[1:]:
-            if frame.resolution != reference_res:
-                mismatches.append({
-                    "frame": frame.frame_number,
-                    "expected": reference_res,
-                    "actual": frame.resolution
-                })
-
-        if mismatches:
-            if len(mismatches) > 5:
-                sample = mismatches[:5]
-                message = f"Resolution mismatch in {len(mismatches)} frames. Sample: {sample}"
-            else:
-                message = f"Resolution mismatch detected: {mismatches}"
-
-            result.add_issue(
-                severity="error",
-                message=message,
-                location="sequence",
-                details={
-                    "reference_resolution": reference_res,
-                    "mismatch_count": len(mismatches),
-                    "mismatches": mismatches
-                }
-            )
-
-            logger.error(f"Resolution mismatch in {len(mismatches)} frames")
+        self._check_consistency(
+            frames, "resolutions", "Resolution", "reference_resolution", "resolution_mismatch", result
+        )
 
-    def check_bit_depth_consistency(self, frames: List[FrameInfo], result: ValidationResult) -> None:
+    def check_bit_depth_consistency(
+        self,
+        frames: Union[List[FrameInfo], FrameArray],
+        result: ValidationResult
+    ) -> None:
         """Check that all frames have consistent bit depth.
 
         Args:
-            frames: List of FrameInfo objects
+            frames: List of FrameInfo objects or a FrameArray
             result: ValidationResult to add issues to
         """
-        # Get frames with bit depth info
-        frames_with_depth = [f for f in frames if f.bit_depth is not None]
+        self._check_consistency(
+            frames, "bit_depths", "Bit depth", "reference_bit_depth", "bit_depth_mismatch", result
+        )
 
-        if not frames_with_depth:
-            logger.debug("No bit depth information available")
-            return
+    def _check_consistency(
+        self,
+        frames: Union[List[FrameInfo], FrameArray],
+        column: str,
+        label: str,
+        reference_key: str,
+        category: str,
+        result: ValidationResult
+    ) -> None:
+        """Check that one frame attribute has the same value across frames.
 
-        # Use first frame as reference
-        reference_depth = frames_with_depth[0].bit_depth
-        mismatches = []
-
-        for frame in frames_with_depth[1:]:
-            if frame.bit_depth != reference_depth:
-                mismatches.append({
-                    "frame": frame.frame_number,
-                    "expected": reference_depth,
-                    "actual": frame.bit_depth
-                })
-
-        if mismatches:
-            if len(mismatches) > 5:
-                sample = mismatches[:5]
-                message = f"Bit depth mismatch in {len(mismatches)} frames. Sample: {sample}"
-            else:
-                message = f"Bit depth mismatch detected: {mismatches}"
+        Args:
+            frames: List of FrameInfo objects or a FrameArray
+            column: FrameArray column holding the attribute
+            label: Attribute name used in messages (e.g. "Resolution")
+            reference_key: Details key for the reference value
+            category: Category for the mismatch issue
+            result: ValidationResult to add issues to
+        """
+        if not isinstance(frames, FrameArray):
+            frames = FrameArray.from_frames(frames)
+        values = getattr(frames, column)
+
+        # Count each distinct value once; a single value means the common,
+        # consistent case is settled without walking the frames again
+        counts = Counter(values)
+        counts.pop(None, None)
+        if not counts:
+            logger.debug(f"No {label.lower()} information available")
+            return
+        if len(counts) == 1:
+            return
 
-            result.add_issue(
-                severity="error",
-                message=message,
-                location="sequence",
-                details={
-                    "reference_bit_depth": reference_depth,
-                    "mismatch_count": len(mismatches),
-                    "mismatches": mismatches
-                }
-            )
+        # The majority value is the reference, so a few odd frames are
+        # reported rather than every frame after an odd first one. Ties go
+        # to the value seen first.
+        reference = counts.most_common(1)[0][0]
+        mismatches = [
+            {"frame": frame_number, "expected": reference, "actual": value}
+            for frame_number, value in zip(frames.frame_numbers, values)
+            if value is not None and value != reference
+        ]
+
+        if len(mismatches) > 5:
+            sample = mismatches[:5]
+            message = f"{label} mismatch in {len(mismatches)} frames. Sample: {sample}"
+        else:
+            message = f"{label} mismatch detected: {mismatches}"
+
+        result.add_issue(
+            severity="error",
+            message=message,
+            location="sequence",
+            details={
+                reference_key: reference,
+                "mismatch_count": len(mismatches),
+                "mismatches": mismatches
+            },
+            category=category
+        )
 
-            logger.error(f"Bit depth mismatch in {len(mismatches)} frames")
+        logger.error(f"{label} mismatch in {len(mismatches)} frames")
@@ -1,13 +1,59 @@
 """Rule execution engine for ShotLint."""
 
+import re
 from pathlib import Path
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Any, Callable, Iterator, Optional
 
 from vfxvox_pipeline_utils.core.validators import ValidationIssue
 from vfxvox_pipeline_utils.core.logging import get_logger
+from .rules import (
+    PathPatternRule,
+    FilenameRegexRule,
+    FrameSequenceRule,
+    MustExistRule,
+    walk_tree,
+)
+from .plugins import PluginRule
 
 logger = get_logger(__name__)
 
+# Rule types whose regexes and glob matchers can be built once, before
+# execution. Rule handlers keep no state, so one set serves every engine
+_RULE_COMPILERS: Dict[str, Callable] = {
+    "path_pattern": PathPatternRule().compile,
+    "filename_regex": FilenameRegexRule().compile,
+    "frame_sequence": FrameSequenceRule().compile,
+    "must_exist": MustExistRule().compile,
+}
+
+
+def compile_rules(rules: List[Dict[str, Any]]) -> Dict[int, Any]:
+    """Build the regexes and glob matchers for all rules up front.
+
+    Rules whose matcher cannot be built are left out; RuleEngine then
+    builds it itself and reports the failure as usual.
+
+    Args:
+        rules: List of rule dictionaries
+
+    Returns:
+        Dictionary mapping id() of each rule to its compiled matcher
+    """
+    compiled: Dict[int, Any] = {}
+
+    for rule in rules:
+        compiler = _RULE_COMPILERS.get(rule.get("type") or "")
+        if compiler is None:
+            continue
+        try:
+            regex = compiler(rule)
+        except (re.error, TypeError, ValueError):
+            continue
+        if regex is not None:
+            compiled[id(rule)] = regex
+
+    return compiled
+
 
 class RuleEngine:
     """Executes validation rules against directory structures.
@@ -16,39 +62,140 @@ class RuleEngine:
     and collects validation issues.
     """
 
-    def __init__(self, root: Path):
+    def __init__(self, root: Path, walk_workers: int = 1):
         """Initialize rule engine.
 
         Args:
             root: Root directory being validated
+            walk_workers: Threads for the shared directory walk; 1 walks
+                serially and 0 picks a default from the CPU count
         """
         self.root = Path(root)
+        self.walk_workers = walk_workers
         self._dispatch: Dict[str, Callable] = {}
+        self._visitor_factories: Dict[str, Callable] = {}
+        self._batch_checkers: Dict[str, Callable] = {}
         self._register_handlers()
 
     def _register_handlers(self) -> None:
         """Register rule type handlers."""
-        from .rules import (
-            PathPatternRule,
-            FilenameRegexRule,
-            FrameSequenceRule,
-            MustExistRule,
-        )
-        from .plugins import PluginRule
+        path_pattern = PathPatternRule()
+        filename_regex = FilenameRegexRule()
+        frame_sequence = FrameSequenceRule()
+        must_exist = MustExistRule()
 
         self._dispatch = {
-            "path_pattern": PathPatternRule().check,
-            "filename_regex": FilenameRegexRule().check,
-            "frame_sequence": FrameSequenceRule().check,
-            "must_exist": MustExistRule().check,
+            "path_pattern": path_pattern.check,
+            "filename_regex": filename_regex.check,
+            "frame_sequence": frame_sequence.check,
+            "must_exist": must_exist.check,
             "plugin": PluginRule().check,
         }
 
-    def execute_rule(self, rule: Dict[str, Any]) -> List[ValidationIssue]:
+        # Rule types that look at the whole tree and can share one walk
+        self._visitor_factories = {
+            "path_pattern": path_pattern.visitor,
+            "filename_regex": filename_regex.visitor,
+        }
+
+        # Rule types that can check many rules of the type in one pass
+        self._batch_checkers = {
+            "must_exist": must_exist.check_batch,
+        }
+
+    def walk_tree_rules(
+        self,
+        rules: List[Dict[str, Any]],
+        compiled: Optional[Dict[int, Any]] = None
+    ) -> Dict[int, List[ValidationIssue]]:
+        """Run every tree-walking rule over a single shared directory walk.
+
+        path_pattern and filename_regex rules each need to look at the
+        whole tree, so they are served by one walk instead of one walk per
+        rule. Rules that cannot be set up (missing fields, invalid regex)
+        are left out, as are all rules if the walk itself fails;
+        execute_rule() then runs and reports them as usual.
+
+        Args:
+            rules: List of rule dictionaries
+            compiled: Precompiled regexes from compile_rules()
+
+        Returns:
+            Dictionary mapping id() of each walked rule to its issues
+        """
+        compiled = compiled or {}
+        visitors = {}
+
+        for rule in rules:
+            rule_type = rule.get("type") or ""
+            factory = self._visitor_factories.get(rule_type)
+            if factory is None:
+                continue
+            try:
+                visitor = factory(self.root, rule, compiled.get(id(rule)))
+            except re.error:
+                continue
+            if visitor is not None:
+                visitors[id(rule)] = (rule_type, visitor)
+
+        if not visitors:
+            return {}
+
+        try:
+            walk_tree(
+                self.root,
+                [visitor for _, visitor in visitors.values()],
+                max_workers=self.walk_workers
+            )
+        except Exception as e:
+            logger.warning(f"Shared directory walk failed, running rules separately: {e}")
+            return {}
+
+        logger.debug(f"Checked {len(visitors)} rules in one directory walk")
+        return {
+            key: self._categorise(visitor.finalize(), rule_type)
+            for key, (rule_type, visitor) in visitors.items()
+        }
+
+    def batch_rules(self, rules: List[Dict[str, Any]]) -> Dict[int, List[ValidationIssue]]:
+        """Check the rules of each batchable type together.
+
+        Only worth it with several rules of a type, so types with a single
+        rule are left to execute_rule(), as are rules the batch checker
+        skips and all rules of a type whose batch check fails.
+
+        Args:
+            rules: List of rule dictionaries
+
+        Returns:
+            Dictionary mapping id() of each checked rule to its issues
+        """
+        results: Dict[int, List[ValidationIssue]] = {}
+
+        for rule_type, checker in self._batch_checkers.items():
+            batch = [rule for rule in rules if rule.get("type") == rule_type]
+            if len(batch) < 2:
+                continue
+            try:
+                checked = checker(self.root, batch)
+            except Exception as e:
+                logger.warning(f"Batch check of {rule_type} rules failed, running them separately: {e}")
+                continue
+            for key, issues in checked.items():
+                results[key] = self._categorise(issues, rule_type)
+
+        return results
+
+    def execute_rule(
+        self,
+        rule: Dict[str, Any],
+        compiled: Optional[Any] = None
+    ) -> List[ValidationIssue]:
         """Execute a single rule and return issues.
 
         Args:
             rule: Rule dictionary with 'type', 'name', and rule-specific fields
+            compiled: Precompiled matcher for the rule (see compile_rules)
 
         Returns:
             List of ValidationIssue objects
@@ -56,21 +203,24 @@ class RuleEngine:
         rule_type = rule.get("type")
         rule_name = rule.get("name", "<unknown>")
 
-        handler = self._dispatch.get(rule_type)
-
-        if not handler:
+        if rule_type is None or rule_type not in self._dispatch:
             logger.warning(f"Unknown rule type: {rule_type}")
             return [
                 ValidationIssue(
                     severity="warning",
                     message=f"Unknown rule type: {rule_type}",
                     location=rule_name,
-                    details={"rule_type": rule_type}
+                    details={"rule_type": rule_type},
+                    category="unknown_rule_type"
                 )
             ]
 
+        handler = self._dispatch[rule_type]
         try:
-            return handler(self.root, rule)
+            if compiled is not None:
+                issues = handler(self.root, rule, compiled)
+            else:
+                issues = handler(self.root, rule)
         except Exception as e:
             logger.error(f"Rule '{rule_name}' failed: {e}", exc_info=True)
             return [
@@ -78,10 +228,52 @@ class RuleEngine:
                     severity="error",
                     message=f"Rule execution failed: {e}",
                     location=rule_name,
-                    details={"error": str(e), "rule": rule}
+                    details={"error": str(e), "rule": rule},
+                    category="rule_error"
                 )
             ]
 
+        return self._categorise(issues, rule_type)
+
+    def _categorise(self, issues: List[ValidationIssue], rule_type: str) -> List[ValidationIssue]:
+        """Categorise issues by the type of rule that raised them.
+
+        Args:
+            issues: Issues from one rule
+            rule_type: Type of that rule
+
+        Returns:
+            The same issues
+        """
+        for issue in issues:
+            if issue.category is None:
+                issue.category = rule_type
+        return issues
+
+    def iter_all(self, rules: List[Dict[str, Any]]) -> Iterator[ValidationIssue]:
+        """Execute all rules, yielding their issues in rule order.
+
+        Not fully lazy: path_pattern and filename_regex rules share one
+        directory walk, and several must_exist rules one batch pass, and
+        both run to completion before the first issue is yielded. Other
+        rules run one at a time as the issues are consumed.
+
+        Args:
+            rules: List of rule dictionaries
+
+        Yields:
+            ValidationIssue objects from all rules, in rule order
+        """
+        compiled = compile_rules(rules)
+        checked = self.walk_tree_rules(rules, compiled)
+        checked.update(self.batch_rules(rules))
+
+        for rule in rules:
+            if id(rule) in checked:
+                yield from checked[id(rule)]
+            else:
+                yield from self.execute_rule(rule, compiled.get(id(rule)))
+
     def execute_all(self, rules: List[Dict[str, Any]]) -> List[ValidationIssue]:
         """Execute all rules and aggregate results.
 
@@ -91,10 +283,4 @@ class RuleEngine:
         Returns:
             List of all ValidationIssue objects from all rules
         """
-        all_issues: List[ValidationIssue] = []
-
-        for rule in rules:
-            issues = self.execute_rule(rule)
-            all_issues.extend(issues)
-
-        return all_issues
+        return list(self.iter_all(rules))
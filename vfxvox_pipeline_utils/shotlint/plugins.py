@@ -1,8 +1,9 @@
 """Plugin system for custom ShotLint validators."""
 
+import sys
 import importlib
 from pathlib import Path
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Any, Callable, Tuple
 
 from vfxvox_pipeline_utils.core.validators import ValidationIssue
 from vfxvox_pipeline_utils.core.logging import get_logger
@@ -16,10 +17,16 @@ class PluginLoader:
     Plugins can be specified as:
     - "module.path:function" - Load specific function from module
     - "module.path" - Load 'validate' function from module
+
+    Loaded plugins are cached by (module, function), so rules that run
+    the same plugin repeatedly only resolve it once. Call reload() to
+    pick up changes to plugin modules.
     """
 
-    @staticmethod
-    def load_plugin(module_spec: str) -> Callable:
+    _cache: Dict[Tuple[str, str], Callable] = {}
+
+    @classmethod
+    def load_plugin(cls, module_spec: str) -> Callable:
         """Load a plugin from module specification.
 
         Args:
@@ -35,19 +42,48 @@ class PluginLoader:
         if ":" in module_spec:
             # Format: module:function
             module_name, func_name = module_spec.split(":", 1)
-            module = importlib.import_module(module_name)
-            func = getattr(module, func_name)
         else:
             # Format: module (expects 'validate' function)
-            module = importlib.import_module(module_spec)
-            func = getattr(module, "validate")
+            module_name, func_name = module_spec, "validate"
+
+        key = (module_name, func_name)
+        func = cls._cache.get(key)
+        if func is not None:
+            return func
+
+        module = importlib.import_module(module_name)
+        func = getattr(module, func_name)
 
         if not callable(func):
             raise TypeError(f"Plugin {module_spec} is not callable")
 
+        cls._cache[key] = func
         logger.debug(f"Loaded plugin: {module_spec}")
         return func
 
+    @classmethod
+    def reload(cls) -> None:
+        """Drop cached plugins and re-import their modules.
+
+        The next load_plugin() call resolves each plugin again from the
+        reloaded module.
+        """
+        module_names = {module_name for module_name, _ in cls._cache}
+        cls._cache.clear()
+
+        for module_name in module_names:
+            module = sys.modules.get(module_name)
+            if module is None:
+                continue
+            try:
+                importlib.reload(module)
+            except ImportError as e:
+                # Leave it to the next load_plugin() to import and report
+                logger.warning(f"Could not reload plugin module '{module_name}': {e}")
+                sys.modules.pop(module_name, None)
+
+        logger.debug(f"Reloaded {len(module_names)} plugin modules")
+
     @staticmethod
     def execute_plugin(
         plugin: Callable,
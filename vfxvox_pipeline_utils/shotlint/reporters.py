@@ -1,8 +1,7 @@
 """Result reporters for ShotLint validation."""
 
-import json
-import yaml
-from typing import TextIO
+from typing import Iterator, Optional, TextIO
+from vfxvox_pipeline_utils.core._json import dump_json
 from vfxvox_pipeline_utils.core.validators import ValidationResult
 
 
@@ -40,55 +39,103 @@ def render_console(result: ValidationResult, stream: TextIO) -> None:
                 stream.write(f"      {key}: {value}\n")
 
 
-def render_json(result: ValidationResult) -> str:
+def render_json(
+    result: ValidationResult,
+    data: Optional[dict] = None,
+    stream: Optional[TextIO] = None
+) -> Optional[str]:
     """Render validation result as JSON.
 
     Args:
         result: ValidationResult to render
+        data: Optional output of ``result.to_dict()``, so callers rendering
+            several formats only convert the result once
+        stream: Optional text stream to write to instead of returning a
+            string, so large reports are never held in memory whole
 
     Returns:
-        JSON string
+        JSON string, or None when written to ``stream``
     """
-    return json.dumps(result.to_dict(), indent=2)
+    if data is None:
+        data = result.to_dict()
 
+    return dump_json(data, stream)
 
-def render_yaml(result: ValidationResult) -> str:
+
+def render_yaml(
+    result: ValidationResult,
+    data: Optional[dict] = None,
+    stream: Optional[TextIO] = None
+) -> Optional[str]:
     """Render validation result as YAML.
 
     Args:
         result: ValidationResult to render
+        data: Optional output of ``result.to_dict()``, so callers rendering
+            several formats only convert the result once
+        stream: Optional text stream to write to instead of returning a
+            string
 
     Returns:
-        YAML string
+        YAML string, or None when written to ``stream``
     """
-    return yaml.dump(result.to_dict(), default_flow_style=False, sort_keys=False)
+    # PyYAML is only loaded once a YAML report is actually requested
+    import yaml
+
+    if data is None:
+        data = result.to_dict()
+    return yaml.dump(data, stream, default_flow_style=False, sort_keys=False)
 
 
-def render_markdown(result: ValidationResult) -> str:
+def render_markdown(
+    result: ValidationResult,
+    stream: Optional[TextIO] = None
+) -> Optional[str]:
     """Render validation result as Markdown.
 
     Args:
         result: ValidationResult to render
+        stream: Optional text stream to write to instead of returning a
+            string
 
     Returns:
-        Markdown string
+        Markdown string, or None when written to ``stream``
+    """
+    lines = _iter_markdown_lines(result)
+    if stream is None:
+        return "\n".join(lines)
+
+    for index, line in enumerate(lines):
+        if index:
+            stream.write("\n")
+        stream.write(line)
+    return None
+
+
+def _iter_markdown_lines(result: ValidationResult) -> Iterator[str]:
+    """Yield the lines of the Markdown report.
+
+    Args:
+        result: ValidationResult to render
+
+    Yields:
+        Report lines without trailing newlines
     """
-    lines = []
     root = result.metadata.get("root", "<unknown>")
     rule_count = result.metadata.get("rule_count", 0)
 
     # Header
-    lines.append(f"# ShotLint Report for `{root}`")
-    lines.append("")
-    lines.append(f"- **Rules**: {rule_count}")
-    lines.append(f"- **Errors**: {result.error_count()}")
-    lines.append(f"- **Warnings**: {result.warning_count()}")
-    lines.append(f"- **Info**: {result.info_count()}")
-    lines.append("")
+    yield f"# ShotLint Report for `{root}`"
+    yield ""
+    yield f"- **Rules**: {rule_count}"
+    yield f"- **Errors**: {result.error_count()}"
+    yield f"- **Warnings**: {result.warning_count()}"
+    yield f"- **Info**: {result.info_count()}"
+    yield ""
 
     if not result.issues:
-        lines.append("✅ No issues found.")
-        return "\n".join(lines)
+        yield "✅ No issues found."
+        return
 
     # Group issues by severity
     errors = result.get_errors()
@@ -96,36 +143,34 @@ def render_markdown(result: ValidationResult) -> str:
     info = result.get_info()
 
     if errors:
-        lines.append("## Errors")
-        lines.append("")
+        yield "## Errors"
+        yield ""
         for issue in errors:
-            lines.append(f"- **{issue.message}**")
+            yield f"- **{issue.message}**"
             if issue.location:
-                lines.append(f"  - Location: `{issue.location}`")
+                yield f"  - Location: `{issue.location}`"
             if issue.details:
                 for key, value in issue.details.items():
-                    lines.append(f"  - {key}: `{value}`")
-        lines.append("")
+                    yield f"  - {key}: `{value}`"
+        yield ""
 
     if warnings:
-        lines.append("## Warnings")
-        lines.append("")
+        yield "## Warnings"
+        yield ""
         for issue in warnings:
-            lines.append(f"- **{issue.message}**")
+            yield f"- **{issue.message}**"
             if issue.location:
-                lines.append(f"  - Location: `{issue.location}`")
+                yield f"  - Location: `{issue.location}`"
             if issue.details:
                 for key, value in issue.details.items():
-                    lines.append(f"  - {key}: `{value}`")
-        lines.append("")
+                    yield f"  - {key}: `{value}`"
+        yield ""
 
     if info:
-        lines.append("## Info")
-        lines.append("")
+        yield "## Info"
+        yield ""
         for issue in info:
-            lines.append(f"- {issue.message}")
+            yield f"- {issue.message}"
             if issue.location:
-                lines.append(f"  - Location: `{issue.location}`")
-        lines.append("")
-
-    return "\n".join(lines)
+                yield f"  - Location: `{issue.location}`"
+        yield ""
@@ -1,15 +1,488 @@
 """Rule type implementations for ShotLint."""
 
+import os
 import re
-import glob as glob_module
+import fnmatch
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Sequence, Set, Tuple
 
+from vfxvox_pipeline_utils.core.frames import format_frame_ranges
 from vfxvox_pipeline_utils.core.validators import ValidationIssue
 from vfxvox_pipeline_utils.core.logging import get_logger
 
+# The regex parser, only used to work out how short a match can be. This
+# is a private stdlib API (re._parser, sre_parse before 3.11), so any
+# failure to use it just disables the length check
+try:
+    from re import _parser as _sre_parse  # type: ignore[attr-defined]
+except ImportError:
+    import sre_parse as _sre_parse
+
 logger = get_logger(__name__)
 
+_GLOB_MAGIC_RE = re.compile(r"[*?[]")
+# Match glob's case handling: case-insensitive where the filesystem is
+_GLOB_FLAGS = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
+# Upper bound on threads walking the tree; directory listings are I/O
+# bound, so a handful in flight is enough to keep the disk busy
+WALK_MAX_WORKERS = 8
+# Entries between checks for visitors finished by other walking threads
+_VISITOR_REFRESH_INTERVAL = 256
+
+
+@lru_cache(maxsize=512)
+def _compile_path_pattern(pattern: str, vars_items: Tuple[Tuple[str, str], ...]) -> "re.Pattern":
+    """Convert a path_pattern template into a compiled regex, once per template.
+
+    Args:
+        pattern: Pattern like "seq_{sequence}/shot_{shot}"
+        vars_items: Sorted (name, regex) variable definitions
+
+    Returns:
+        Compiled regex matching whole relative paths
+    """
+    # Escape the pattern for regex
+    rx = re.escape(pattern)
+
+    # Replace variables with their regex patterns
+    for key, val in vars_items:
+        placeholder = re.escape("{" + key + "}")
+        rx = rx.replace(placeholder, f"(?P<{key}>{val})")
+
+    return re.compile("^" + rx + "$")
+
+
+# Variable regexes built only from these pieces can never match a "/":
+# \d, \w, alphanumerics, "_", "-", classes of those (a range can't end
+# on "-", as "--0" spans "/"), quantifiers and groups
+_SLASH_FREE_VAR_RE = re.compile(
+    r"(?:\\[dw]|[A-Za-z0-9_-]|\[(?:\\[dw]|[A-Za-z0-9_]|-(?!-))+\]"
+    r"|\{\d+(?:,\d*)?\}|[+*?|)]|\((?:\?:)?)*"
+)
+
+
+@lru_cache(maxsize=512)
+def _path_pattern_depth(pattern: str, vars_items: Tuple[Tuple[str, str], ...]) -> Optional[int]:
+    """Get the number of "/" in every path a path_pattern can match.
+
+    Args:
+        pattern: Pattern like "seq_{sequence}/shot_{shot}"
+        vars_items: Sorted (name, regex) variable definitions
+
+    Returns:
+        Number of separators, or None if a variable used in the pattern
+        might match "/" itself, so paths of any depth could match
+    """
+    for key, val in vars_items:
+        if "{" + key + "}" in pattern and not _SLASH_FREE_VAR_RE.fullmatch(val):
+            return None
+    return pattern.count("/")
+
+
+@lru_cache(maxsize=512)
+def _compile_filename_regex(regex_str: str) -> "re.Pattern":
+    """Compile a filename_regex rule's regex, once per distinct regex.
+
+    Args:
+        regex_str: Regex from the rule
+
+    Returns:
+        Compiled regex
+
+    Raises:
+        re.error: If the regex is invalid
+    """
+    return re.compile(regex_str)
+
+
+@lru_cache(maxsize=512)
+def _regex_min_length(pattern: str, flags: int) -> int:
+    """Get the length of the shortest string a regex can match, once per regex.
+
+    Args:
+        pattern: Regex source
+        flags: Regex flags
+
+    Returns:
+        Minimum match length, or 0 if it can't be worked out
+    """
+    try:
+        return int(_sre_parse.parse(pattern, flags).getwidth()[0])
+    except (re.error, RecursionError, AttributeError, TypeError):
+        # Unparseable here, or the private parser API has changed
+        return 0
+
+
+@lru_cache(maxsize=256)
+def _frame_regex(base: str, ext: str, padding: int) -> "re.Pattern":
+    """Compile the filename regex for a frame_sequence rule, once per sequence.
+
+    Args:
+        base: Filename before the frame number, e.g. "shot_010_comp"
+        ext: Extension including the dot, e.g. ".exr"
+        padding: Minimum number of frame digits
+
+    Returns:
+        Regex for base.####.ext whose group 1 is the frame number
+    """
+    return re.compile(rf"{re.escape(base)}\.(\d{{{padding},}}){re.escape(ext)}")
+
+
+@lru_cache(maxsize=256)
+def _glob_to_regex_segments(
+    glob_str: str
+) -> Tuple[str, Tuple[Tuple[str, Optional["re.Pattern"]], ...]]:
+    """Split a glob into its anchor and per-segment matchers, once per glob.
+
+    Args:
+        glob_str: Glob like "seq_*/shot_*/comp"
+
+    Returns:
+        (anchor, segments) where anchor is the absolute prefix of the glob
+        ("" for relative globs) and each segment is (text, regex). The
+        regex is None for literal segments and for "**".
+    """
+    path = Path(glob_str)
+    parts = path.parts[1:] if path.anchor else path.parts
+
+    segments = tuple(
+        (
+            part,
+            re.compile(fnmatch.translate(part), _GLOB_FLAGS)
+            if part != "**" and _GLOB_MAGIC_RE.search(part) else None
+        )
+        for part in parts
+    )
+    return path.anchor, segments
+
+
+def _iter_glob(
+    base: str,
+    segments: Sequence[Tuple[str, Optional["re.Pattern"]]],
+    index: int = 0
+) -> Iterator[str]:
+    """Lazily yield paths under base matching the glob segments.
+
+    Walks one directory level per segment with ``os.scandir`` so only
+    directories that match the pattern so far are listed. Follows the
+    ``glob`` module's rules: hidden entries only match segments that
+    start with a dot, and ``**`` matches zero or more directories.
+
+    Args:
+        base: Directory to match segments against
+        segments: Segments from _glob_to_regex_segments()
+        index: Index of the segment to match next
+
+    Yields:
+        Matching paths
+    """
+    if index == len(segments):
+        yield base
+        return
+
+    segment, regex = segments[index]
+    last = index == len(segments) - 1
+
+    if segment == "**":
+        yield from _iter_glob(base, segments, index + 1)
+        try:
+            entries = list(os.scandir(base))
+        except OSError:
+            return
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.is_dir():
+                continue
+            # Stay on this segment to descend any number of levels
+            yield from _iter_glob(entry.path, segments, index)
+        return
+
+    if regex is None:
+        path = os.path.join(base, segment)
+        if os.path.lexists(path) if last else os.path.isdir(path):
+            yield from _iter_glob(path, segments, index + 1)
+        return
+
+    match_hidden = segment.startswith(".")
+    try:
+        entries = list(os.scandir(base))
+    except OSError:
+        return
+    for entry in entries:
+        name = entry.name
+        if name.startswith(".") and not match_hidden:
+            continue
+        if not regex.match(name):
+            continue
+        if not last and not entry.is_dir():
+            continue
+        yield from _iter_glob(entry.path, segments, index + 1)
+
+
+class TreeVisitor(ABC):
+    """Receives the entries of a directory walk shared between rules.
+
+    Rules that need to look at the whole tree provide a visitor, so any
+    number of them can be served by a single walk (see walk_tree()).
+
+    Attributes:
+        done: Set once the visitor needs no further entries
+    """
+
+    done = False
+
+    @abstractmethod
+    def visit(self, rel_path: str, entry: os.DirEntry) -> None:
+        """Look at one entry of the walk.
+
+        Args:
+            rel_path: POSIX path of the entry relative to the walk root
+            entry: Directory entry, carrying its file type
+        """
+        pass
+
+    @abstractmethod
+    def finalize(self) -> List[ValidationIssue]:
+        """Produce the rule's issues once the walk is over.
+
+        Returns:
+            List of ValidationIssue objects
+        """
+        pass
+
+
+def iter_tree(root: Path) -> Iterator[Tuple[str, os.DirEntry]]:
+    """Lazily yield every entry below a directory.
+
+    Entries are streamed from ``os.scandir`` as the walk goes, depth
+    first with an explicit stack, so memory stays bounded by the
+    directories still to visit rather than the size of the tree or of
+    its largest directory. Symlinked directories are yielded but not
+    entered, and unreadable directories are skipped.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        (rel_path, entry) with rel_path the entry's POSIX path relative
+        to root
+    """
+    return _iter_subtrees([("", str(root))])
+
+
+def _iter_subtrees(
+    stack: List[Tuple[str, str]],
+    subdirs: Optional[List[Tuple[str, str]]] = None
+) -> Iterator[Tuple[str, os.DirEntry]]:
+    """Lazily yield the entries below the directories on the stack.
+
+    Args:
+        stack: (relative path, path) of the directories to walk
+        subdirs: If given, subdirectories are collected here instead of
+            being descended into
+
+    Yields:
+        (rel_path, entry) for every entry
+    """
+    pending = stack if subdirs is None else subdirs
+
+    while stack:
+        rel_dir, dir_path = stack.pop()
+        try:
+            listing = os.scandir(dir_path)
+        except OSError:
+            continue
+
+        with listing:
+            for entry in listing:
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                yield rel_path, entry
+
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((rel_path, entry.path))
+
+
+def walk_tree(root: Path, visitors: List[TreeVisitor], max_workers: int = 1) -> None:
+    """Walk a directory tree once, feeding every entry to the visitors.
+
+    Uses ``os.scandir`` and the file type carried by its entries, so no
+    entry is stat-ed again, and streams entries as with iter_tree().
+    Symlinked directories are visited but not entered, as with
+    ``Path.rglob``. The walk stops early once every visitor is done.
+
+    With several workers, the top-level directories are walked on a
+    thread pool; ``os.scandir`` releases the GIL while listing, so the
+    listings overlap. Visitors may then be fed from several threads at
+    once and must only ever move ``done`` from False to True.
+
+    Args:
+        root: Directory to walk
+        visitors: Visitors to feed
+        max_workers: Number of walking threads; 1 walks serially and 0
+            picks a default from the CPU count
+    """
+    if max_workers <= 0:
+        max_workers = min(WALK_MAX_WORKERS, (os.cpu_count() or 1) * 2)
+
+    if max_workers == 1:
+        _feed_visitors(iter_tree(root), visitors)
+        return
+
+    # Visit the top level here, then hand each subdirectory to a worker
+    subdirs: List[Tuple[str, str]] = []
+    _feed_visitors(_iter_subtrees([("", str(root))], subdirs), visitors)
+    if len(subdirs) <= 1:
+        _feed_visitors(_iter_subtrees(subdirs), visitors)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(subdirs))) as executor:
+        for future in [
+            executor.submit(_feed_visitors, _iter_subtrees([subdir]), visitors)
+            for subdir in subdirs
+        ]:
+            future.result()
+
+
+def _feed_visitors(
+    entries: Iterator[Tuple[str, os.DirEntry]],
+    visitors: List[TreeVisitor]
+) -> None:
+    """Feed walked entries to the visitors until all of them are done.
+
+    Args:
+        entries: (rel_path, entry) pairs from _iter_subtrees()
+        visitors: Visitors to feed
+    """
+    active = [visitor for visitor in visitors if not visitor.done]
+    if not active:
+        return
+
+    for count, (rel_path, entry) in enumerate(entries, 1):
+        finished = False
+        for visitor in active:
+            visitor.visit(rel_path, entry)
+            finished = finished or visitor.done
+
+        # Other workers may finish visitors too, so look now and then
+        if finished or not count % _VISITOR_REFRESH_INTERVAL:
+            active = [visitor for visitor in active if not visitor.done]
+            if not active:
+                return
+
+
+class _PathPatternVisitor(TreeVisitor):
+    """Looks for a directory whose relative path matches a path_pattern rule."""
+
+    def __init__(
+        self,
+        root: Path,
+        regex: re.Pattern,
+        pattern: str,
+        vars_dict: Dict[str, str],
+        depth: Optional[int] = None
+    ):
+        """Initialize visitor.
+
+        Args:
+            root: Root directory being walked
+            regex: Compiled path pattern
+            pattern: Pattern as written in the rule
+            vars_dict: Variable definitions from the rule
+            depth: Number of "/" in any matching path, if fixed
+        """
+        self.root = root
+        self.regex = regex
+        self.pattern = pattern
+        self.vars_dict = vars_dict
+        self.depth = depth
+
+    def visit(self, rel_path: str, entry: os.DirEntry) -> None:
+        """Mark the rule satisfied if the entry is a matching directory.
+
+        Args:
+            rel_path: POSIX path of the entry relative to the walk root
+            entry: Directory entry, carrying its file type
+        """
+        # Paths at the wrong depth can't match, and counting separators is
+        # cheaper than running the regex
+        if self.depth is not None and rel_path.count("/") != self.depth:
+            return
+        # One C-level match of the whole relative path; fullmatch also
+        # rejects the trailing newline that "$" would let through
+        if self.regex.fullmatch(rel_path) and entry.is_dir():
+            self.done = True
+            logger.debug("Pattern matched: %s", rel_path)
+
+    def finalize(self) -> List[ValidationIssue]:
+        """Report the pattern if no directory matched it.
+
+        Returns:
+            List of ValidationIssue objects
+        """
+        if self.done:
+            return []
+        return [
+            ValidationIssue(
+                severity="warning",
+                message=f"No path matched pattern '{self.pattern}'",
+                location=str(self.root),
+                details={"pattern": self.pattern, "vars": self.vars_dict}
+            )
+        ]
+
+
+class _FilenameRegexVisitor(TreeVisitor):
+    """Looks for a file whose name matches a filename_regex rule."""
+
+    def __init__(self, root: Path, regex: re.Pattern, regex_str: str):
+        """Initialize visitor.
+
+        Args:
+            root: Root directory being walked
+            regex: Compiled filename regex
+            regex_str: Regex as written in the rule
+        """
+        self.root = root
+        self.regex = regex
+        self.regex_str = regex_str
+        self.min_length = _regex_min_length(regex.pattern, regex.flags)
+
+    def visit(self, rel_path: str, entry: os.DirEntry) -> None:
+        """Mark the rule satisfied if the entry is a file with a matching name.
+
+        Args:
+            rel_path: POSIX path of the entry relative to the walk root
+            entry: Directory entry, carrying its file type
+        """
+        # Names shorter than any possible match are rejected without
+        # calling into the regex engine. match() is kept rather than
+        # fullmatch() as rules may deliberately match a prefix
+        if len(entry.name) < self.min_length:
+            return
+        if self.regex.match(entry.name) and entry.is_file():
+            self.done = True
+            logger.debug("Filename matched: %s", entry.name)
+
+    def finalize(self) -> List[ValidationIssue]:
+        """Report the regex if no filename matched it.
+
+        Returns:
+            List of ValidationIssue objects
+        """
+        if self.done:
+            return []
+        return [
+            ValidationIssue(
+                severity="warning",
+                message="No filenames matched the regex",
+                location=str(self.root),
+                details={"regex": self.regex_str}
+            )
+        ]
+
 
 class PathPatternRule:
     """Validates folder structure against patterns.
@@ -29,55 +502,75 @@ class PathPatternRule:
         ```
     """
 
-    def check(self, root: Path, rule: Dict[str, Any]) -> List[ValidationIssue]:
+    def compile(self, rule: Dict[str, Any]) -> Optional[re.Pattern]:
+        """Build the regex for a rule ahead of checking it.
+
+        Args:
+            rule: Rule dictionary with 'pattern' and 'vars' keys
+
+        Returns:
+            Compiled regex, or None if the rule has no pattern
+        """
+        pattern = rule.get("pattern")
+        if not pattern:
+            return None
+        return self._render_pattern(pattern, rule.get("vars", {}))
+
+    def check(
+        self,
+        root: Path,
+        rule: Dict[str, Any],
+        compiled: Optional[re.Pattern] = None
+    ) -> List[ValidationIssue]:
         """Check if directories match the pattern.
 
         Args:
             root: Root directory to check
             rule: Rule dictionary with 'pattern' and 'vars' keys
+            compiled: Regex from compile(), built here if not given
 
         Returns:
             List of ValidationIssue objects
         """
-        pattern = rule.get("pattern")
-        vars_dict = rule.get("vars", {})
-        rule_name = rule.get("name", "path_pattern")
-
-        if not pattern:
+        # visitor() returns None exactly when the rule has no pattern
+        visitor = self.visitor(root, rule, compiled)
+        if visitor is None:
             return [
                 ValidationIssue(
                     severity="error",
                     message="path_pattern rule missing 'pattern' field",
-                    location=rule_name
+                    location=rule.get("name", "path_pattern")
                 )
             ]
 
-        # Convert pattern to regex
-        regex_pattern = self._render_pattern(pattern, vars_dict)
-
         # Walk directory tree looking for matches
-        found_match = False
-        for dirpath in root.rglob("*"):
-            if not dirpath.is_dir():
-                continue
+        walk_tree(root, [visitor])
+        return visitor.finalize()
 
-            rel_path = dirpath.relative_to(root).as_posix()
-            if regex_pattern.match(rel_path):
-                found_match = True
-                logger.debug(f"Pattern matched: {rel_path}")
-                break
+    def visitor(
+        self,
+        root: Path,
+        rule: Dict[str, Any],
+        compiled: Optional[re.Pattern] = None
+    ) -> Optional[TreeVisitor]:
+        """Create a visitor that checks the rule during a shared walk.
 
-        if not found_match:
-            return [
-                ValidationIssue(
-                    severity="warning",
-                    message=f"No path matched pattern '{pattern}'",
-                    location=str(root),
-                    details={"pattern": pattern, "vars": vars_dict}
-                )
-            ]
+        Args:
+            root: Root directory being walked
+            rule: Rule dictionary with 'pattern' and 'vars' keys
+            compiled: Regex from compile(), built here if not given
 
-        return []
+        Returns:
+            TreeVisitor, or None if the rule has no pattern
+        """
+        pattern = rule.get("pattern")
+        if not pattern:
+            return None
+
+        vars_dict = rule.get("vars", {})
+        regex = compiled or self._render_pattern(pattern, vars_dict)
+        depth = _path_pattern_depth(pattern, tuple(sorted(vars_dict.items())))
+        return _PathPatternVisitor(root, regex, pattern, vars_dict, depth)
 
     def _render_pattern(self, pattern: str, vars_dict: Dict[str, str]) -> re.Pattern:
         """Convert a template pattern into a regex.
@@ -89,15 +582,7 @@ class PathPatternRule:
         Returns:
             Compiled regex pattern
         """
-        # Escape the pattern for regex
-        rx = re.escape(pattern)
-
-        # Replace variables with their regex patterns
-        for key, val in vars_dict.items():
-            placeholder = re.escape("{" + key + "}")
-            rx = rx.replace(placeholder, f"(?P<{key}>{val})")
-
-        return re.compile("^" + rx + "$")
+        return _compile_path_pattern(pattern, tuple(sorted(vars_dict.items())))
 
 
 class FilenameRegexRule:
@@ -113,12 +598,36 @@ class FilenameRegexRule:
         ```
     """
 
-    def check(self, root: Path, rule: Dict[str, Any]) -> List[ValidationIssue]:
+    def compile(self, rule: Dict[str, Any]) -> Optional[re.Pattern]:
+        """Compile the regex for a rule ahead of checking it.
+
+        Args:
+            rule: Rule dictionary with 'regex' key
+
+        Returns:
+            Compiled regex, or None if the regex is missing or invalid
+            (check() reports those cases)
+        """
+        regex_str = rule.get("regex")
+        if not regex_str:
+            return None
+        try:
+            return _compile_filename_regex(regex_str)
+        except re.error:
+            return None
+
+    def check(
+        self,
+        root: Path,
+        rule: Dict[str, Any],
+        compiled: Optional[re.Pattern] = None
+    ) -> List[ValidationIssue]:
         """Check if filenames match the regex.
 
         Args:
             root: Root directory to check
             rule: Rule dictionary with 'regex' key
+            compiled: Regex from compile(), built here if not given
 
         Returns:
             List of ValidationIssue objects
@@ -136,7 +645,7 @@ class FilenameRegexRule:
             ]
 
         try:
-            regex = re.compile(regex_str)
+            regex = compiled or _compile_filename_regex(regex_str)
         except re.error as e:
             return [
                 ValidationIssue(
@@ -147,24 +656,35 @@ class FilenameRegexRule:
                 )
             ]
 
-        # Search for matching filenames
-        match_count = 0
-        for filepath in root.rglob("*"):
-            if filepath.is_file() and regex.match(filepath.name):
-                match_count += 1
-                logger.debug(f"Filename matched: {filepath.name}")
+        # Search for a matching filename
+        visitor = _FilenameRegexVisitor(root, regex, regex_str)
+        walk_tree(root, [visitor])
+        return visitor.finalize()
 
-        if match_count == 0:
-            return [
-                ValidationIssue(
-                    severity="warning",
-                    message="No filenames matched the regex",
-                    location=str(root),
-                    details={"regex": regex_str}
-                )
-            ]
+    def visitor(
+        self,
+        root: Path,
+        rule: Dict[str, Any],
+        compiled: Optional[re.Pattern] = None
+    ) -> Optional[TreeVisitor]:
+        """Create a visitor that checks the rule during a shared walk.
 
-        return []
+        Args:
+            root: Root directory being walked
+            rule: Rule dictionary with 'regex' key
+            compiled: Regex from compile(), built here if not given
+
+        Returns:
+            TreeVisitor, or None if the regex is missing or invalid
+            (check() reports those cases)
+        """
+        regex_str = rule.get("regex")
+        if not regex_str:
+            return None
+        regex = compiled or self.compile(rule)
+        if regex is None:
+            return None
+        return _FilenameRegexVisitor(root, regex, regex_str)
 
 
 class FrameSequenceRule:
@@ -185,12 +705,33 @@ class FrameSequenceRule:
         ```
     """
 
-    def check(self, root: Path, rule: Dict[str, Any]) -> List[ValidationIssue]:
+    def compile(self, rule: Dict[str, Any]) -> Optional[re.Pattern]:
+        """Compile the frame filename regex for a rule ahead of checking it.
+
+        Args:
+            rule: Rule dictionary with base, ext, padding
+
+        Returns:
+            Compiled regex, or None if the rule is missing its base (check()
+            reports that case)
+        """
+        base = rule.get("base")
+        if not base:
+            return None
+        return _frame_regex(base, rule.get("ext", ".exr"), rule.get("padding", 4))
+
+    def check(
+        self,
+        root: Path,
+        rule: Dict[str, Any],
+        compiled: Optional[re.Pattern] = None
+    ) -> List[ValidationIssue]:
         """Check for missing frames in a sequence.
 
         Args:
             root: Root directory
             rule: Rule dictionary with folder, base, ext, start, end, padding
+            compiled: Regex from compile(), built here if not given
 
         Returns:
             List of ValidationIssue objects
@@ -204,7 +745,7 @@ class FrameSequenceRule:
         padding = rule.get("padding", 4)
 
         # Validate required fields
-        if not all([folder_rel, base, start is not None, end is not None]):
+        if not folder_rel or not base or start is None or end is None:
             return [
                 ValidationIssue(
                     severity="error",
@@ -213,71 +754,172 @@ class FrameSequenceRule:
                 )
             ]
 
-        folder = root / folder_rel
+        folder = os.path.join(root, folder_rel)
 
-        # Check if folder exists
-        if not folder.exists():
+        # List the folder directly; the listing itself tells us whether it
+        # exists and is a directory, and its entries carry their file type
+        try:
+            entries = list(os.scandir(folder))
+        except FileNotFoundError:
             return [
                 ValidationIssue(
                     severity="error",
                     message=f"Folder missing: {folder_rel}",
-                    location=str(folder),
+                    location=folder,
                     details={"expected_folder": folder_rel}
                 )
             ]
-
-        if not folder.is_dir():
+        except NotADirectoryError:
             return [
                 ValidationIssue(
                     severity="error",
                     message=f"Path is not a directory: {folder_rel}",
-                    location=str(folder)
+                    location=folder
                 )
             ]
 
-        # Find present frames
-        present_frames = set()
-        for filepath in folder.iterdir():
-            if not filepath.is_file():
+        # Find present frames from the one listing
+        frame_regex = compiled or _frame_regex(base, ext, padding)
+        # Mark present frames in a bitmap over the expected range; frames
+        # outside it only count towards found_count
+        present = bytearray(max(end - start + 1, 0))
+        outside_frames = set()
+        for entry in entries:
+            match = frame_regex.fullmatch(entry.name)
+            if not match or not entry.is_file():
                 continue
+            frame = int(match.group(1))
+            if start <= frame <= end:
+                present[frame - start] = 1
+            else:
+                outside_frames.add(frame)
+        found_count = present.count(1) + len(outside_frames)
+
+        # Gaps are runs of zero bytes, found with C-level searches rather
+        # than by checking every expected frame in Python
+        missing_ranges: List[List[int]] = []
+        gap_start = present.find(0)
+        while gap_start != -1:
+            gap_end = present.find(1, gap_start)
+            if gap_end == -1:
+                gap_end = len(present)
+            missing_ranges.append([start + gap_start, start + gap_end - 1])
+            gap_start = present.find(0, gap_end)
 
-            filename = filepath.name
-            if filename.startswith(base) and filename.endswith(ext):
-                # Extract frame number
-                # Format: base.####.ext
-                frame_part = filename[len(base) + 1: -len(ext)]
-                if frame_part.isdigit():
-                    present_frames.add(int(frame_part))
-
-        # Check for missing frames
-        expected_frames = set(range(start, end + 1))
-        missing_frames = sorted(expected_frames - present_frames)
-
-        if missing_frames:
-            if len(missing_frames) > 10:
-                sample = missing_frames[:10]
-                message = f"{len(missing_frames)} frames missing. Sample: {sample}"
+        if missing_ranges:
+            # missing_frames is part of the report schema, shared with the
+            # sequence validator, so the gaps are expanded for it here
+            missing_frames = [
+                frame for first, last in missing_ranges for frame in range(first, last + 1)
+            ]
+            missing_count = len(missing_frames)
+
+            if len(missing_ranges) > 10:
+                sample = format_frame_ranges(missing_ranges[:10])
+                message = (
+                    f"{missing_count} frames missing in "
+                    f"{len(missing_ranges)} gaps. Sample: {sample}"
+                )
             else:
-                message = f"Missing frames: {missing_frames}"
+                message = f"Missing frames: {format_frame_ranges(missing_ranges)}"
 
             return [
                 ValidationIssue(
                     severity="error",
                     message=message,
-                    location=str(folder),
+                    location=folder,
                     details={
-                        "missing_count": len(missing_frames),
+                        "missing_count": missing_count,
                         "missing_frames": missing_frames,
+                        "missing_ranges": missing_ranges,
                         "expected_range": f"{start}-{end}",
-                        "found_count": len(present_frames)
+                        "found_count": found_count
                     }
                 )
             ]
 
-        logger.debug(f"All {len(expected_frames)} frames present in {folder_rel}")
+        logger.debug(f"All {end - start + 1} frames present in {folder_rel}")
         return []
 
 
+class _GlobTrieNode:
+    """One glob segment in a trie of globs sharing their leading segments.
+
+    Attributes:
+        segment: Segment text as written in the glob
+        regex: Compiled matcher, or None for a literal segment
+        children: Child nodes keyed by segment text
+        terminal: Keys of the globs ending at this segment
+        keys: Keys of all globs passing through this segment
+    """
+
+    def __init__(self, segment: str = "", regex: Optional["re.Pattern"] = None):
+        self.segment = segment
+        self.regex = regex
+        self.children: Dict[str, "_GlobTrieNode"] = {}
+        self.terminal: List[int] = []
+        self.keys: Set[int] = set()
+
+    def insert(self, key: int, segments: Sequence[Tuple[str, Optional["re.Pattern"]]]) -> None:
+        """Add a glob's segments under this node.
+
+        Args:
+            key: Key identifying the glob
+            segments: Segments from _glob_to_regex_segments()
+        """
+        node = self
+        for segment, regex in segments:
+            node = node.children.setdefault(segment, _GlobTrieNode(segment, regex))
+            node.keys.add(key)
+        node.terminal.append(key)
+
+
+def _match_glob_trie(base: str, node: _GlobTrieNode, matched: set) -> None:
+    """Mark which globs in a trie have a match under base.
+
+    Each directory is listed at most once for all globs passing through
+    it, and branches whose globs have all matched are skipped. Follows
+    the same rules as _iter_glob(), except that ``**`` isn't supported.
+
+    Args:
+        base: Directory matched by node
+        node: Trie node whose children are matched against base
+        matched: Keys of matched globs, updated in place
+    """
+    entries = None
+
+    for child in node.children.values():
+        if child.keys <= matched:
+            continue
+
+        if child.regex is None:
+            path = os.path.join(base, child.segment)
+            if child.terminal and os.path.lexists(path):
+                matched.update(child.terminal)
+            if child.children and not child.keys <= matched and os.path.isdir(path):
+                _match_glob_trie(path, child, matched)
+            continue
+
+        if entries is None:
+            try:
+                entries = list(os.scandir(base))
+            except OSError:
+                entries = []
+
+        match_hidden = child.segment.startswith(".")
+        for entry in entries:
+            if child.keys <= matched:
+                break
+            name = entry.name
+            if name.startswith(".") and not match_hidden:
+                continue
+            if not child.regex.match(name):
+                continue
+            matched.update(child.terminal)
+            if child.children and entry.is_dir():
+                _match_glob_trie(entry.path, child, matched)
+
+
 class MustExistRule:
     """Verifies required files/folders exist.
 
@@ -291,12 +933,36 @@ class MustExistRule:
         ```
     """
 
-    def check(self, root: Path, rule: Dict[str, Any]) -> List[ValidationIssue]:
+    def compile(
+        self,
+        rule: Dict[str, Any]
+    ) -> Optional[Tuple[str, Tuple[Tuple[str, Optional["re.Pattern"]], ...]]]:
+        """Split a rule's glob into segment matchers ahead of checking it.
+
+        Args:
+            rule: Rule dictionary with 'glob' key
+
+        Returns:
+            (anchor, segments) as from _glob_to_regex_segments(), or None if
+            the glob is missing (check() reports that case)
+        """
+        glob_pattern = rule.get("glob")
+        if not glob_pattern:
+            return None
+        return _glob_to_regex_segments(glob_pattern)
+
+    def check(
+        self,
+        root: Path,
+        rule: Dict[str, Any],
+        compiled: Optional[Tuple[str, Tuple[Tuple[str, Optional["re.Pattern"]], ...]]] = None
+    ) -> List[ValidationIssue]:
         """Check if files matching glob pattern exist.
 
         Args:
             root: Root directory
             rule: Rule dictionary with 'glob' key
+            compiled: Segments from compile(), built here if not given
 
         Returns:
             List of ValidationIssue objects
@@ -313,11 +979,12 @@ class MustExistRule:
                 )
             ]
 
-        # Use glob to find matches
-        pattern_path = str(root / glob_pattern)
-        matches = glob_module.glob(pattern_path, recursive=True)
+        # Walk the pattern a segment at a time and stop at the first hit
+        anchor, segments = compiled or _glob_to_regex_segments(glob_pattern)
+        base = anchor or os.fspath(root)
+        match = next(_iter_glob(base, segments), None)
 
-        if not matches:
+        if match is None:
             return [
                 ValidationIssue(
                     severity="error",
@@ -327,5 +994,61 @@ class MustExistRule:
                 )
             ]
 
-        logger.debug(f"Found {len(matches)} matches for glob: {glob_pattern}")
+        logger.debug("Found match for glob %s: %s", glob_pattern, match)
         return []
+
+    def check_batch(
+        self,
+        root: Path,
+        rules: List[Dict[str, Any]]
+    ) -> Dict[int, List[ValidationIssue]]:
+        """Check many must_exist rules together.
+
+        The globs are merged into a trie, so globs sharing leading
+        segments (``seq_*/shot_*/comp``, ``seq_*/shot_*/plate``) list each
+        directory once between them. Rules without a glob, or with a
+        ``**`` segment, are left out for check() to handle.
+
+        Args:
+            root: Root directory
+            rules: must_exist rule dictionaries
+
+        Returns:
+            Dictionary mapping id() of each checked rule to its issues
+        """
+        root_str = os.fspath(root)
+        tries: Dict[str, _GlobTrieNode] = {}
+        checked = {}
+
+        for rule in rules:
+            glob_pattern = rule.get("glob")
+            if not glob_pattern:
+                continue
+            anchor, segments = _glob_to_regex_segments(glob_pattern)
+            if not segments or any(part == "**" for part, _ in segments):
+                continue
+            base = anchor or root_str
+            tries.setdefault(base, _GlobTrieNode()).insert(id(rule), segments)
+            checked[id(rule)] = rule
+
+        matched: Set[int] = set()
+        for base, node in tries.items():
+            _match_glob_trie(base, node, matched)
+
+        results: Dict[int, List[ValidationIssue]] = {}
+        for key, rule in checked.items():
+            if key in matched:
+                results[key] = []
+                continue
+            glob_pattern = rule["glob"]
+            results[key] = [
+                ValidationIssue(
+                    severity="error",
+                    message=f"No matches for glob: {glob_pattern}",
+                    location=root_str,
+                    details={"glob": glob_pattern}
+                )
+            ]
+
+        logger.debug(f"Checked {len(checked)} globs in one pass, {len(matched)} matched")
+        return results
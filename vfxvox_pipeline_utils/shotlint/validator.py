@@ -1,16 +1,185 @@
 """ShotLint validator for directory structure validation."""
 
+import copy
+import marshal
+import os
+import sys
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+from vfxvox_pipeline_utils.core._yaml import YamlLoader
 from vfxvox_pipeline_utils.core.validators import BaseValidator, ValidationResult, ValidationIssue
 from vfxvox_pipeline_utils.core.exceptions import FileNotFoundError, ConfigurationError
+from vfxvox_pipeline_utils.core.config import Config
 from vfxvox_pipeline_utils.core.logging import get_logger
+from .engine import RuleEngine, compile_rules
 
 logger = get_logger(__name__)
 
 
+# Bumped whenever the layout of .yamlc rules caches changes
+RULES_CACHE_VERSION = 1
+
+
+@lru_cache(maxsize=32)
+def _load_rules_cached(
+    path_str: str,
+    mtime_ns: int,
+    size: int,
+    use_disk_cache: bool = False
+) -> List[Dict[str, Any]]:
+    """Load a rules file, once per version of the file.
+
+    Args:
+        path_str: Path to YAML rules file
+        mtime_ns: Modification time of the file, part of the cache key
+        size: Size of the file, part of the cache key
+        use_disk_cache: Whether to reuse and refresh the parsed rules
+            stored next to the file (see _read_rules_cache())
+
+    Returns:
+        List of rule dictionaries; callers must not modify it
+
+    Raises:
+        ConfigurationError: If YAML is invalid or missing 'rules' key
+    """
+    cache_path = os.path.splitext(path_str)[0] + ".yamlc"
+    rules = _read_rules_cache(cache_path, mtime_ns, size) if use_disk_cache else None
+
+    if rules is None:
+        rules = _parse_rules_file(path_str)
+        if use_disk_cache:
+            _write_rules_cache(cache_path, mtime_ns, size, rules)
+
+    # Build every rule's regexes and glob matchers now; they are cached by
+    # pattern, so validating against these rules only looks them up
+    compile_rules(rules)
+
+    logger.debug(f"Loaded {len(rules)} rules from {path_str}")
+    return rules
+
+
+def _parse_rules_file(path_str: str) -> List[Dict[str, Any]]:
+    """Parse the rules list out of a YAML rules file.
+
+    Args:
+        path_str: Path to YAML rules file
+
+    Returns:
+        List of rule dictionaries
+
+    Raises:
+        ConfigurationError: If YAML is invalid or missing 'rules' key
+    """
+    try:
+        # Read as bytes: libyaml decodes UTF-8 itself, in C
+        with open(path_str, "rb") as f:
+            config = yaml.load(f, Loader=YamlLoader)
+    except yaml.YAMLError as e:
+        raise ConfigurationError(
+            f"Invalid YAML in rules file: {e}",
+            config_key=path_str
+        )
+
+    if not isinstance(config, dict):
+        raise ConfigurationError(
+            "Rules file must contain a dictionary",
+            config_key=path_str
+        )
+
+    rules = config.get("rules", [])
+
+    if not isinstance(rules, list):
+        raise ConfigurationError(
+            "'rules' must be a list",
+            config_key=path_str
+        )
+
+    return rules
+
+
+def _rules_cache_key(mtime_ns: int, size: int) -> tuple:
+    """Identify the rules file version and interpreter a cache was written for.
+
+    Args:
+        mtime_ns: Modification time of the rules file
+        size: Size of the rules file
+
+    Returns:
+        Key stored with, and compared against, the cached rules
+    """
+    return (RULES_CACHE_VERSION, tuple(sys.version_info[:2]), mtime_ns, size)
+
+
+def _read_rules_cache(cache_path: str, mtime_ns: int, size: int) -> Optional[List[Dict[str, Any]]]:
+    """Read parsed rules stored next to the rules file, if still current.
+
+    The cache is written with ``marshal``, which handles the plain data
+    YAML produces far faster than a YAML parse. Like ``pickle``, marshal
+    is not safe against malformed or malicious data, so a cache is only
+    as trustworthy as the directory holding the rules file.
+
+    Args:
+        cache_path: Path to the .yamlc cache
+        mtime_ns: Modification time of the rules file
+        size: Size of the rules file
+
+    Returns:
+        List of rule dictionaries, or None if there is no usable cache
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            key, rules = marshal.load(f)
+    except OSError:
+        # No cache yet, or it can't be read
+        return None
+    except (EOFError, ValueError, TypeError) as e:
+        logger.debug(f"Ignoring corrupt rules cache {cache_path}: {e}")
+        return None
+
+    if key != _rules_cache_key(mtime_ns, size) or not isinstance(rules, list):
+        logger.debug(f"Ignoring stale rules cache {cache_path}")
+        return None
+
+    logger.debug(f"Loaded rules from cache {cache_path}")
+    return rules
+
+
+def _write_rules_cache(
+    cache_path: str,
+    mtime_ns: int,
+    size: int,
+    rules: List[Dict[str, Any]]
+) -> None:
+    """Store parsed rules next to the rules file for later runs.
+
+    Failing to write the cache (read-only directory, values marshal can't
+    store such as YAML timestamps) only costs the speed-up.
+
+    Args:
+        cache_path: Path to the .yamlc cache
+        mtime_ns: Modification time of the rules file
+        size: Size of the rules file
+        rules: Parsed rules to store
+    """
+    # Write then rename, so concurrent runs never read a partial cache
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        data = marshal.dumps((_rules_cache_key(mtime_ns, size), rules))
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Could not write rules cache {cache_path}: {e}")
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            # Never created, or can't be removed either
+            pass
+
+
 class ShotLintValidator(BaseValidator):
     """Validates directory structures using rule-based configuration.
 
@@ -25,9 +194,16 @@ class ShotLintValidator(BaseValidator):
         ...     print(f"Found {result.error_count()} errors")
     """
 
-    def __init__(self):
-        """Initialize ShotLint validator."""
+    def __init__(self, config: Optional[Config] = None):
+        """Initialize ShotLint validator.
+
+        Args:
+            config: Optional configuration object
+        """
+        self.config = config or Config()
         self.rules: List[Dict[str, Any]] = []
+        self._walk_workers = self.config.get("shotlint.walk_workers", 1)
+        self._rules_cache = self.config.get("shotlint.rules_cache", False)
 
     def validate(self, root: Path, rules_path: Path) -> ValidationResult:
         """Validate a directory structure against rules.
@@ -48,17 +224,7 @@ class ShotLintValidator(BaseValidator):
         rules_path = Path(rules_path) if not isinstance(rules_path, Path) else rules_path
 
         # Validate inputs
-        if not root.exists():
-            raise FileNotFoundError(
-                f"Root directory not found: {root}",
-                path=root
-            )
-
-        if not root.is_dir():
-            raise FileNotFoundError(
-                f"Root path is not a directory: {root}",
-                path=root
-            )
+        self._check_root(root)
 
         if not rules_path.exists():
             raise FileNotFoundError(
@@ -68,20 +234,89 @@ class ShotLintValidator(BaseValidator):
 
         # Load rules
         try:
-            self.rules = self.load_rules(rules_path)
+            rules = self.load_rules(rules_path)
         except Exception as e:
             raise ConfigurationError(
                 f"Failed to load rules: {e}",
                 config_key=str(rules_path)
             )
 
+        return self._run_rules(root, rules, str(rules_path))
+
+    def validate_parsed(
+        self,
+        root: Path,
+        rules: List[Dict[str, Any]],
+        rules_source: Optional[str] = None
+    ) -> ValidationResult:
+        """Validate a directory structure against already-loaded rules.
+
+        Use this when checking many directories against the same rules file,
+        so the YAML only has to be parsed once (see :meth:`load_rules`).
+
+        Args:
+            root: Root directory to validate (as Path or string)
+            rules: List of rule dictionaries
+            rules_source: Optional description of where the rules came from,
+                recorded as ``rules_file`` in the result metadata
+
+        Returns:
+            ValidationResult with issues found
+
+        Raises:
+            FileNotFoundError: If root directory doesn't exist
+        """
+        root = Path(root) if not isinstance(root, Path) else root
+        self._check_root(root)
+
+        return self._run_rules(root, rules, rules_source)
+
+    def _check_root(self, root: Path) -> None:
+        """Ensure the root path exists and is a directory.
+
+        Args:
+            root: Root directory to validate
+
+        Raises:
+            FileNotFoundError: If root directory doesn't exist
+        """
+        if not root.exists():
+            raise FileNotFoundError(
+                f"Root directory not found: {root}",
+                path=root
+            )
+
+        if not root.is_dir():
+            raise FileNotFoundError(
+                f"Root path is not a directory: {root}",
+                path=root
+            )
+
+    def _run_rules(
+        self,
+        root: Path,
+        rules: List[Dict[str, Any]],
+        rules_source: Optional[str]
+    ) -> ValidationResult:
+        """Execute rules against a root directory.
+
+        Args:
+            root: Root directory to validate
+            rules: List of rule dictionaries
+            rules_source: Where the rules came from, for metadata
+
+        Returns:
+            ValidationResult with issues found
+        """
+        self.rules = rules
+
         # Create result
         result = ValidationResult(
             passed=True,
             metadata={
                 "validator": "ShotLintValidator",
                 "root": str(root),
-                "rules_file": str(rules_path),
+                "rules_file": rules_source,
                 "rule_count": len(self.rules),
             }
         )
@@ -89,9 +324,16 @@ class ShotLintValidator(BaseValidator):
         # Execute rules
         logger.info(f"Validating {root} with {len(self.rules)} rules")
 
+        engine = RuleEngine(root, walk_workers=self._walk_workers)
+        compiled = compile_rules(self.rules)
+        checked = engine.walk_tree_rules(self.rules, compiled)
+        checked.update(engine.batch_rules(self.rules))
+
         for rule in self.rules:
             try:
-                self._execute_rule(root, rule, result)
+                self._execute_rule(
+                    engine, rule, result, compiled.get(id(rule)), checked.get(id(rule))
+                )
             except Exception as e:
                 logger.error(f"Rule '{rule.get('name', '<unknown>')}' crashed: {e}")
                 result.add_issue(
@@ -101,9 +343,10 @@ class ShotLintValidator(BaseValidator):
                     details={"rule": rule}
                 )
 
+        counts = result.count_by_severity()
         logger.info(
-            f"Validation complete: {result.error_count()} errors, "
-            f"{result.warning_count()} warnings"
+            f"Validation complete: {counts['error']} errors, "
+            f"{counts['warning']} warnings"
         )
 
         return result
@@ -111,6 +354,14 @@ class ShotLintValidator(BaseValidator):
     def load_rules(self, rules_path: Path) -> List[Dict[str, Any]]:
         """Load validation rules from YAML file.
 
+        Parsed rules are cached by path, modification time and size, so
+        validating many directories against an unchanged rules file only
+        parses it once. Each call returns its own copy of the rules.
+
+        With the ``shotlint.rules_cache`` option, the parsed rules are also
+        stored in a ``.yamlc`` file next to the rules file, so later runs
+        skip the YAML parse too.
+
         Args:
             rules_path: Path to YAML rules file
 
@@ -120,47 +371,29 @@ class ShotLintValidator(BaseValidator):
         Raises:
             ConfigurationError: If YAML is invalid or missing 'rules' key
         """
-        try:
-            with open(rules_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise ConfigurationError(
-                f"Invalid YAML in rules file: {e}",
-                config_key=str(rules_path)
-            )
-
-        if not isinstance(config, dict):
-            raise ConfigurationError(
-                "Rules file must contain a dictionary",
-                config_key=str(rules_path)
-            )
-
-        rules = config.get("rules", [])
-
-        if not isinstance(rules, list):
-            raise ConfigurationError(
-                "'rules' must be a list",
-                config_key=str(rules_path)
-            )
-
-        logger.debug(f"Loaded {len(rules)} rules from {rules_path}")
-        return rules
+        st = os.stat(rules_path)
+        rules = _load_rules_cached(
+            str(rules_path), st.st_mtime_ns, st.st_size, self._rules_cache
+        )
+        return copy.deepcopy(rules)
 
     def _execute_rule(
         self,
-        root: Path,
+        engine: RuleEngine,
         rule: Dict[str, Any],
-        result: ValidationResult
+        result: ValidationResult,
+        compiled: Optional[Any] = None,
+        issues: Optional[List[ValidationIssue]] = None
     ) -> None:
         """Execute a single validation rule.
 
         Args:
-            root: Root directory being validated
+            engine: RuleEngine for the root directory being validated
             rule: Rule dictionary
             result: ValidationResult to add issues to
+            compiled: Precompiled matcher for the rule
+            issues: Issues already found for the rule by a shared walk or batch check
         """
-        from .engine import RuleEngine
-
         rule_name = rule.get("name", "<unknown>")
         rule_type = rule.get("type")
 
@@ -173,10 +406,10 @@ class ShotLintValidator(BaseValidator):
             )
             return
 
-        logger.debug(f"Executing rule '{rule_name}' (type: {rule_type})")
+        logger.debug("Executing rule '%s' (type: %s)", rule_name, rule_type)
 
-        engine = RuleEngine(root)
-        issues = engine.execute_rule(rule)
+        if issues is None:
+            issues = engine.execute_rule(rule, compiled)
 
         for issue in issues:
             result.issues.append(issue)
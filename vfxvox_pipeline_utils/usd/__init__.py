@@ -1,10 +1,12 @@
 """USD linting module."""
 
-from .linter import USDLinter
+from .linter import USDLinter, USD_EXTENSIONS, iter_usd_files
 from .reporters import render_console, render_json, render_yaml, render_markdown
 
 __all__ = [
     "USDLinter",
+    "USD_EXTENSIONS",
+    "iter_usd_files",
     "render_console",
     "render_json",
     "render_yaml",
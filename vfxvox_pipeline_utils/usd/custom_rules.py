@@ -5,6 +5,7 @@ import yaml
 from pathlib import Path
 from typing import List, Dict, Any
 
+from vfxvox_pipeline_utils.core._yaml import YamlLoader
 from vfxvox_pipeline_utils.core.validators import ValidationIssue
 from vfxvox_pipeline_utils.core.logging import get_logger
 from vfxvox_pipeline_utils.core.exceptions import ConfigurationError
@@ -47,8 +48,9 @@ class CustomRuleLoader:
 
         # Load configuration
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f)
+            # Read as bytes: libyaml decodes UTF-8 itself, in C
+            with open(self.config_path, 'rb') as f:
+                self.config = yaml.load(f, Loader=YamlLoader)
         except yaml.YAMLError as e:
             raise ConfigurationError(
                 f"Invalid YAML in custom rules: {e}",
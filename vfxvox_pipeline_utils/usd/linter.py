@@ -1,12 +1,15 @@
 """USD linter for validating Universal Scene Description files."""
 
+import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Iterable, Iterator, List, Optional
 
 from vfxvox_pipeline_utils.core.validators import BaseValidator, ValidationResult, ValidationIssue
 from vfxvox_pipeline_utils.core.config import Config
 from vfxvox_pipeline_utils.core.exceptions import FileNotFoundError, InvalidFormatError
 from vfxvox_pipeline_utils.core.logging import get_logger
+from .rules import get_builtin_rules
+from .custom_rules import CustomRuleLoader
 
 logger = get_logger(__name__)
 
@@ -18,6 +21,42 @@ except ImportError:
     USD_AVAILABLE = False
     logger.warning("USD Python bindings not available. Install with: pip install usd-core")
 
+# File extensions recognised as USD files
+USD_EXTENSIONS = frozenset({'.usd', '.usda', '.usdc', '.usdz'})
+
+
+def iter_usd_files(
+    root: Path,
+    extensions: Iterable[str] = USD_EXTENSIONS
+) -> Iterator[Path]:
+    """Recursively yield USD files under a directory.
+
+    Walks the tree once with ``os.scandir`` and filters on suffix, instead
+    of one ``rglob`` pass per extension. Symlinked directories are not
+    followed. Files are yielded in no particular order.
+
+    Args:
+        root: Directory to search
+        extensions: Lower-case suffixes to match, including the dot
+
+    Yields:
+        Paths of matching files
+    """
+    suffixes = tuple(extensions)
+    stack = [os.fspath(root)]
+
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(suffixes):
+                        yield Path(entry.path)
+        except OSError as e:
+            logger.warning(f"Cannot scan directory {directory}: {e}")
+
 
 class USDLinter(BaseValidator):
     """Lints USD files for issues and best practices.
@@ -46,12 +85,21 @@ class USDLinter(BaseValidator):
         """
         self.config = config or Config()
         self.rules: List = []
-
-    def validate(self, file_path: Path) -> ValidationResult:
+        self._custom_rules: List = []
+        self._custom_rules_error: Optional[str] = None
+        self._rules_loaded = False
+
+    def validate(
+        self,
+        file_path: Path,
+        rule_filter: Optional[Callable[[str], bool]] = None
+    ) -> ValidationResult:
         """Lint a USD file and return results.
 
         Args:
             file_path: Path to USD file (.usd, .usda, .usdc, .usdz)
+            rule_filter: Optional predicate on rule names; only rules for
+                which it returns True are run
 
         Returns:
             ValidationResult with issues found
@@ -81,12 +129,11 @@ class USDLinter(BaseValidator):
             )
 
         # Validate file format
-        valid_extensions = {'.usd', '.usda', '.usdc', '.usdz'}
-        if file_path.suffix.lower() not in valid_extensions:
+        if file_path.suffix.lower() not in USD_EXTENSIONS:
             raise InvalidFormatError(
                 f"Not a USD file: {file_path}",
                 format=file_path.suffix,
-                supported_formats=list(valid_extensions)
+                supported_formats=sorted(USD_EXTENSIONS)
             )
 
         # Create result
@@ -118,13 +165,14 @@ class USDLinter(BaseValidator):
             })
 
             # Apply linting rules
-            issues = self.apply_rules(stage)
+            issues = self.apply_rules(stage, rule_filter=rule_filter)
             for issue in issues:
                 result.issues.append(issue)
 
+            counts = result.count_by_severity()
             logger.info(
-                f"Linting complete: {result.error_count()} errors, "
-                f"{result.warning_count()} warnings"
+                f"Linting complete: {counts['error']} errors, "
+                f"{counts['warning']} warnings"
             )
 
         except Exception as e:
@@ -157,27 +205,58 @@ class USDLinter(BaseValidator):
             logger.error(f"Error loading USD stage: {e}", exc_info=True)
             return None
 
-    def apply_rules(self, stage: 'Usd.Stage') -> List[ValidationIssue]:
+    def load_rules(self) -> None:
+        """Build built-in and custom rules once for this linter.
+
+        Rules (and any regex patterns they compile) are reused for every
+        file linted by this instance, so the custom rules YAML is parsed
+        only once.
+        """
+        if self._rules_loaded:
+            return
+
+        self.rules = get_builtin_rules(self.config)
+
+        custom_rules_path = self.config.get("usd.custom_rules_path")
+        if custom_rules_path:
+            try:
+                loader = CustomRuleLoader(Path(custom_rules_path))
+                self._custom_rules = loader.load_rules()
+            except Exception as e:
+                logger.error(f"Failed to load custom rules: {e}")
+                self._custom_rules_error = str(e)
+
+        self._rules_loaded = True
+
+    def apply_rules(
+        self,
+        stage: 'Usd.Stage',
+        rule_filter: Optional[Callable[[str], bool]] = None
+    ) -> List[ValidationIssue]:
         """Apply all linting rules to the stage.
 
         Args:
             stage: USD Stage to lint
+            rule_filter: Optional predicate on rule names; rules for which
+                it returns False are skipped without being run
 
         Returns:
             List of ValidationIssue objects
         """
-        from .rules import get_builtin_rules
+        self.load_rules()
 
         issues: List[ValidationIssue] = []
 
-        # Get built-in rules
-        rules = get_builtin_rules(self.config)
-
         # Apply each rule
-        for rule in rules:
+        for rule in self.rules:
+            if rule_filter is not None and not rule_filter(rule.name):
+                continue
             try:
-                logger.debug(f"Applying rule: {rule.name}")
+                logger.debug("Applying rule: %s", rule.name)
                 rule_issues = rule.check(stage)
+                for issue in rule_issues:
+                    if issue.category is None:
+                        issue.category = rule.name
                 issues.extend(rule_issues)
             except Exception as e:
                 logger.error(f"Rule '{rule.name}' failed: {e}", exc_info=True)
@@ -190,37 +269,35 @@ class USDLinter(BaseValidator):
                     )
                 )
 
-        # Load and apply custom rules if configured
-        custom_rules_path = self.config.get("usd.custom_rules_path")
-        if custom_rules_path:
+        # Apply custom rules if configured
+        for rule in self._custom_rules:
+            if rule_filter is not None and not rule_filter(rule.name):
+                continue
             try:
-                from .custom_rules import CustomRuleLoader
-                loader = CustomRuleLoader(Path(custom_rules_path))
-                custom_rules = loader.load_rules()
-
-                for rule in custom_rules:
-                    try:
-                        logger.debug(f"Applying custom rule: {rule.name}")
-                        rule_issues = rule.check(stage)
-                        issues.extend(rule_issues)
-                    except Exception as e:
-                        logger.error(f"Custom rule '{rule.name}' failed: {e}")
-                        issues.append(
-                            ValidationIssue(
-                                severity="error",
-                                message=f"Custom rule execution failed: {e}",
-                                location=rule.name,
-                                details={"error": str(e)}
-                            )
-                        )
+                logger.debug("Applying custom rule: %s", rule.name)
+                rule_issues = rule.check(stage)
+                for issue in rule_issues:
+                    if issue.category is None:
+                        issue.category = rule.name
+                issues.extend(rule_issues)
             except Exception as e:
-                logger.error(f"Failed to load custom rules: {e}")
+                logger.error(f"Custom rule '{rule.name}' failed: {e}")
                 issues.append(
                     ValidationIssue(
-                        severity="warning",
-                        message=f"Failed to load custom rules: {e}",
-                        location=str(custom_rules_path)
+                        severity="error",
+                        message=f"Custom rule execution failed: {e}",
+                        location=rule.name,
+                        details={"error": str(e)}
                     )
                 )
 
+        if self._custom_rules_error is not None:
+            issues.append(
+                ValidationIssue(
+                    severity="warning",
+                    message=f"Failed to load custom rules: {self._custom_rules_error}",
+                    location=str(self.config.get("usd.custom_rules_path"))
+                )
+            )
+
         return issues
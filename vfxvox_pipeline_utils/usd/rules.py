@@ -137,7 +137,7 @@ class BrokenReferencesRule(LintRule):
 
             return False
         except Exception as e:
-            logger.debug(f"Error checking reference {asset_path}: {e}")
+            logger.debug("Error checking reference %s: %s", asset_path, e)
             return False
 
 
@@ -306,7 +306,7 @@ class PerformanceRule(LintRule):
                     depth = self._get_layer_depth(sublayer, visited)
                     max_depth = max(max_depth, depth)
             except Exception as e:
-                logger.debug(f"Error checking sublayer depth: {e}")
+                logger.debug("Error checking sublayer depth: %s", e)
 
         return max_depth + 1
 